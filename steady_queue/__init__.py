@@ -9,14 +9,40 @@ process_heartbeat_interval: timedelta = timedelta(minutes=1)
 
 process_alive_threshold: timedelta = timedelta(minutes=5)
 
+supervisor_heartbeats: bool = False
+
+claim_lease_duration: Optional[timedelta] = None
+
 shutdown_timeout: timedelta = timedelta(seconds=5)
 
 preserve_finished_jobs: bool = True
 
 clear_finished_jobs_after: timedelta = timedelta(days=1)
 
+job_partition_period: str = "day"
+
+job_partitions_ahead: int = 3
+
+detach_expired_job_partitions: bool = False
+
+export_finished_jobs_to: Optional[str] = None
+
+finished_jobs_export_format: str = "jsonl"
+
+finished_jobs_export_compression: str = "gzip"
+
+compress_arguments_over: Optional[int] = None
+
+arguments_compression: str = "zlib"
+
+offload_arguments_over: Optional[int] = None
+
+offloaded_arguments_storage: Optional[str] = None
+
 default_concurrency_control_period: timedelta = timedelta(minutes=3)
 
 supervisor_pidfile: Optional[str] = None
 
+preload_app: bool = True
+
 database: str = "default"
@@ -4,10 +4,13 @@ from django.contrib import admin
 from django.contrib.humanize.templatetags.humanize import naturaltime
 from django.db.models import Count
 
+from .bulk_operations import BulkOperation
 from .models import (
+    ArchivedJob,
     BlockedExecution,
     ClaimedExecution,
     FailedExecution,
+    FailedExecutionGroup,
     Job,
     Process,
     Queue,
@@ -40,15 +43,26 @@ class JobAdmin(ReadOnlyAdminMixin, BaseAdmin):
 
     fields = (
         ("class_name", "status"),
-        ("queue_name", "priority"),
-        ("created_at", "scheduled_at", "finished_at"),
+        ("queue_name", "priority", "attempts"),
+        ("created_at", "scheduled_at", "finished_at", "cancelled_at"),
         ("django_task_id", "concurrency_key"),
         ("arguments",),
     )
+    actions = ("cancel",)
+
+    @admin.action(description="Cancel")
+    def cancel(self, request, queryset):
+        count = queryset.cancel()
+        self.message_user(request, f"Cancelled {count} tasks")
 
 
 class ExecutionAdmin(ReadOnlyAdminMixin, BaseAdmin):
-    pass
+    list_select_related = ("job",)
+
+    def get_queryset(self, request):
+        return (
+            super().get_queryset(request).select_related("job").defer("job__arguments")
+        )
 
 
 @admin.register(FailedExecution)
@@ -67,6 +81,57 @@ class FailedExecutionAdmin(ExecutionAdmin):
         self.message_user(request, f"Discarded {count} failed executions")
 
 
+@admin.register(FailedExecutionGroup)
+class FailedExecutionGroupAdmin(ExecutionAdmin):
+    date_hierarchy = None
+    list_display = ("job__class_name", "error", "failure_count", "last_failed_at")
+    # failure_count is an annotation, which ordering can't refer to, so
+    # groups are ordered by get_queryset instead.
+    ordering = ()
+    search_fields = ("job__class_name", "error")
+    actions = ("retry", "discard")
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).grouped().order_by("-failure_count")
+
+    @admin.display(description="Failures", ordering="failure_count")
+    def failure_count(self, obj: FailedExecutionGroup) -> int:
+        return obj.failure_count
+
+    @admin.display(description="Last failed", ordering="last_failed_at")
+    def last_failed_at(self, obj: FailedExecutionGroup) -> str:
+        return naturaltime(obj.last_failed_at)
+
+    @admin.action(description="Retry all in group")
+    def retry(self, request, queryset):
+        count = FailedExecution.objects.in_groups_of(queryset).retry()
+        self.message_user(request, f"Retried {count} failed executions")
+
+    @admin.action(description="Discard all in group")
+    def discard(self, request, queryset):
+        count = FailedExecution.objects.in_groups_of(queryset).discard_in_batches()
+        self.message_user(request, f"Discarded {count} failed executions")
+
+
+@admin.register(ArchivedJob)
+class ArchivedJobAdmin(ReadOnlyAdminMixin, BaseAdmin):
+    list_display = ("job_id", "class_name", "queue_name", "error", "failed_at")
+    date_hierarchy = "failed_at"
+    ordering = ("-failed_at",)
+    search_fields = ("job_id", "class_name", "error")
+    actions = ("restore", "discard")
+
+    @admin.action(description="Restore and retry")
+    def restore(self, request, queryset):
+        count = BulkOperation(queryset).restore()
+        self.message_user(request, f"Restored {count} archived tasks")
+
+    @admin.action(description="Discard")
+    def discard(self, request, queryset):
+        count = BulkOperation(queryset).discard()
+        self.message_user(request, f"Discarded {count} archived tasks")
+
+
 @admin.register(ScheduledExecution)
 class ScheduledExecutionAdmin(ExecutionAdmin):
     list_display = ("job__class_name", "queue_name", "priority", "scheduled_at")
@@ -75,6 +140,7 @@ class ScheduledExecutionAdmin(ExecutionAdmin):
 @admin.register(ClaimedExecution)
 class ClaimedExecutionAdmin(ExecutionAdmin):
     list_display = ("job__class_name", "job__queue_name", "process", "running_since")
+    list_select_related = ("job", "process")
 
     @admin.display(description="Running since")
     def running_since(self, obj: ClaimedExecution) -> str:
@@ -1,8 +1,33 @@
+import base64
+import hashlib
+import json
+import zlib
 from datetime import date, datetime, time, timedelta
-from typing import Any
+from typing import Any, Optional
 
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, Storage, storages
 from django.db import models
 
+import steady_queue
+
+try:
+    from compression import zstd
+except ImportError:  # Python < 3.14
+    zstd = None
+
+CODECS = ("zlib", "zstd")
+
+DEFAULT_OFFLOAD_LOCATION = "steady_queue_arguments"
+
+
+def arguments_storage() -> Storage:
+    """The storage that offloaded arguments are written to and read from."""
+    if steady_queue.offloaded_arguments_storage is not None:
+        return storages[steady_queue.offloaded_arguments_storage]
+
+    return FileSystemStorage(location=DEFAULT_OFFLOAD_LOCATION)
+
 
 class DeserializationError(ValueError):
     pass
@@ -19,21 +44,164 @@ class Arguments:
     DATE_KEY = "__sq_date__"
     TIME_KEY = "__sq_time__"
     TIMEDELTA_KEY = "__sq_timedelta__"
+    COMPRESSED_KEY = "__sq_compressed__"
+    OFFLOADED_KEY = "__sq_offloaded__"
 
     @classmethod
     def serialize_args_and_kwargs(cls, args, kwargs) -> dict[str, Any]:
-        return {
-            "args": cls.serialize(args) if args else [],
-            "kwargs": cls.serialize([kwargs]) if kwargs else {},
-        }
+        return cls.compress(
+            {
+                "args": cls.serialize(args) if args else [],
+                "kwargs": cls.serialize([kwargs]) if kwargs else {},
+            }
+        )
 
     @classmethod
     def deserialize_args_and_kwargs(cls, data: dict[str, Any]) -> tuple[list, dict]:
+        data = cls.decompress(cls.resolve(data))
         return (
             cls.deserialize(data["args"]) if data["args"] else [],
             cls.deserialize(data["kwargs"])[0] if data["kwargs"] else {},
         )
 
+    @classmethod
+    def compress(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Replace serialized arguments larger than
+        `steady_queue.compress_arguments_over` bytes with their compressed,
+        base64-encoded JSON under `COMPRESSED_KEY`.
+        """
+        threshold = steady_queue.compress_arguments_over
+        if threshold is None:
+            return data
+
+        encoded = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        if len(encoded) <= threshold:
+            return data
+
+        codec = steady_queue.arguments_compression
+        if codec == "zlib":
+            compressed = zlib.compress(encoded)
+        elif codec == "zstd" and zstd is not None:
+            compressed = zstd.compress(encoded)
+        elif codec == "zstd":
+            raise SerializationError("zstd compression requires Python 3.14 or later")
+        else:
+            raise SerializationError(
+                f'Invalid arguments compression "{codec}". '
+                f"Expected one of: {', '.join(CODECS)}"
+            )
+
+        return {
+            cls.COMPRESSED_KEY: {
+                "codec": codec,
+                "data": base64.b64encode(compressed).decode("ascii"),
+            }
+        }
+
+    @classmethod
+    def decompress(cls, data: dict[str, Any]) -> dict[str, Any]:
+        if cls.COMPRESSED_KEY not in data:
+            return data
+
+        codec = data[cls.COMPRESSED_KEY]["codec"]
+        try:
+            compressed = base64.b64decode(data[cls.COMPRESSED_KEY]["data"])
+            if codec == "zlib":
+                encoded = zlib.decompress(compressed)
+            elif codec == "zstd" and zstd is not None:
+                encoded = zstd.decompress(compressed)
+            else:
+                raise ValueError(f'unsupported codec "{codec}"')
+            return json.loads(encoded)
+        except Exception as e:
+            raise DeserializationError(f"Error decompressing arguments: {e}") from e
+
+    @classmethod
+    def offload(cls, data: Any) -> tuple[Any, Optional[bytes]]:
+        """
+        Replace serialized arguments larger than
+        `steady_queue.offload_arguments_over` bytes with a reference under
+        `OFFLOADED_KEY`, named after their SHA-256. Returns the data to store
+        and, if it was offloaded, the encoded arguments to write to storage.
+
+        Nothing is written here: the caller stores the file once it holds a
+        reference to it, see `OffloadedArguments`.
+        """
+        threshold = steady_queue.offload_arguments_over
+        if threshold is None or cls.offloaded_digest(data) is not None:
+            return data, None
+
+        encoded = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        if len(encoded) <= threshold:
+            return data, None
+
+        digest = hashlib.sha256(encoded).hexdigest()
+        reference = {
+            "name": cls.offloaded_file_name(digest),
+            "sha256": digest,
+            "size": len(encoded),
+        }
+        return {cls.OFFLOADED_KEY: reference}, encoded
+
+    @classmethod
+    def store(cls, digest: str, encoded: bytes):
+        """
+        Write offloaded arguments to the arguments storage, unless an intact
+        copy is already there.
+        """
+        name = cls.offloaded_file_name(digest)
+        try:
+            storage = arguments_storage()
+            if storage.exists(name):
+                with storage.open(name, "rb") as f:
+                    if hashlib.sha256(f.read()).hexdigest() == digest:
+                        return
+                storage.delete(name)
+
+            saved = storage.save(name, ContentFile(encoded))
+            if saved != name:
+                raise ValueError(f"storage saved them as {saved}")
+        except Exception as e:
+            raise SerializationError(f"Error offloading arguments: {e}") from e
+
+    @classmethod
+    def resolve(cls, data: dict[str, Any]) -> dict[str, Any]:
+        if cls.OFFLOADED_KEY not in data:
+            return data
+
+        reference = data[cls.OFFLOADED_KEY]
+        try:
+            with arguments_storage().open(reference["name"], "rb") as f:
+                encoded = f.read()
+            if hashlib.sha256(encoded).hexdigest() != reference["sha256"]:
+                raise ValueError("checksum mismatch")
+            return json.loads(encoded)
+        except Exception as e:
+            raise DeserializationError(
+                f"Error loading offloaded arguments {reference['name']}: {e}"
+            ) from e
+
+    @classmethod
+    def offloaded_name(cls, data: Any) -> Optional[str]:
+        """The storage name of offloaded arguments, if `data` refers to any."""
+        if isinstance(data, dict) and cls.OFFLOADED_KEY in data:
+            return data[cls.OFFLOADED_KEY]["name"]
+
+        return None
+
+    @classmethod
+    def offloaded_digest(cls, data: Any) -> Optional[str]:
+        """The SHA-256 of offloaded arguments, if `data` refers to any."""
+        if isinstance(data, dict) and cls.OFFLOADED_KEY in data:
+            return data[cls.OFFLOADED_KEY]["sha256"]
+
+        return None
+
+    @classmethod
+    def offloaded_file_name(cls, digest: str) -> str:
+        return f"{digest[:2]}/{digest}.json"
+
     @classmethod
     def serialize(cls, arguments):
         return [cls.serialize_argument(arg) for arg in arguments]
@@ -0,0 +1,84 @@
+import asyncio
+import weakref
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from asgiref.sync import sync_to_async
+from django.tasks import TaskResult
+
+from steady_queue.task import SteadyQueueTask
+
+if TYPE_CHECKING:
+    from steady_queue.backend import SteadyQueueBackend
+    from steady_queue.models import Job
+
+
+class PendingEnqueue(NamedTuple):
+    task: SteadyQueueTask
+    job: "Job"
+    args: list
+    kwargs: dict[str, Any]
+
+
+class EnqueueBatcher:
+    """
+    Coalesce aenqueue() calls made from the same event loop into bulk inserts.
+
+    The first call schedules a flush on the loop, and every call made before
+    that flush runs joins the same batch. While a batch is being inserted, new
+    calls accumulate for the next one, so the number of thread hops and
+    INSERT statements stays flat as concurrency grows.
+    """
+
+    # One batcher per event loop and backend alias.
+    batchers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def for_running_loop(cls, backend: "SteadyQueueBackend") -> "EnqueueBatcher":
+        loop = asyncio.get_running_loop()
+        by_alias = cls.batchers.setdefault(loop, {})
+        if backend.alias not in by_alias:
+            by_alias[backend.alias] = cls(backend)
+
+        return by_alias[backend.alias]
+
+    def __init__(self, backend: "SteadyQueueBackend"):
+        self.backend = backend
+        self.pending: list[tuple[PendingEnqueue, asyncio.Future]] = []
+        self.is_flushing = False
+
+    async def enqueue(self, entry: PendingEnqueue) -> TaskResult:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((entry, future))
+
+        if not self.is_flushing:
+            self.is_flushing = True
+            loop.create_task(self.flush())
+
+        return await future
+
+    async def flush(self):
+        try:
+            # Yield once so that callers scheduled in this loop iteration can
+            # join the batch.
+            await asyncio.sleep(0)
+
+            while self.pending:
+                batch, self.pending = self.pending, []
+                await self.insert(batch)
+        finally:
+            self.is_flushing = False
+
+    async def insert(self, batch: list[tuple[PendingEnqueue, asyncio.Future]]):
+        try:
+            results = await sync_to_async(
+                self.backend.enqueue_pending, thread_sensitive=True
+            )([entry for entry, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
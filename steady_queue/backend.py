@@ -1,10 +1,12 @@
-from typing import Any
+from typing import Any, Iterable, Optional
 
+from asgiref.sync import sync_to_async
 from django.tasks import TaskResult, TaskResultStatus
 from django.tasks.backends.base import BaseTaskBackend
 from django.tasks.signals import task_enqueued
 
 from steady_queue.arguments import Arguments
+from steady_queue.async_enqueue import EnqueueBatcher, PendingEnqueue
 from steady_queue.task import SteadyQueueTask
 
 
@@ -13,25 +15,99 @@ class SteadyQueueBackend(BaseTaskBackend):
 
     supports_defer = True
 
-    supports_async_task = False
+    supports_priority = True
+
+    supports_async_task = True
 
     supports_get_result = False
 
     def enqueue(self, task, args: list, kwargs: dict[str, Any]) -> TaskResult:
         from steady_queue.models import Job
 
-        if not isinstance(task, SteadyQueueTask):
-            raise ValueError("Steady Queue only supports SteadyQueueTasks")
+        self.validate_steady_queue_task(task)
 
         job = Job.objects.enqueue(task, args, kwargs)
         task_result = self.to_task_result(task, job, args, kwargs)
         task_enqueued.send(sender=self, task_result=task_result)
         return task_result
 
+    def enqueue_all(
+        self, tasks: Iterable[tuple[SteadyQueueTask, list, dict[str, Any]]]
+    ) -> list[TaskResult]:
+        """Enqueue many (task, args, kwargs) triples with a single insert."""
+        return self.enqueue_pending(
+            [self.pending_enqueue(task, args, kwargs) for task, args, kwargs in tasks]
+        )
+
+    async def aenqueue(self, task, args: list, kwargs: dict[str, Any]) -> TaskResult:
+        # Jobs are built here, in the caller's context, so that the locale and
+        # timezone are captured correctly. Only the insert is batched.
+        entry = self.pending_enqueue(task, args, kwargs)
+        return await EnqueueBatcher.for_running_loop(self).enqueue(entry)
+
+    async def aenqueue_all(
+        self, tasks: Iterable[tuple[SteadyQueueTask, list, dict[str, Any]]]
+    ) -> list[TaskResult]:
+        entries = [
+            self.pending_enqueue(task, args, kwargs) for task, args, kwargs in tasks
+        ]
+        return await sync_to_async(self.enqueue_pending, thread_sensitive=True)(entries)
+
+    def pending_enqueue(
+        self, task, args: list, kwargs: dict[str, Any]
+    ) -> PendingEnqueue:
+        from steady_queue.models import Job
+
+        self.validate_steady_queue_task(task)
+
+        return PendingEnqueue(
+            task=task,
+            job=Job.from_django_task(task, args, kwargs),
+            args=args,
+            kwargs=kwargs,
+        )
+
+    def enqueue_pending(self, entries: list[PendingEnqueue]) -> list[TaskResult]:
+        from steady_queue.models import Job
+
+        jobs = Job.objects.enqueue_all([entry.job for entry in entries])
+
+        task_results = []
+        for entry, job in zip(entries, jobs):
+            # Freshly inserted jobs can't be claimed, finished or failed yet.
+            task_result = self.to_task_result(
+                entry.task,
+                job,
+                entry.args,
+                entry.kwargs,
+                status=TaskResultStatus.READY,
+            )
+            task_enqueued.send(sender=self, task_result=task_result)
+            task_results.append(task_result)
+
+        return task_results
+
+    def cancel(self, result_id: str) -> bool:
+        """
+        Cancel the task with the given result id. Returns whether there was an
+        unfinished task to cancel.
+        """
+        return self.cancel_all([result_id]) > 0
+
+    def cancel_all(self, result_ids: Iterable[str]) -> int:
+        """Cancel many tasks at once, returning how many were cancelled."""
+        from steady_queue.models import Job
+
+        return Job.objects.identified_by(list(result_ids)).cancel()
+
+    def validate_steady_queue_task(self, task):
+        if not isinstance(task, SteadyQueueTask):
+            raise ValueError("Steady Queue only supports SteadyQueueTasks")
+
     def execute(self, task, job):
         job_data = job.arguments
         args, kwargs = Arguments.deserialize_args_and_kwargs(job_data["arguments"])
-        task.func(*args, **kwargs)
+        task.call(*args, **kwargs)
 
     def get_result(self, result_id: str) -> TaskResult:
         raise NotImplementedError(
@@ -39,16 +115,15 @@ class SteadyQueueBackend(BaseTaskBackend):
         )
 
     def to_task_result(
-        self, task: SteadyQueueTask, job, args: list, kwargs: dict[str, Any]
+        self,
+        task: SteadyQueueTask,
+        job,
+        args: list,
+        kwargs: dict[str, Any],
+        status: Optional[TaskResultStatus] = None,
     ) -> TaskResult:
-        if job.status == "finished":
-            status = TaskResultStatus.SUCCESSFUL
-        elif job.status == "failed":
-            status = TaskResultStatus.FAILED
-        elif job.status == "claimed":
-            status = TaskResultStatus.RUNNING
-        else:
-            status = TaskResultStatus.READY
+        if status is None:
+            status = self.task_result_status(job)
 
         return TaskResult(
             task=task,
@@ -64,3 +139,14 @@ class SteadyQueueBackend(BaseTaskBackend):
             errors=[],
             worker_ids=[],
         )
+
+    def task_result_status(self, job) -> TaskResultStatus:
+        job_status = job.status
+        if job_status == "finished":
+            return TaskResultStatus.SUCCESSFUL
+        elif job_status in ("failed", "cancelled"):
+            return TaskResultStatus.FAILED
+        elif job_status == "claimed":
+            return TaskResultStatus.RUNNING
+        else:
+            return TaskResultStatus.READY
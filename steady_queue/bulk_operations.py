@@ -0,0 +1,249 @@
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, Optional
+
+from django.db import models, transaction
+
+from steady_queue.models import (
+    ArchivedJob,
+    BlockedExecution,
+    FailedExecution,
+    Job,
+    ReadyExecution,
+    ScheduledExecution,
+)
+
+logger = logging.getLogger("steady_queue")
+
+
+@dataclass
+class Progress:
+    chunks: int = 0
+    processed: int = 0
+    affected: int = 0
+    started_at: float = 0
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def __str__(self):
+        return (
+            f"{self.affected} of {self.processed} jobs in {self.chunks} chunks "
+            f"({self.elapsed:.1f}s)"
+        )
+
+
+class BulkOperation:
+    """
+    Retry, discard, reschedule, move, archive or restore the jobs of a
+    queryset of executions (or archived jobs) without loading them all at once
+    or holding a long transaction.
+
+    Executions are walked in chunks of ``batch_size`` ordered by job id, and
+    each chunk is locked and changed in its own short transaction, optionally
+    sleeping ``throttle`` between chunks. Since the walk resumes after the
+    last job id seen, rows changed or deleted by earlier chunks don't shift
+    later ones. ``on_progress`` is called after every chunk.
+    """
+
+    EXECUTION_CLASSES = {
+        "failed": FailedExecution,
+        "scheduled": ScheduledExecution,
+        "ready": ReadyExecution,
+        "blocked": BlockedExecution,
+        "archived": ArchivedJob,
+    }
+
+    def __init__(
+        self,
+        executions: models.QuerySet,
+        batch_size: int = 500,
+        throttle: Optional[timedelta] = None,
+        on_progress: Optional[Callable[[Progress], None]] = None,
+    ):
+        self.executions = executions
+        self.batch_size = batch_size
+        self.throttle = throttle or timedelta(0)
+        self.on_progress = on_progress
+
+    @classmethod
+    def matching(
+        cls,
+        status: str = "failed",
+        class_name: Optional[str] = None,
+        queue_name: Optional[str] = None,
+        error: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        **options,
+    ) -> "BulkOperation":
+        """
+        Build an operation on the executions with the given status (failed,
+        scheduled, ready or blocked), or on archived jobs, whose job matches
+        the given class name and queue. ``error`` is a regular expression
+        matched against the error of failed jobs, ``fingerprint`` selects a
+        group of failed jobs, and ``since``/``until`` bound when executions
+        were created, e.g. when jobs failed.
+        """
+        if status not in cls.EXECUTION_CLASSES:
+            raise ValueError(
+                f'Invalid status "{status}". '
+                f"Expected one of: {', '.join(cls.EXECUTION_CLASSES)}"
+            )
+
+        archived = status == "archived"
+        job = "" if archived else "job__"
+        created_at = "failed_at" if archived else "created_at"
+
+        executions = cls.EXECUTION_CLASSES[status].objects.all()
+        if class_name is not None:
+            executions = executions.filter(**{f"{job}class_name": class_name})
+        if queue_name is not None:
+            executions = executions.filter(**{f"{job}queue_name": queue_name})
+        if error is not None:
+            if status not in ("failed", "archived"):
+                raise ValueError("Only failed jobs can be filtered by error")
+            executions = executions.filter(error__regex=error)
+        if fingerprint is not None:
+            if status not in ("failed", "archived"):
+                raise ValueError("Only failed jobs can be filtered by fingerprint")
+            executions = executions.filter(fingerprint=fingerprint)
+        if since is not None:
+            executions = executions.filter(**{f"{created_at}__gte": since})
+        if until is not None:
+            executions = executions.filter(**{f"{created_at}__lt": until})
+
+        return cls(executions, **options)
+
+    @property
+    def model(self) -> type[models.Model]:
+        return self.executions.model
+
+    def retry(self) -> int:
+        if self.model is not FailedExecution:
+            raise ValueError("Only failed executions can be retried")
+
+        def retry_chunk(job_ids: list[int]) -> int:
+            Job.objects.filter(id__in=job_ids).update(attempts=0)
+            return FailedExecution.dispatch_jobs(job_ids)
+
+        return self.run(retry_chunk)
+
+    def discard(self) -> int:
+        if self.model is ArchivedJob:
+            return self.run(
+                lambda job_ids: ArchivedJob.objects.filter(job_id__in=job_ids).delete()[
+                    0
+                ]
+            )
+
+        def discard_chunk(job_ids: list[int]) -> int:
+            _, deleted_by_type = Job.objects.filter(id__in=job_ids).delete()
+            return deleted_by_type.get("steady_queue.Job", 0)
+
+        return self.run(discard_chunk)
+
+    def reschedule(self, scheduled_at: datetime) -> int:
+        if self.model not in (FailedExecution, ScheduledExecution):
+            raise ValueError("Only failed and scheduled executions can be rescheduled")
+
+        def reschedule_chunk(job_ids: list[int]) -> int:
+            jobs = Job.objects.filter(id__in=job_ids)
+            jobs.update(scheduled_at=scheduled_at)
+            self.model.objects.filter(job_id__in=job_ids).delete()
+            ScheduledExecution.objects.create_all_from_jobs(list(jobs))
+            return len(job_ids)
+
+        return self.run(reschedule_chunk)
+
+    def move(self, queue_name: str) -> int:
+        if self.model is ArchivedJob:
+            raise ValueError("Archived jobs can't be moved")
+
+        def move_chunk(job_ids: list[int]) -> int:
+            if self.model is not FailedExecution:
+                self.model.objects.filter(job_id__in=job_ids).update(
+                    queue_name=queue_name
+                )
+            return Job.objects.filter(id__in=job_ids).update(queue_name=queue_name)
+
+        return self.run(move_chunk)
+
+    def archive(self) -> int:
+        """Move failed jobs and their errors to the archived jobs table."""
+        if self.model is not FailedExecution:
+            raise ValueError("Only failed executions can be archived")
+
+        def archive_chunk(job_ids: list[int]) -> int:
+            executions = FailedExecution.objects.filter(
+                job_id__in=job_ids
+            ).select_related("job")
+            ArchivedJob.objects.bulk_create(
+                [ArchivedJob.from_failed_execution(e) for e in executions]
+            )
+            Job.objects.filter(id__in=job_ids).delete()
+            return len(job_ids)
+
+        return self.run(archive_chunk)
+
+    def restore(self) -> int:
+        """Enqueue archived jobs again as new jobs, removing them from the archive."""
+        if self.model is not ArchivedJob:
+            raise ValueError("Only archived jobs can be restored")
+
+        def restore_chunk(job_ids: list[int]) -> int:
+            archived = ArchivedJob.objects.filter(job_id__in=job_ids)
+            jobs = Job.objects.enqueue_all([a.to_job() for a in archived])
+            archived.delete()
+            return len(jobs)
+
+        return self.run(restore_chunk)
+
+    def run(self, operation: Callable[[list[int]], int]) -> int:
+        progress = Progress(started_at=time.monotonic())
+
+        for job_ids in self.chunks():
+            with transaction.atomic(using=self.executions.db):
+                # Executions may have changed since the chunk was read, so only
+                # those that still match are locked and operated on.
+                locked = list(
+                    self.executions.filter(job_id__in=job_ids)
+                    .select_for_update()
+                    .values_list("job_id", flat=True)
+                )
+                affected = operation(locked) if locked else 0
+
+            progress.chunks += 1
+            progress.processed += len(job_ids)
+            progress.affected += affected
+            logger.debug("bulk operation progress: %s", progress)
+            if self.on_progress is not None:
+                self.on_progress(progress)
+
+            if self.throttle:
+                time.sleep(self.throttle.total_seconds())
+
+        return progress.affected
+
+    def chunks(self) -> Iterator[list[int]]:
+        last_job_id = None
+        while True:
+            executions = self.executions.order_by("job_id")
+            if last_job_id is not None:
+                executions = executions.filter(job_id__gt=last_job_id)
+
+            job_ids = list(
+                executions.values_list("job_id", flat=True)[: self.batch_size]
+            )
+            if not job_ids:
+                return
+
+            yield job_ids
+            last_job_id = job_ids[-1]
+
+            if len(job_ids) < self.batch_size:
+                return
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from threading import Lock
+from typing import Iterable
+
+from django.tasks import TaskContext
+
+
+class JobCancelledError(Exception):
+    def __init__(self, job_id: int):
+        self.job_id = job_id
+        super().__init__(f"job {job_id} was cancelled")
+
+
+class CancelledJobs:
+    """
+    The in-flight jobs of this process that have been cancelled. Workers
+    refresh it from the database once per heartbeat interval, so checking it
+    from a running task doesn't need a query.
+    """
+
+    job_ids: frozenset[int] = frozenset()
+    mutex = Lock()
+
+    @classmethod
+    def replace(cls, job_ids: Iterable[int]):
+        with cls.mutex:
+            cls.job_ids = frozenset(job_ids)
+
+    @classmethod
+    def include(cls, job_id: int) -> bool:
+        return job_id in cls.job_ids
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SteadyQueueTaskContext(TaskContext):
+    """
+    Passed as the first argument to tasks defined with ``takes_context=True``.
+    Long-running tasks can check ``is_cancelled`` (or call
+    ``raise_if_cancelled``) between units of work to stop early when their job
+    is cancelled.
+    """
+
+    job_id: int
+
+    @property
+    def is_cancelled(self) -> bool:
+        return CancelledJobs.include(self.job_id)
+
+    def raise_if_cancelled(self):
+        if self.is_cancelled:
+            raise JobCancelledError(self.job_id)
@@ -12,12 +12,49 @@ from steady_queue.processes.base import Base
 
 
 class Configuration:
+    @dataclass
+    class ProcessPool:
+        tasks: list[str]
+        processes: int = 2
+        max_tasks_per_child: Optional[int] = None
+
+    @dataclass
+    class InterpreterPool:
+        tasks: list[str]
+        interpreters: int = 2
+
     @dataclass
     class Worker:
         queues: list[str] = field(default_factory=lambda: ["*"])
         threads: int = 3
+        min_threads: Optional[int] = None
+        max_threads: Optional[int] = None
         processes: int = 1
         polling_interval: timedelta = timedelta(seconds=0.1)
+        pool: str = "threads"
+        async_concurrency: int = 100
+        process_pool: Optional["Configuration.ProcessPool"] = None
+        interpreter_pool: Optional["Configuration.InterpreterPool"] = None
+        max_jobs: Optional[int] = None
+        max_rss_mb: Optional[int] = None
+        max_age: Optional[timedelta] = None
+        min_processes: Optional[int] = None
+        max_processes: Optional[int] = None
+        target_latency: timedelta = timedelta(seconds=5)
+        scale_up_cooldown: timedelta = timedelta(seconds=30)
+        scale_down_cooldown: timedelta = timedelta(minutes=5)
+        timeouts: dict[str, timedelta] = field(default_factory=dict)
+
+        @property
+        def is_autoscaled(self) -> bool:
+            return self.max_processes is not None
+
+        @property
+        def initial_processes(self) -> int:
+            if not self.is_autoscaled:
+                return self.processes
+
+            return min(max(self.processes, self.min_processes or 1), self.max_processes)
 
     @dataclass
     class Dispatcher:
@@ -25,6 +62,9 @@ class Configuration:
         batch_size: int = 500
         concurrency_maintenance: bool = True
         concurrency_maintenance_interval: timedelta = timedelta(minutes=5)
+        clear_finished_jobs: bool = False
+        clear_finished_jobs_interval: timedelta = timedelta(minutes=1)
+        clear_finished_jobs_budget: timedelta = timedelta(seconds=15)
 
     @dataclass
     class RecurringTask:
@@ -120,6 +160,8 @@ class Configuration:
 
             raise ValueError(f"Invalid process kind: {self.kind}")
 
+    WORKER_POOLS = ("threads", "asyncio")
+
     options: Options
     errors: list[ValidationError]
 
@@ -139,13 +181,33 @@ class Configuration:
 
         return self.workers + self.dispatchers + self.schedulers
 
+    @property
+    def task_paths(self) -> list[str]:
+        """Module paths of the tasks we know these processes will run."""
+        paths = []
+        for worker in self.options.workers:
+            if worker.process_pool is not None:
+                paths += worker.process_pool.tasks
+
+            if worker.interpreter_pool is not None:
+                paths += worker.interpreter_pool.tasks
+
+        if not self.skip_recurring:
+            paths += [
+                task.class_name
+                for task in self.options.recurring_tasks
+                if task.class_name is not None
+            ]
+
+        return list(dict.fromkeys(paths))
+
     @property
     def workers(self) -> list["Configuration.Process"]:
         workers = []
         for worker_config in self.options.workers:
             workers += [
                 self.Process(kind="worker", attributes=worker_config)
-            ] * worker_config.processes
+            ] * worker_config.initial_processes
 
         return workers
 
@@ -169,6 +231,9 @@ class Configuration:
     def is_valid(self):
         self.errors = []
         self.errors.extend(self.validate_configured_processes())
+        self.errors.extend(self.validate_worker_pools())
+        self.errors.extend(self.validate_worker_limits())
+        self.errors.extend(self.validate_dispatchers())
         self.errors.extend(self.validate_database_pool_size())
         self.errors.extend(self.validate_recurring_tasks())
 
@@ -180,6 +245,117 @@ class Configuration:
 
         return []
 
+    def validate_worker_pools(self) -> list[ValidationError]:
+        errors = []
+        for worker in self.options.workers:
+            if worker.pool not in self.WORKER_POOLS:
+                errors.append(
+                    ValidationError(
+                        f'Invalid worker pool "{worker.pool}". '
+                        f"Expected one of: {', '.join(self.WORKER_POOLS)}"
+                    )
+                )
+
+            if worker.process_pool is not None:
+                if worker.pool != "threads":
+                    errors.append(
+                        ValidationError(
+                            'A process pool can only be used with pool="threads"'
+                        )
+                    )
+
+                if worker.process_pool.processes < 1:
+                    errors.append(
+                        ValidationError("A process pool needs at least one process")
+                    )
+
+            if worker.interpreter_pool is not None:
+                if worker.pool != "threads":
+                    errors.append(
+                        ValidationError(
+                            'An interpreter pool can only be used with pool="threads"'
+                        )
+                    )
+
+                if worker.interpreter_pool.interpreters < 1:
+                    errors.append(
+                        ValidationError(
+                            "An interpreter pool needs at least one interpreter"
+                        )
+                    )
+
+        return errors
+
+    def validate_worker_limits(self) -> list[ValidationError]:
+        errors = []
+        for worker in self.options.workers:
+            if worker.max_jobs is not None and worker.max_jobs < 1:
+                errors.append(ValidationError("max_jobs must be at least 1"))
+
+            if worker.max_rss_mb is not None and worker.max_rss_mb <= 0:
+                errors.append(ValidationError("max_rss_mb must be positive"))
+
+            if worker.max_age is not None and worker.max_age <= timedelta(0):
+                errors.append(ValidationError("max_age must be positive"))
+
+            if worker.max_threads is not None:
+                if worker.pool != "threads":
+                    errors.append(
+                        ValidationError(
+                            'max_threads can only be used with pool="threads"'
+                        )
+                    )
+
+                min_threads = worker.min_threads or 1
+                if min_threads < 1:
+                    errors.append(ValidationError("min_threads must be at least 1"))
+
+                if not min_threads <= worker.threads <= worker.max_threads:
+                    errors.append(
+                        ValidationError(
+                            "threads must be between min_threads and max_threads"
+                        )
+                    )
+
+            for queue, timeout in worker.timeouts.items():
+                if timeout <= timedelta(0):
+                    errors.append(
+                        ValidationError(f'Timeout for queue "{queue}" must be positive')
+                    )
+
+            if worker.is_autoscaled:
+                min_processes = worker.min_processes or 1
+                if min_processes < 1:
+                    errors.append(ValidationError("min_processes must be at least 1"))
+
+                if worker.max_processes < min_processes:
+                    errors.append(
+                        ValidationError(
+                            "max_processes must be greater than or equal to "
+                            "min_processes"
+                        )
+                    )
+
+        return errors
+
+    def validate_dispatchers(self) -> list[ValidationError]:
+        errors = []
+        for dispatcher in self.options.dispatchers:
+            if not dispatcher.clear_finished_jobs:
+                continue
+
+            if dispatcher.clear_finished_jobs_interval <= timedelta(0):
+                errors.append(
+                    ValidationError("clear_finished_jobs_interval must be positive")
+                )
+
+            if dispatcher.clear_finished_jobs_budget <= timedelta(0):
+                errors.append(
+                    ValidationError("clear_finished_jobs_budget must be positive")
+                )
+
+        return errors
+
     def validate_database_pool_size(self) -> list[ValidationError]:
         # Match Solid Queue behavior by validating worker thread count against
         # the queue DB connection pool size when a max_size is explicitly set.
@@ -233,9 +409,12 @@ class Configuration:
 
     @property
     def estimated_number_of_threads(self) -> int:
-        # At most `threads` in each worker + 2 additional threads (worker loop
-        # and heartbeat), mirroring Solid Queue's sizing heuristic.
-        max_worker_threads = max((w.threads for w in self.options.workers), default=1)
+        # At most `threads` (or `max_threads` when tuned) in each worker + 2
+        # additional threads (worker loop and heartbeat), mirroring Solid
+        # Queue's sizing heuristic.
+        max_worker_threads = max(
+            (w.max_threads or w.threads for w in self.options.workers), default=1
+        )
         return max_worker_threads + 2
 
     @property
@@ -0,0 +1,255 @@
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+import time
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+import steady_queue
+from steady_queue.arguments import Arguments
+from steady_queue.models.job import Job
+
+try:
+    from compression import zstd
+except ImportError:  # Python < 3.14
+    zstd = None
+
+logger = logging.getLogger("steady_queue")
+
+FORMATS = ("jsonl", "csv")
+COMPRESSIONS = ("gzip", "zstd", "none")
+EXTENSIONS = {"gzip": ".gz", "zstd": ".zst", "none": ""}
+
+FIELDS = (
+    "id",
+    "queue_name",
+    "class_name",
+    "arguments",
+    "priority",
+    "django_task_id",
+    "concurrency_key",
+    "attempts",
+    "scheduled_at",
+    "created_at",
+    "finished_at",
+    "cancelled_at",
+)
+
+
+class ExportFile:
+    """
+    A compressed JSONL or CSV file of exported jobs that can be made durable
+    after every batch: `sync` flushes the compressor and fsyncs the file, so
+    what was written so far can be read back even if the process dies later.
+    """
+
+    def __init__(self, path: Path, format: str, compression: str):
+        self.path = path
+        self.format = format
+        self.compression = compression
+        self.rows = 0
+        self.opened_at = time.monotonic()
+
+        self.raw = open(path, "xb")
+        if compression == "gzip":
+            self.stream = gzip.GzipFile(fileobj=self.raw, mode="wb")
+        elif compression == "zstd":
+            self.stream = zstd.ZstdFile(self.raw, mode="w")
+        else:
+            self.stream = self.raw
+        self.text = io.TextIOWrapper(self.stream, encoding="utf-8", newline="")
+
+        if format == "csv":
+            self.csv = csv.writer(self.text)
+            self.csv.writerow(FIELDS)
+
+    def write(self, row: dict[str, Any]):
+        if self.format == "csv":
+            self.csv.writerow(
+                json.dumps(row[field], cls=DjangoJSONEncoder)
+                if field == "arguments"
+                else row[field]
+                for field in FIELDS
+            )
+        else:
+            self.text.write(json.dumps(row, cls=DjangoJSONEncoder) + "\n")
+        self.rows += 1
+
+    def sync(self):
+        self.text.flush()
+        if self.compression == "gzip":
+            self.stream.flush(zlib.Z_SYNC_FLUSH)
+        elif self.compression == "zstd":
+            self.stream.flush(zstd.ZstdFile.FLUSH_BLOCK)
+        self.raw.flush()
+        os.fsync(self.raw.fileno())
+
+    def close(self):
+        self.text.flush()
+        self.text.detach()
+        if self.stream is not self.raw:
+            # Writes the compressed stream's trailer; the raw file stays open.
+            self.stream.close()
+        self.raw.flush()
+        os.fsync(self.raw.fileno())
+        self.raw.close()
+
+        directory = os.open(self.path.parent, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+class JobExporter:
+    """
+    Exports finished jobs older than `steady_queue.clear_finished_jobs_after`
+    to compressed JSONL or CSV files in `directory`, deleting them from the
+    database as they are exported.
+
+    Jobs are read in `(finished_at, id)` order, a batch at a time, through a
+    server-side cursor, so memory use doesn't depend on how many there are.
+    A batch is deleted only after it has been fsynced. Files are rotated after
+    `max_rows_per_file` jobs or after being open for `rotate_after`.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        format: str = "jsonl",
+        compression: str = "gzip",
+        max_rows_per_file: int = 1_000_000,
+        rotate_after: timedelta = timedelta(hours=1),
+        delete: bool = True,
+    ):
+        if format not in FORMATS:
+            raise ValueError(
+                f'Invalid export format "{format}". '
+                f"Expected one of: {', '.join(FORMATS)}"
+            )
+        if compression not in COMPRESSIONS:
+            raise ValueError(
+                f'Invalid export compression "{compression}". '
+                f"Expected one of: {', '.join(COMPRESSIONS)}"
+            )
+        if compression == "zstd" and zstd is None:
+            raise ValueError("zstd compression requires Python 3.14 or later")
+
+        self.directory = Path(directory)
+        self.format = format
+        self.compression = compression
+        self.max_rows_per_file = max_rows_per_file
+        self.rotate_after = rotate_after
+        self.delete = delete
+        self.file: Optional[ExportFile] = None
+        self.files = 0
+
+    @classmethod
+    def from_settings(cls) -> Optional["JobExporter"]:
+        if steady_queue.export_finished_jobs_to is None:
+            return None
+
+        return cls(
+            steady_queue.export_finished_jobs_to,
+            format=steady_queue.finished_jobs_export_format,
+            compression=steady_queue.finished_jobs_export_compression,
+        )
+
+    def run(
+        self,
+        batch_size: int = 1000,
+        finished_before: Optional[datetime] = None,
+        class_name: Optional[str] = None,
+    ) -> int:
+        if finished_before is None:
+            finished_before = timezone.now() - steady_queue.clear_finished_jobs_after
+
+        exported = 0
+        after = None
+        try:
+            while True:
+                count, after = self.export_batch(
+                    batch_size, finished_before, class_name, after
+                )
+                exported += count
+                if after is None:
+                    return exported
+        finally:
+            self.close()
+
+    def export_batch(
+        self,
+        batch_size: int = 1000,
+        finished_before: Optional[datetime] = None,
+        class_name: Optional[str] = None,
+        after: Optional[tuple[datetime, int]] = None,
+    ) -> tuple[int, Optional[tuple[datetime, int]]]:
+        """
+        Export, and then delete, the next batch of clearable jobs. Works like
+        ``Job.objects.clear_finished_batch``, returning how many jobs were
+        exported and the key to resume from.
+        """
+        jobs = Job.objects.clearable(finished_before, class_name)
+        if after is not None:
+            finished_at, pk = after
+            jobs = jobs.filter(
+                models.Q(finished_at__gt=finished_at)
+                | models.Q(finished_at=finished_at, pk__gt=pk)
+            )
+        rows = jobs.order_by("finished_at", "pk").values(*FIELDS)[:batch_size]
+
+        ids = []
+        last = None
+        for row in rows.iterator(chunk_size=min(batch_size, 2000)):
+            if Arguments.offloaded_name(row["arguments"].get("arguments")):
+                # Offloaded arguments are deleted along with their job.
+                row["arguments"] = {
+                    **row["arguments"],
+                    "arguments": Arguments.resolve(row["arguments"]["arguments"]),
+                }
+            self.current_file().write(row)
+            ids.append(row["id"])
+            last = (row["finished_at"], row["id"])
+
+        if not ids:
+            return 0, None
+
+        self.file.sync()
+        if self.delete:
+            Job.objects.filter(pk__in=ids).delete()
+        if self.file.rows >= self.max_rows_per_file:
+            self.close()
+
+        return len(ids), last if len(ids) == batch_size else None
+
+    def current_file(self) -> ExportFile:
+        if self.file is not None and (
+            time.monotonic() - self.file.opened_at > self.rotate_after.total_seconds()
+        ):
+            self.close()
+
+        if self.file is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.files += 1
+            name = (
+                f"steady_queue_jobs-{timezone.now():%Y%m%dT%H%M%S}-{os.getpid()}"
+                f"-{self.files:04d}.{self.format}{EXTENSIONS[self.compression]}"
+            )
+            self.file = ExportFile(self.directory / name, self.format, self.compression)
+            logger.info("exporting finished jobs to %s", self.file.path)
+
+        return self.file
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
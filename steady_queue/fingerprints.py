@@ -0,0 +1,44 @@
+import hashlib
+import re
+
+PLACEHOLDERS = (
+    (
+        re.compile(
+            r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.I
+        ),
+        "<uuid>",
+    ),
+    (re.compile(r"\b0x[0-9a-f]+\b", re.I), "<hex>"),
+    (re.compile(r"'[^']*'|\"[^\"]*\""), "<str>"),
+    (re.compile(r"\d+(\.\d+)?"), "<num>"),
+    (re.compile(r"\s+"), " "),
+)
+
+
+def normalize_message(message: str) -> str:
+    """
+    Replace the parts of an error message that usually change from one
+    occurrence to the next (ids, addresses, quoted values, numbers) with
+    placeholders.
+    """
+    for pattern, placeholder in PLACEHOLDERS:
+        message = pattern.sub(placeholder, message)
+
+    return message.strip()[:500]
+
+
+def fingerprint(error: BaseException | str) -> str:
+    """
+    Identify errors that are likely to have the same cause: the exception
+    class and its normalized message. Exceptions and errors stored as
+    ``"ClassName: message"`` strings get the same fingerprint, so failures
+    fingerprinted from their stored error group with new ones.
+    """
+    if isinstance(error, BaseException):
+        class_name = error.__class__.__name__
+        message = str(error)
+    else:
+        class_name, _, message = error.partition(": ")
+
+    key = "\n".join((class_name, normalize_message(message)))
+    return hashlib.sha1(key.encode()).hexdigest()
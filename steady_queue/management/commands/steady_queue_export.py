@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+import steady_queue
+from steady_queue.exports import COMPRESSIONS, FORMATS, JobExporter
+
+
+class Command(BaseCommand):
+    help = (
+        "Export finished jobs to compressed JSONL or CSV files and delete them "
+        "from the database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "directory",
+            nargs="?",
+            help="Directory to write files to (default: "
+            "steady_queue.export_finished_jobs_to)",
+        )
+        parser.add_argument("--format", choices=FORMATS)
+        parser.add_argument("--compression", choices=COMPRESSIONS)
+        parser.add_argument(
+            "--older-than",
+            type=float,
+            help="Only jobs that finished more than this many days ago "
+            "(default: steady_queue.clear_finished_jobs_after)",
+        )
+        parser.add_argument("--class-name", help="Only jobs of this task")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--max-rows-per-file", type=int, default=1_000_000)
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Export jobs without deleting them",
+        )
+
+    def handle(self, *args, **options):
+        directory = options["directory"] or steady_queue.export_finished_jobs_to
+        if directory is None:
+            raise CommandError(
+                "Give a directory or set steady_queue.export_finished_jobs_to"
+            )
+
+        finished_before = None
+        if options["older_than"] is not None:
+            finished_before = timezone.now() - timedelta(days=options["older_than"])
+
+        try:
+            exporter = JobExporter(
+                directory,
+                format=options["format"] or steady_queue.finished_jobs_export_format,
+                compression=options["compression"]
+                or steady_queue.finished_jobs_export_compression,
+                max_rows_per_file=options["max_rows_per_file"],
+                delete=not options["keep"],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        count = exporter.run(
+            batch_size=options["batch_size"],
+            finished_before=finished_before,
+            class_name=options["class_name"],
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"export: {count} jobs in {exporter.files} files to {directory}"
+            )
+        )
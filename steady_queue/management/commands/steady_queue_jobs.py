@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from steady_queue.bulk_operations import BulkOperation, Progress
+
+
+def parse_time(value: str) -> datetime:
+    parsed = parse_datetime(value)
+    if parsed is None:
+        raise ValueError(f'Invalid date and time "{value}"')
+
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+
+    return parsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Retry, discard, reschedule, move, archive or restore the jobs matching "
+        "a filter, in small batches"
+    )
+
+    OPERATIONS = ("retry", "discard", "reschedule", "move", "archive", "restore")
+
+    def add_arguments(self, parser):
+        parser.add_argument("operation", choices=self.OPERATIONS)
+        parser.add_argument(
+            "--status",
+            choices=tuple(BulkOperation.EXECUTION_CLASSES),
+            help=(
+                "Only operate on jobs with this status (default: failed, or "
+                "archived when restoring)"
+            ),
+        )
+        parser.add_argument("--class-name", help="Only jobs of this task")
+        parser.add_argument("--queue", help="Only jobs in this queue")
+        parser.add_argument(
+            "--error", help="Only failed jobs whose error matches this regex"
+        )
+        parser.add_argument(
+            "--fingerprint", help="Only failed jobs with this error fingerprint"
+        )
+        parser.add_argument(
+            "--since",
+            type=parse_time,
+            help="Only jobs that got their status at or after this time",
+        )
+        parser.add_argument(
+            "--until",
+            type=parse_time,
+            help="Only jobs that got their status before this time",
+        )
+        parser.add_argument(
+            "--older-than",
+            type=float,
+            help="Only jobs that got their status more than this many days ago",
+        )
+        parser.add_argument(
+            "--at",
+            type=parse_time,
+            help="When to run rescheduled jobs (default: now)",
+        )
+        parser.add_argument("--to-queue", help="Queue to move jobs to")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--throttle",
+            type=float,
+            default=0,
+            help="Seconds to sleep between batches",
+        )
+
+    def handle(self, *args, **options):
+        operation = options["operation"]
+        if operation == "move" and not options["to_queue"]:
+            raise CommandError("--to-queue is required to move jobs")
+
+        status = options["status"]
+        if status is None:
+            status = "archived" if operation == "restore" else "failed"
+
+        until = options["until"]
+        if options["older_than"] is not None:
+            until = timezone.now() - timedelta(days=options["older_than"])
+
+        try:
+            bulk_operation = BulkOperation.matching(
+                status=status,
+                class_name=options["class_name"],
+                queue_name=options["queue"],
+                error=options["error"],
+                fingerprint=options["fingerprint"],
+                since=options["since"],
+                until=until,
+                batch_size=options["batch_size"],
+                throttle=timedelta(seconds=options["throttle"]),
+                on_progress=self.report,
+            )
+
+            if operation == "retry":
+                count = bulk_operation.retry()
+            elif operation == "discard":
+                count = bulk_operation.discard()
+            elif operation == "reschedule":
+                count = bulk_operation.reschedule(options["at"] or timezone.now())
+            elif operation == "move":
+                count = bulk_operation.move(options["to_queue"])
+            elif operation == "archive":
+                count = bulk_operation.archive()
+            else:
+                count = bulk_operation.restore()
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(f"{operation}: {count} jobs"))
+
+    def report(self, progress: Progress):
+        self.stdout.write(f"processed {progress}")
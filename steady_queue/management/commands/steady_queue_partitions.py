@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from steady_queue.partitions import PERIODS, JobPartitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Partition the job table by creation time on PostgreSQL, create future "
+        "partitions and drop or detach expired ones"
+    )
+
+    ACTIONS = ("setup", "maintain", "list")
+
+    def add_arguments(self, parser):
+        parser.add_argument("action", choices=self.ACTIONS)
+        parser.add_argument(
+            "--period",
+            choices=PERIODS,
+            help="Time span of each partition (default: "
+            "steady_queue.job_partition_period)",
+        )
+        parser.add_argument(
+            "--ahead",
+            type=int,
+            help="Number of future partitions to keep (default: "
+            "steady_queue.job_partitions_ahead)",
+        )
+        parser.add_argument(
+            "--detach",
+            action="store_true",
+            default=None,
+            help="Detach expired partitions instead of dropping them",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            partitions = JobPartitions(period=options["period"], ahead=options["ahead"])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if not partitions.is_supported:
+            raise CommandError("Partitioning the job table requires PostgreSQL")
+
+        action = options["action"]
+        if action == "setup":
+            if partitions.setup():
+                self.stdout.write(self.style.SUCCESS("Partitioned the job table"))
+            else:
+                self.stdout.write("The job table is already partitioned")
+            return
+
+        if not partitions.is_partitioned:
+            raise CommandError(
+                "The job table isn't partitioned. Run `steady_queue_partitions "
+                "setup` first"
+            )
+
+        if action == "maintain":
+            created, removed = partitions.maintain(detach=options["detach"])
+            for partition in created:
+                self.stdout.write(f"created {partition}")
+            for partition in removed:
+                self.stdout.write(
+                    f"{'detached' if options['detach'] else 'removed'} {partition}"
+                )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"maintain: {len(created)} created, {len(removed)} removed"
+                )
+            )
+        else:
+            for partition in partitions.partitions():
+                self.stdout.write(str(partition))
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("steady_queue", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="claimedexecution",
+            name="lease_expires_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="lease expires at"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="claimedexecution",
+            index=models.Index(fields=["lease_expires_at"], name="ix_sq_claimed_lease"),
+        ),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("steady_queue", "0002_claimedexecution_lease_expires_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="cancelled_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="cancelled at"
+            ),
+        ),
+    ]
@@ -0,0 +1,54 @@
+from django.db import migrations, models
+
+from steady_queue.fingerprints import fingerprint
+
+
+def backfill_fingerprints(apps, schema_editor):
+    FailedExecution = apps.get_model("steady_queue", "FailedExecution")
+    executions = (
+        FailedExecution.objects.using(schema_editor.connection.alias)
+        .filter(fingerprint__isnull=True)
+        .order_by("pk")
+    )
+
+    last_pk = 0
+    while batch := list(executions.filter(pk__gt=last_pk)[:1000]):
+        for execution in batch:
+            execution.fingerprint = fingerprint(execution.error or "")
+        executions.model.objects.using(schema_editor.connection.alias).bulk_update(
+            batch, ["fingerprint"]
+        )
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("steady_queue", "0004_job_attempts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="failedexecution",
+            name="fingerprint",
+            field=models.CharField(
+                blank=True, max_length=40, null=True, verbose_name="fingerprint"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="failedexecution",
+            index=models.Index(fields=["fingerprint"], name="ix_sq_failed_fingerprint"),
+        ),
+        migrations.RunPython(backfill_fingerprints, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name="FailedExecutionGroup",
+            fields=[],
+            options={
+                "verbose_name": "failure group",
+                "verbose_name_plural": "failure groups",
+                "proxy": True,
+                "indexes": [],
+                "constraints": [],
+            },
+            bases=("steady_queue.failedexecution",),
+        ),
+    ]
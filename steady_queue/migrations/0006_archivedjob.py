@@ -0,0 +1,91 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("steady_queue", "0005_failedexecution_fingerprint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="created at"
+                    ),
+                ),
+                (
+                    "job_id",
+                    models.BigIntegerField(unique=True, verbose_name="original job ID"),
+                ),
+                (
+                    "queue_name",
+                    models.CharField(max_length=255, verbose_name="queue name"),
+                ),
+                (
+                    "class_name",
+                    models.CharField(max_length=255, verbose_name="class name"),
+                ),
+                ("arguments", models.JSONField(verbose_name="arguments")),
+                ("priority", models.IntegerField(default=0, verbose_name="priority")),
+                (
+                    "django_task_id",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        null=True,
+                        verbose_name="Django task ID",
+                    ),
+                ),
+                (
+                    "concurrency_key",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        null=True,
+                        verbose_name="concurrency key",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="failed attempts"
+                    ),
+                ),
+                (
+                    "error",
+                    models.TextField(blank=True, null=True, verbose_name="error"),
+                ),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        blank=True, max_length=40, null=True, verbose_name="fingerprint"
+                    ),
+                ),
+                ("enqueued_at", models.DateTimeField(verbose_name="enqueued at")),
+                ("failed_at", models.DateTimeField(verbose_name="failed at")),
+            ],
+            options={
+                "verbose_name": "archived task",
+                "verbose_name_plural": "archived tasks",
+                "indexes": [
+                    models.Index(
+                        fields=["fingerprint"], name="ix_sq_archived_fingerprint"
+                    ),
+                    models.Index(fields=["failed_at"], name="ix_sq_archived_failed_at"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("steady_queue", "0006_archivedjob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OffloadedArguments",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="created at"
+                    ),
+                ),
+                (
+                    "sha256",
+                    models.CharField(
+                        max_length=64, unique=True, verbose_name="SHA-256"
+                    ),
+                ),
+                (
+                    "references",
+                    models.PositiveIntegerField(default=0, verbose_name="references"),
+                ),
+            ],
+            options={
+                "verbose_name": "offloaded arguments",
+                "verbose_name_plural": "offloaded arguments",
+            },
+        ),
+    ]
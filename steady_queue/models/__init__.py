@@ -1,7 +1,9 @@
+from .archived_job import ArchivedJob
 from .blocked_execution import BlockedExecution
 from .claimed_execution import ClaimedExecution
-from .failed_execution import FailedExecution
+from .failed_execution import FailedExecution, FailedExecutionGroup
 from .job import Job
+from .offloaded_arguments import OffloadedArguments
 from .pause import Pause
 from .process import Process
 from .queue import Queue
@@ -13,10 +15,13 @@ from .semaphore import Semaphore
 
 __all__ = (
     "Job",
+    "ArchivedJob",
     "BlockedExecution",
     "Process",
     "ClaimedExecution",
     "FailedExecution",
+    "FailedExecutionGroup",
+    "OffloadedArguments",
     "Pause",
     "ReadyExecution",
     "RecurringExecution",
@@ -0,0 +1,76 @@
+from django.db import models
+from django.utils import timezone
+
+from .base import BaseModel
+from .offloaded_arguments import OffloadingModel, OffloadingQuerySet
+
+
+class ArchivedJob(OffloadingModel, BaseModel):
+    """
+    A permanently failed job moved out of the job and failed execution tables,
+    with what's needed to inspect it or enqueue it again. ``created_at`` is
+    when it was archived.
+    """
+
+    class Meta:
+        verbose_name = "archived task"
+        verbose_name_plural = "archived tasks"
+        indexes = (
+            models.Index(fields=("fingerprint",), name="ix_sq_archived_fingerprint"),
+            models.Index(fields=("failed_at",), name="ix_sq_archived_failed_at"),
+        )
+
+    objects = OffloadingQuerySet.as_manager()
+
+    job_id = models.BigIntegerField(unique=True, verbose_name="original job ID")
+    queue_name = models.CharField(max_length=255, verbose_name="queue name")
+    class_name = models.CharField(max_length=255, verbose_name="class name")
+    arguments = models.JSONField(verbose_name="arguments")
+    priority = models.IntegerField(default=0, verbose_name="priority")
+    django_task_id = models.CharField(
+        max_length=255, blank=True, null=True, verbose_name="Django task ID"
+    )
+    concurrency_key = models.CharField(
+        max_length=255, blank=True, null=True, verbose_name="concurrency key"
+    )
+    attempts = models.PositiveIntegerField(default=0, verbose_name="failed attempts")
+    error = models.TextField(null=True, blank=True, verbose_name="error")
+    fingerprint = models.CharField(
+        max_length=40, null=True, blank=True, verbose_name="fingerprint"
+    )
+    enqueued_at = models.DateTimeField(verbose_name="enqueued at")
+    failed_at = models.DateTimeField(verbose_name="failed at")
+
+    @classmethod
+    def from_failed_execution(cls, execution) -> "ArchivedJob":
+        job = execution.job
+        return cls(
+            job_id=job.id,
+            queue_name=job.queue_name,
+            class_name=job.class_name,
+            arguments=job.arguments,
+            priority=job.priority,
+            django_task_id=job.django_task_id,
+            concurrency_key=job.concurrency_key,
+            attempts=job.attempts,
+            error=execution.error,
+            fingerprint=execution.fingerprint,
+            enqueued_at=job.created_at,
+            failed_at=execution.created_at,
+        )
+
+    def to_job(self):
+        from steady_queue.models.job import Job
+
+        return Job(
+            queue_name=self.queue_name,
+            class_name=self.class_name,
+            arguments=self.arguments,
+            priority=self.priority,
+            django_task_id=self.django_task_id,
+            concurrency_key=self.concurrency_key,
+            scheduled_at=timezone.now(),
+        )
+
+    def __str__(self):
+        return f"#{self.job_id}"
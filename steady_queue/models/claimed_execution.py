@@ -1,10 +1,19 @@
+import asyncio
 import logging
+from contextlib import AbstractContextManager, nullcontext
+from datetime import datetime, timedelta
+from inspect import iscoroutinefunction
+from typing import Any, Awaitable, Callable, Optional
 
 from django.db import models, transaction
 from django.tasks.signals import task_finished, task_started
+from django.utils import timezone
 
+import steady_queue
 from steady_queue.arguments import Arguments
+from steady_queue.cancellation import JobCancelledError, SteadyQueueTaskContext
 from steady_queue.models.execution import Execution, ExecutionQuerySet
+from steady_queue.processes.errors import ExecutionTimeoutError
 from steady_queue.task import SteadyQueueTask
 
 logger = logging.getLogger("steady_queue")
@@ -14,9 +23,19 @@ class ClaimedExecutionQuerySet(ExecutionQuerySet, models.QuerySet):
     def orphaned(self):
         return self.filter(process_id=None)
 
+    def with_expired_lease(self):
+        return self.filter(lease_expires_at__lt=timezone.now())
+
+    def renew_leases(self) -> int:
+        return self.update(lease_expires_at=self.model.lease_expiry())
+
     def claiming(self, job_ids, process_id):
+        lease_expires_at = self.model.lease_expiry()
         claimed_executions = [
-            self.model(job_id=job_id, process_id=process_id) for job_id in job_ids
+            self.model(
+                job_id=job_id, process_id=process_id, lease_expires_at=lease_expires_at
+            )
+            for job_id in job_ids
         ]
         self.bulk_create(claimed_executions)
 
@@ -27,7 +46,7 @@ class ClaimedExecutionQuerySet(ExecutionQuerySet, models.QuerySet):
             execution.release()
 
     def fail_all_with(self, error: Exception | str):
-        executions = self.select_related("job").all()
+        executions = self.select_related("job").defer("job__arguments")
         for execution in executions:
             execution.failed_with(error)
             execution.unblock_next_job()
@@ -44,6 +63,7 @@ class ClaimedExecution(Execution):
             models.Index(
                 fields=("process_id", "job_id"), name="ix_sq_claimed_process_job"
             ),
+            models.Index(fields=("lease_expires_at",), name="ix_sq_claimed_lease"),
         )
 
     objects = ClaimedExecutionQuerySet.as_manager()
@@ -62,6 +82,16 @@ class ClaimedExecution(Execution):
         on_delete=models.SET_NULL,
         related_name="claimed_executions",
     )
+    lease_expires_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="lease expires at"
+    )
+
+    @classmethod
+    def lease_expiry(cls) -> Optional[datetime]:
+        if steady_queue.claim_lease_duration is None:
+            return None
+
+        return timezone.now() + steady_queue.claim_lease_duration
 
     @property
     def type(self):
@@ -76,36 +106,151 @@ class ClaimedExecution(Execution):
             self.job.dispatch_bypassing_concurrency_limits()
             self.delete()
 
-    def perform(self):
+    def perform(
+        self,
+        runner: Optional[Callable[[SteadyQueueTask, dict], Any]] = None,
+        watch: Optional[Callable[[], AbstractContextManager]] = None,
+    ):
+        """
+        Perform the execution in the current thread. When given, `runner` is
+        called with the task and its serialized arguments instead of calling
+        the task directly, e.g. to run it in another process. `watch` returns
+        a context manager entered around the task call alone, and not around
+        the bookkeeping before and after it.
+        """
         logger.debug("performing claimed execution for job %s", self.job_id)
-        task = SteadyQueueTask.deserialize(self.job.arguments)
-        backend = task.get_backend()
+        task, args, kwargs = self.load_task()
+
+        try:
+            self.started(task, args, kwargs)
+            with watch() if watch is not None else nullcontext():
+                if runner is None:
+                    task.call(*self.call_args(task, args, kwargs), **kwargs)
+                else:
+                    runner(task, self.job.arguments["arguments"])
+            self.succeeded(task, args, kwargs)
+        except JobCancelledError:
+            self.cancelled(task, args, kwargs)
+        except Exception as e:
+            self.errored(task, args, kwargs, e)
+        finally:
+            self.unblock_next_job()
+
+    async def aperform(
+        self,
+        run_sync: Callable[..., Awaitable],
+        timeout: Optional[timedelta] = None,
+        run_task: Optional[Callable[..., Awaitable]] = None,
+    ):
+        """
+        Perform the execution on a running event loop.
+
+        Coroutine tasks are awaited directly, while every blocking step
+        (deserialization, signals and bookkeeping) is handed to ``run_sync``
+        so that it doesn't stall the loop. Synchronous tasks are handed to
+        ``run_task``, or to ``run_sync`` if it isn't given. When a ``timeout``
+        is given, the task fails with ExecutionTimeoutError if it takes longer.
+        """
+        logger.debug("performing claimed execution for job %s", self.job_id)
+        task, args, kwargs = await run_sync(self.load_task)
+
+        try:
+            await run_sync(self.started, task, args, kwargs)
+            try:
+                await asyncio.wait_for(
+                    self.acall(task, args, kwargs, run_sync, run_task or run_sync),
+                    timeout.total_seconds() if timeout is not None else None,
+                )
+            except TimeoutError as e:
+                if timeout is None:
+                    raise
+                raise ExecutionTimeoutError(timeout) from e
+            await run_sync(self.succeeded, task, args, kwargs)
+        except JobCancelledError:
+            await run_sync(self.cancelled, task, args, kwargs)
+        except Exception as e:
+            await run_sync(self.errored, task, args, kwargs, e)
+        finally:
+            await run_sync(self.unblock_next_job)
+
+    async def acall(
+        self,
+        task: SteadyQueueTask,
+        args: list,
+        kwargs: dict,
+        run_sync: Callable[..., Awaitable],
+        run_task: Callable[..., Awaitable],
+    ):
+        call_args = await run_sync(self.call_args, task, args, kwargs)
+        if iscoroutinefunction(task.func):
+            await task.func(*call_args, **kwargs)
+        else:
+            await run_task(task.func, *call_args, **kwargs)
+
+    def call_args(self, task: SteadyQueueTask, args: list, kwargs: dict) -> list:
+        if not task.takes_context:
+            return args
+
+        context = SteadyQueueTaskContext(
+            task_result=task.get_backend().to_task_result(task, self.job, args, kwargs),
+            job_id=self.job_id,
+        )
+        return [context, *args]
+
+    def load_task(self) -> tuple[SteadyQueueTask, list, dict]:
+        task = SteadyQueueTask.deserialize(self.job.task_data)
         args, kwargs = Arguments.deserialize_args_and_kwargs(
             self.job.arguments["arguments"]
         )
+        return task, args, kwargs
 
-        try:
-            task_started.send(
-                sender=backend,
-                task_result=backend.to_task_result(task, self.job, args, kwargs),
-            )
+    def started(self, task: SteadyQueueTask, args: list, kwargs: dict):
+        backend = task.get_backend()
+        task_started.send(
+            sender=backend,
+            task_result=backend.to_task_result(task, self.job, args, kwargs),
+        )
 
-            task.func(*args, **kwargs)
+    def succeeded(self, task: SteadyQueueTask, args: list, kwargs: dict):
+        self.finished()
+        backend = task.get_backend()
+        task_finished.send(
+            sender=backend,
+            task_result=backend.to_task_result(task, self.job, args, kwargs),
+        )
 
-            self.finished()
-            task_finished.send(
-                sender=backend,
-                task_result=backend.to_task_result(task, self.job, args, kwargs),
+    def errored(
+        self, task: SteadyQueueTask, args: list, kwargs: dict, error: Exception
+    ):
+        policy = task.retry_policy
+        if policy is not None and policy.retries(error, self.job.attempts + 1):
+            wait = policy.wait_before(self.job.attempts + 1)
+            logger.warning(
+                "claimed execution for job %s failed, retrying in %s",
+                self.job_id,
+                wait,
+                exc_info=error,
             )
-        except Exception as e:
-            logger.exception("claimed execution failed", exc_info=e)
-            self.failed_with(e)
-            task_finished.send(
-                sender=backend,
-                task_result=backend.to_task_result(task, self.job, args, kwargs),
-            )
-        finally:
-            self.unblock_next_job()
+            self.retry_later(wait)
+            return
+
+        logger.exception("claimed execution failed", exc_info=error)
+        self.failed_with(error)
+        backend = task.get_backend()
+        task_finished.send(
+            sender=backend,
+            task_result=backend.to_task_result(task, self.job, args, kwargs),
+        )
+
+    def cancelled(self, task: SteadyQueueTask, args: list, kwargs: dict):
+        logger.info("claimed execution for job %s was cancelled", self.job_id)
+        self.job.refresh_from_db(fields=("cancelled_at",))
+        self.finished()
+        backend = task.get_backend()
+        task_finished.send(
+            sender=backend,
+            task_result=backend.to_task_result(task, self.job, args, kwargs),
+        )
 
     def finished(self):
         logger.debug("claimed execution for job %s finished", self.job_id)
@@ -113,6 +258,11 @@ class ClaimedExecution(Execution):
             self.job.finished()
             self.delete()
 
+    def retry_later(self, wait: timedelta):
+        with transaction.atomic(using=self._state.db):
+            self.job.retry_later(wait)
+            self.delete()
+
     def failed_with(self, error: Exception | str):
         logger.debug("claimed execution for job %s failed with %s", self.job_id, error)
         with transaction.atomic(using=self._state.db):
@@ -26,24 +26,64 @@ class ClearableQuerySet(models.QuerySet):
 
         return queryset
 
+    def clear_finished_batch(
+        self,
+        batch_size: int = 500,
+        finished_before: Optional[datetime] = None,
+        class_name: Optional[str] = None,
+        after: Optional[tuple[datetime, int]] = None,
+    ) -> tuple[int, Optional[tuple[datetime, int]]]:
+        """
+        Delete the next ``batch_size`` clearable jobs in ``(finished_at, id)``
+        order, starting after the ``after`` key. Returns how many jobs were
+        deleted and the key to resume from, or ``None`` when there are no more
+        jobs to clear.
+
+        Walking the ``finished_at`` index from a key, rather than from its
+        start, means each batch doesn't have to skip over the rows deleted by
+        the previous ones.
+        """
+        queryset = self.clearable(finished_before, class_name)
+        if after is not None:
+            finished_at, pk = after
+            queryset = queryset.filter(
+                models.Q(finished_at__gt=finished_at)
+                | models.Q(finished_at=finished_at, pk__gt=pk)
+            )
+
+        keys = list(
+            queryset.order_by("finished_at", "pk").values_list("finished_at", "pk")[
+                :batch_size
+            ]
+        )
+        if not keys:
+            return 0, None
+
+        _, deleted_by_type = self.filter(pk__in=[pk for _, pk in keys]).delete()
+        deleted = deleted_by_type.get(self.model._meta.label, 0)
+
+        return deleted, keys[-1] if len(keys) == batch_size else None
+
     def clear_finished_in_batches(
         self,
         batch_size: int = 500,
         finished_before: Optional[datetime] = None,
         class_name: Optional[str] = None,
         sleep_between_batches: Optional[timedelta] = None,
-    ):
+    ) -> int:
         if sleep_between_batches is None:
             sleep_between_batches = timedelta(seconds=0)
+        if finished_before is None:
+            finished_before = timezone.now() - steady_queue.clear_finished_jobs_after
 
+        cleared = 0
+        after = None
         while True:
-            ids = list(
-                self.clearable(finished_before, class_name)[:batch_size].values_list(
-                    "pk", flat=True
-                )
+            deleted, after = self.clear_finished_batch(
+                batch_size, finished_before, class_name, after
             )
-            deleted, _ = self.filter(pk__in=ids).delete()
-            if deleted == 0:
-                break
+            cleared += deleted
+            if after is None:
+                return cleared
 
             time.sleep(sleep_between_batches.total_seconds())
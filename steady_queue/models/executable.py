@@ -42,7 +42,8 @@ class Executable(ConcurrencyControls, Schedulable, Retryable):
         due = [j for j in jobs if j.is_due]
         not_yet_due = [j for j in jobs if not j.is_due]
 
-        return cls.dispatch_all(due) + cls.schedule_all(not_yet_due)
+        cls.dispatch_all(due)
+        cls.schedule_all(not_yet_due)
 
     @classmethod
     def dispatch_all(cls, jobs):
@@ -104,9 +105,17 @@ class Executable(ConcurrencyControls, Schedulable, Retryable):
     @property
     def status(self):
         if self.is_finished:
-            return "finished"
+            return "finished" if self.cancelled_at is None else "cancelled"
 
-        return self.execution.type
+        execution = self.execution
+        if self.cancelled_at is not None and (
+            execution is None or execution.type != "claimed"
+        ):
+            # Cancelled jobs that aren't running anymore, even if they weren't
+            # kept around as finished.
+            return "cancelled"
+
+        return execution.type
 
     @property
     def ready(self):
@@ -1,6 +1,6 @@
 from typing import Self
 
-from django.db import models, transaction
+from django.db import models
 
 from .base import BaseModel
 
@@ -10,23 +10,9 @@ class ExecutionQuerySet(models.QuerySet):
         return self.order_by("-priority", "job_id")
 
     def discard_in_batches(self, batch_size: int = 500) -> int:
-        pending = self.count()
-        total_discarded = 0
+        from steady_queue.bulk_operations import BulkOperation
 
-        while True:
-            with transaction.atomic(using=self.db):
-                to_discard = self.order_by("job_id").select_for_update()[:batch_size]
-                discarded = self.discard_jobs(to_discard)
-                pending -= discarded
-                total_discarded += discarded
-
-            if pending == 0:
-                break
-
-            if discarded == 0:
-                break
-
-        return total_discarded
+        return BulkOperation(self, batch_size=batch_size).discard()
 
     def discard_all_from_jobs(self, jobs: models.QuerySet):
         raise NotImplementedError
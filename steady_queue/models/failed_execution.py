@@ -1,4 +1,5 @@
 from django.db import models, transaction
+from django.db.models import Count, Max, Min, OuterRef, Q, Subquery
 
 from steady_queue.models.dispatching import Dispatching
 
@@ -6,19 +7,56 @@ from .execution import Execution, ExecutionQuerySet
 
 
 class FailedExecutionQuerySet(ExecutionQuerySet, models.QuerySet):
-    def retry(self) -> int:
-        return self.model.retry_all(
-            [
-                failed_execution.job
-                for failed_execution in self.select_related("job").all()
-            ]
+    def retry(self, batch_size: int = 500) -> int:
+        from steady_queue.bulk_operations import BulkOperation
+
+        return BulkOperation(self, batch_size=batch_size).retry()
+
+    def grouped(self):
+        """
+        One execution per fingerprint and task class, annotated with the size
+        of its group and when the group last failed.
+        """
+        representatives = (
+            self.order_by()
+            .values("fingerprint", "job__class_name")
+            .annotate(representative=Min("pk"))
+            .values("representative")
         )
+        group = (
+            self.model.objects.filter(
+                fingerprint=OuterRef("fingerprint"),
+                job__class_name=OuterRef("job__class_name"),
+            )
+            .order_by()
+            .values("fingerprint")
+        )
+
+        return self.filter(pk__in=representatives).annotate(
+            failure_count=Subquery(group.annotate(count=Count("pk")).values("count")),
+            last_failed_at=Subquery(
+                group.annotate(last=Max("created_at")).values("last")
+            ),
+        )
+
+    def in_groups_of(self, executions) -> "FailedExecutionQuerySet":
+        """All executions sharing a fingerprint and task class with the given ones."""
+        groups = Q(pk__in=[])
+        for fingerprint, class_name in executions.values_list(
+            "fingerprint", "job__class_name"
+        ).distinct():
+            groups |= Q(fingerprint=fingerprint, job__class_name=class_name)
+
+        return self.filter(groups)
 
 
 class FailedExecution(Dispatching, Execution):
     class Meta:
         verbose_name = "failed task"
         verbose_name_plural = "failed tasks"
+        indexes = (
+            models.Index(fields=("fingerprint",), name="ix_sq_failed_fingerprint"),
+        )
 
     objects = FailedExecutionQuerySet.as_manager()
 
@@ -29,6 +67,9 @@ class FailedExecution(Dispatching, Execution):
         related_name="failed_execution",
     )
     error = models.TextField(verbose_name="error", null=True, blank=True)
+    fingerprint = models.CharField(
+        max_length=40, null=True, blank=True, verbose_name="fingerprint"
+    )
 
     @property
     def type(self):
@@ -42,6 +83,16 @@ class FailedExecution(Dispatching, Execution):
 
     @classmethod
     def retry_all(cls, jobs: list) -> int:
+        from steady_queue.models.job import Job
+
         with transaction.atomic(using=cls.objects.db):
-            job_ids = cls.objects.lock_all_from_jobs(jobs)
+            job_ids = list(cls.objects.lock_all_from_jobs(jobs))
+            Job.objects.filter(id__in=job_ids).update(attempts=0)
             return cls.dispatch_jobs(job_ids)
+
+
+class FailedExecutionGroup(FailedExecution):
+    class Meta:
+        proxy = True
+        verbose_name = "failure group"
+        verbose_name_plural = "failure groups"
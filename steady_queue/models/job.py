@@ -1,20 +1,110 @@
 from typing import Optional
 
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
+import steady_queue
 from steady_queue.models.base import BaseModel, UpdatedAtMixin
 from steady_queue.models.clearable import ClearableQuerySet
 from steady_queue.models.executable import Executable, ExecutableQuerySet
+from steady_queue.models.offloaded_arguments import (
+    OffloadingModel,
+    OffloadingQuerySet,
+)
 from steady_queue.task import SteadyQueueTask
 
 
-class JobQuerySet(ExecutableQuerySet, ClearableQuerySet, models.QuerySet):
+class JobQuerySet(
+    ExecutableQuerySet, ClearableQuerySet, OffloadingQuerySet, models.QuerySet
+):
     def enqueue(self, task: SteadyQueueTask, args: list, kwargs: dict):
         return self.create(**self.model.attributes_from_django_task(task, args, kwargs))
 
+    def enqueue_all(self, jobs: list["Job"]) -> list["Job"]:
+        """
+        Insert unsaved jobs with a single statement and prepare them all for
+        execution in the same transaction.
+        """
+        if len(jobs) == 0:
+            return []
 
-class Job(Executable, UpdatedAtMixin, BaseModel):
+        with transaction.atomic(using=self.db):
+            jobs = self.bulk_create(jobs)
+            self.model.prepare_all_for_execution(jobs)
+
+        return jobs
+
+    def identified_by(self, task_ids: list[int | str]):
+        """
+        Filter jobs by their id or by their Django task id, which is what
+        ``TaskResult.id`` holds for tasks enqueued through the backend.
+        """
+        ids = [int(i) for i in task_ids if isinstance(i, int) or str(i).isdigit()]
+
+        return self.filter(
+            models.Q(id__in=ids)
+            | models.Q(django_task_id__in=[str(i) for i in task_ids])
+        )
+
+    def cancel(self) -> int:
+        """
+        Cancel jobs that haven't finished yet. Jobs waiting to run have their
+        executions deleted and are marked as finished, while running jobs are
+        only flagged, for their worker to pick up at its next check. Returns
+        the number of jobs cancelled.
+        """
+        from steady_queue.models.blocked_execution import BlockedExecution
+        from steady_queue.models.ready_execution import ReadyExecution
+        from steady_queue.models.scheduled_execution import ScheduledExecution
+
+        now = timezone.now()
+        with transaction.atomic(using=self.db):
+            running = self.filter(
+                claimed_execution__isnull=False, cancelled_at__isnull=True
+            ).update(cancelled_at=now)
+
+            pending = self.filter(
+                finished_at__isnull=True,
+                claimed_execution__isnull=True,
+                failed_execution__isnull=True,
+            )
+            # Ready jobs hold a concurrency lock, to be released like when
+            # their ready execution is discarded.
+            holding_locks = list(
+                pending.filter(
+                    ready_execution__isnull=False, concurrency_key__isnull=False
+                )
+            )
+            for execution_class in (
+                ReadyExecution,
+                ScheduledExecution,
+                BlockedExecution,
+            ):
+                execution_class.objects.filter(job__in=pending).delete()
+
+            if steady_queue.preserve_finished_jobs:
+                waiting = pending.update(finished_at=now, cancelled_at=now)
+            else:
+                _, deleted_by_type = pending.delete()
+                waiting = deleted_by_type.get("steady_queue.Job", 0)
+
+            for job in holding_locks:
+                job.unblock_next_blocked_job()
+
+        return running + waiting
+
+    def cancelled(self):
+        return self.filter(cancelled_at__isnull=False)
+
+
+class JobManager(models.Manager.from_queryset(JobQuerySet)):
+    def get_queryset(self):
+        # Arguments can be large and are only needed to run a job, which loads
+        # them through its claimed execution, so they aren't loaded by default.
+        return super().get_queryset().defer("arguments")
+
+
+class Job(Executable, OffloadingModel, UpdatedAtMixin, BaseModel):
     class Meta:
         verbose_name = "task"
         verbose_name_plural = "tasks"
@@ -35,7 +125,7 @@ class Job(Executable, UpdatedAtMixin, BaseModel):
             ),
         )
 
-    objects = JobQuerySet.as_manager()
+    objects = JobManager()
 
     queue_name = models.CharField(max_length=255, verbose_name="queue name")
     class_name = models.CharField(max_length=255, verbose_name="class name")
@@ -53,9 +143,20 @@ class Job(Executable, UpdatedAtMixin, BaseModel):
     concurrency_key = models.CharField(
         max_length=255, blank=True, null=True, verbose_name="concurrency key"
     )
+    attempts = models.PositiveIntegerField(default=0, verbose_name="failed attempts")
+    cancelled_at = models.DateTimeField(
+        blank=True, null=True, verbose_name="cancelled at"
+    )
 
     DEFAULT_QUEUE_NAME = "default"
     DEFAULT_PRIORITY = 0
+    # Serialized task fields that are stored in their own columns, and so
+    # left out of ``arguments``.
+    TASK_DATA_COLUMNS = ("class_name", "queue_name", "priority")
+
+    @classmethod
+    def from_django_task(cls, task: SteadyQueueTask, args: list, kwargs: dict):
+        return cls(**cls.attributes_from_django_task(task, args, kwargs))
 
     @classmethod
     def attributes_from_django_task(
@@ -70,10 +171,29 @@ class Job(Executable, UpdatedAtMixin, BaseModel):
             "priority": task.priority or cls.DEFAULT_PRIORITY,
             "scheduled_at": task.run_after or timezone.now(),
             "class_name": task.module_path,
-            "arguments": task.serialize(args, kwargs),
+            "arguments": {
+                key: value
+                for key, value in task.serialize(args, kwargs).items()
+                if key not in cls.TASK_DATA_COLUMNS
+            },
             "concurrency_key": concurrency_key,
         }
 
+    @property
+    def task_data(self) -> dict:
+        """The serialized task, as returned by ``SteadyQueueTask.serialize``."""
+        return {
+            **self.arguments,
+            **{column: getattr(self, column) for column in self.TASK_DATA_COLUMNS},
+        }
+
+    def cancel(self) -> bool:
+        return Job.objects.filter(pk=self.pk).cancel() > 0
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.cancelled_at is not None
+
     def __str__(self):
         if isinstance(self.pk, int):
             return f"#{self.pk}"
@@ -0,0 +1,214 @@
+import logging
+from collections import Counter
+
+from django.db import IntegrityError, models, transaction
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+from django.db.models.functions import Greatest
+
+import steady_queue
+from steady_queue.arguments import Arguments, arguments_storage
+
+from .base import BaseModel
+
+logger = logging.getLogger("steady_queue")
+
+# Whether each database had offloaded arguments left, when offloading isn't
+# configured. See `OffloadedArgumentsQuerySet.in_use`.
+leftover_offloaded_arguments: dict[str, bool] = {}
+
+
+def offloaded_sha256():
+    """The SHA-256 of a row's offloaded arguments, or NULL if they're inline."""
+    return KeyTextTransform(
+        "sha256",
+        KeyTransform(Arguments.OFFLOADED_KEY, KeyTransform("arguments", "arguments")),
+    )
+
+
+class OffloadedArgumentsQuerySet(models.QuerySet):
+    def in_use(self) -> bool:
+        """
+        Whether deleted rows may refer to offloaded arguments. They may while
+        offloading is configured. Otherwise, since no new references can be
+        taken, whether any are left is only checked once per process.
+        """
+        if steady_queue.offload_arguments_over is not None:
+            return True
+
+        if self.db not in leftover_offloaded_arguments:
+            leftover_offloaded_arguments[self.db] = self.exists()
+
+        return leftover_offloaded_arguments[self.db]
+
+    def retain(self, references: Counter, contents: dict[str, bytes]):
+        """
+        Add references to offloaded arguments, counted by SHA-256, and write
+        those in `contents` to storage.
+
+        Each file is written or verified while its row is locked, so that it
+        can't be deleted in between by a concurrent `release`.
+        """
+        with transaction.atomic(using=self.db):
+            # Sorted, so that concurrent enqueues lock rows in the same order.
+            for digest in sorted(references):
+                self.reference(digest, references[digest])
+                if digest in contents:
+                    Arguments.store(digest, contents[digest])
+
+    def reference(self, digest: str, count: int):
+        while True:
+            if self.filter(sha256=digest).update(
+                references=models.F("references") + count
+            ):
+                return
+
+            try:
+                with transaction.atomic(using=self.db):
+                    self.create(sha256=digest, references=count)
+                return
+            except IntegrityError:
+                # Created concurrently: increment it instead.
+                continue
+
+    def release(self, references: Counter):
+        """
+        Drop references to offloaded arguments, counted by SHA-256, and delete
+        the files no longer referenced once the current transaction commits.
+        """
+        if not references:
+            return
+
+        for digest in sorted(references):
+            self.filter(sha256=digest).update(
+                references=Greatest(models.F("references") - references[digest], 0)
+            )
+
+        unreferenced = self.filter(sha256__in=list(references))
+        transaction.on_commit(unreferenced.delete_unreferenced, using=self.db)
+
+    def delete_unreferenced(self):
+        storage = arguments_storage()
+        with transaction.atomic(using=self.db):
+            # Rows being retained stay locked until their enqueue commits, and
+            # are only deleted if that left them unreferenced.
+            deleted = []
+            for offloaded in self.filter(references=0).select_for_update():
+                try:
+                    storage.delete(offloaded.name)
+                except Exception as e:
+                    logger.warning(
+                        "deleting offloaded arguments %s failed: %s", offloaded.name, e
+                    )
+                    continue
+                deleted.append(offloaded.pk)
+
+            self.filter(pk__in=deleted).delete()
+
+
+class OffloadedArguments(BaseModel):
+    """
+    Task arguments offloaded to the arguments storage, with how many jobs and
+    archived jobs refer to them. The file is deleted along with the row once
+    nothing does.
+    """
+
+    class Meta:
+        verbose_name = "offloaded arguments"
+        verbose_name_plural = "offloaded arguments"
+
+    objects = OffloadedArgumentsQuerySet.as_manager()
+
+    sha256 = models.CharField(max_length=64, unique=True, verbose_name="SHA-256")
+    references = models.PositiveIntegerField(default=0, verbose_name="references")
+
+    @property
+    def name(self) -> str:
+        return Arguments.offloaded_file_name(self.sha256)
+
+    def __str__(self):
+        return self.name
+
+
+class OffloadingQuerySet(models.QuerySet):
+    """
+    Inserting rows offloads their large task arguments to storage and takes a
+    reference on them, and deleting rows releases their references.
+    """
+
+    def create(self, **kwargs):
+        obj = self.model(**kwargs)
+        with transaction.atomic(using=self.db):
+            self.offload([obj])
+            obj.save(force_insert=True, using=self.db)
+
+        return obj
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        with transaction.atomic(using=self.db):
+            self.offload(objs)
+            return super().bulk_create(objs, *args, **kwargs)
+
+    def offload(self, objs: list[models.Model]):
+        references, contents = Counter(), {}
+        for obj in objs:
+            data, encoded = Arguments.offload(obj.arguments.get("arguments"))
+            digest = Arguments.offloaded_digest(data)
+            if digest is None:
+                continue
+
+            if encoded is not None:
+                obj.arguments = {**obj.arguments, "arguments": data}
+                contents[digest] = encoded
+            references[digest] += 1
+
+        if references:
+            OffloadedArguments.objects.using(self.db).retain(references, contents)
+
+    def offloaded_references(self) -> Counter:
+        """How many of these rows refer to each offloaded arguments' SHA-256."""
+        digests = (
+            self.annotate(offloaded_sha256=offloaded_sha256())
+            .filter(offloaded_sha256__isnull=False)
+            .values_list("offloaded_sha256", flat=True)
+        )
+        return Counter(digests)
+
+    def delete(self):
+        offloaded = OffloadedArguments.objects.using(self.db)
+        if not offloaded.in_use():
+            return super().delete()
+
+        with transaction.atomic(using=self.db):
+            references = self.offloaded_references()
+            result = super().delete()
+            offloaded.release(references)
+
+        return result
+
+
+class OffloadingModel(models.Model):
+    """Deleting a row releases its reference to offloaded arguments."""
+
+    class Meta:
+        abstract = True
+
+    def delete(self, *args, **kwargs):
+        using = self._state.db
+        offloaded = OffloadedArguments.objects.using(using)
+        if not offloaded.in_use():
+            return super().delete(*args, **kwargs)
+
+        if "arguments" in self.get_deferred_fields():
+            references = (
+                type(self).objects.using(using).filter(pk=self.pk)
+            ).offloaded_references()
+        else:
+            digest = Arguments.offloaded_digest(self.arguments.get("arguments"))
+            references = Counter([digest] if digest is not None else [])
+
+        with transaction.atomic(using=using):
+            result = super().delete(*args, **kwargs)
+            offloaded.release(references)
+
+        return result
@@ -8,7 +8,8 @@ from steady_queue.models.prunable import Prunable, PrunableQuerySet
 
 
 class ProcessQuerySet(PrunableQuerySet, models.QuerySet):
-    pass
+    def heartbeat(self) -> int:
+        return self.update(last_heartbeat_at=timezone.now())
 
 
 class Process(Executor, Prunable, BaseModel):
@@ -53,11 +54,13 @@ class Process(Executor, Prunable, BaseModel):
         return process
 
     def heartbeat(self):
-        self.refresh_from_db()
+        # A single UPDATE: no need to lock or reload the row, and it doubles
+        # as the check that we haven't been pruned.
+        now = timezone.now()
+        if not Process.objects.filter(pk=self.pk).update(last_heartbeat_at=now):
+            raise Process.DoesNotExist(f"Process {self.pk} no longer exists")
 
-        with self.lock():
-            self.last_heartbeat_at = timezone.now()
-            self.save()
+        self.last_heartbeat_at = now
 
     def deregister(self, pruned=False):
         # Collect supervisees before delete, since delete cascades SET_NULL
@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import Optional
+
 from django.db import models, transaction
 
 from steady_queue.models.claimed_execution import ClaimedExecution
@@ -69,6 +72,13 @@ class ReadyExecutionQuerySet(ExecutionQuerySet, models.QuerySet):
             map(lambda qs: qs.count(), QueueSelector(queues, self).scoped_relations())
         )
 
+    def oldest_created_at_across_queues(self, queues: list[str]) -> Optional[datetime]:
+        oldest = [
+            qs.aggregate(oldest=models.Min("created_at"))["oldest"]
+            for qs in QueueSelector(queues, self).scoped_relations()
+        ]
+        return min((o for o in oldest if o is not None), default=None)
+
 
 class ReadyExecution(Execution):
     class Meta:
@@ -6,7 +6,12 @@ from .execution import Execution, ExecutionQuerySet
 
 class RecurringExecutionQuerySet(ExecutionQuerySet):
     def clearable(self):
-        return self.filter(job__isnull=True)
+        """Recurring executions whose job no longer exists."""
+        from steady_queue.models.job import Job
+
+        return self.exclude(
+            models.Exists(Job.objects.filter(pk=models.OuterRef("job_id")))
+        )
 
     def record(self, task_result: TaskResult, task, run_at):
         try:
@@ -14,11 +19,15 @@ class RecurringExecutionQuerySet(ExecutionQuerySet):
         except IntegrityError as e:
             raise self.model.AlreadyRecorded from e
 
-    def clear_in_batches(self, batch_size=500):
+    def clear_in_batches(self, batch_size=500) -> int:
+        cleared = 0
         while True:
-            deleted, _ = self.clearable()[:batch_size].delete()
-            if deleted == 0:
-                break
+            ids = list(self.clearable().values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                return cleared
+
+            deleted, _ = self.filter(pk__in=ids).delete()
+            cleared += deleted
 
 
 class RecurringExecution(Execution):
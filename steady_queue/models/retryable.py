@@ -1,4 +1,9 @@
+from datetime import timedelta
+
 from django.db import models
+from django.utils import timezone
+
+from steady_queue.fingerprints import fingerprint
 from steady_queue.models.failed_execution import FailedExecution
 
 
@@ -15,15 +20,24 @@ class Retryable:
         self.failed_execution.retry()
 
     def failed_with(self, error: Exception | str) -> None:
+        error_fingerprint = fingerprint(error)
         if isinstance(error, Exception):
             error = f"{error.__class__.__name__}: {error}"
 
+        self.attempts += 1
+        self.save(update_fields=("attempts",))
         FailedExecution.objects.get_or_create(
             job=self,
             error=str(error),
+            defaults={"fingerprint": error_fingerprint},
         )
 
+    def retry_later(self, wait: timedelta) -> None:
+        self.attempts += 1
+        self.scheduled_at = timezone.now() + wait
+        self.save(update_fields=("attempts", "scheduled_at"))
+        self.schedule()
+
     def reset_execution_counters(self):
-        self.executions = 0
-        self.error_executions = {}
-        self.save()
+        self.attempts = 0
+        self.save(update_fields=("attempts",))
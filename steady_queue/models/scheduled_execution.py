@@ -18,6 +18,11 @@ class ScheduledExecutionQuerySet(models.QuerySet):
     def next_batch(self, batch_size: int) -> Self:
         return self.due().in_order()[:batch_size]
 
+    def create_all_from_jobs(self, jobs):
+        return self.bulk_create(
+            [self.model(job=job, **self.model.attributes_from_job(job)) for job in jobs]
+        )
+
 
 class ScheduledExecution(Dispatching, Execution):
     class Meta:
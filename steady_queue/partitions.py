@@ -0,0 +1,397 @@
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Optional
+
+from django.db import connections, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+import steady_queue
+from steady_queue.arguments import Arguments
+from steady_queue.db_router import steady_queue_database_alias
+from steady_queue.models.job import Job
+from steady_queue.models.offloaded_arguments import OffloadedArguments
+
+logger = logging.getLogger("steady_queue")
+
+PERIODS = ("day", "week", "month")
+
+
+def period_start(moment: datetime, period: str) -> datetime:
+    """The start, in UTC, of the partition period that includes `moment`."""
+    start = moment.astimezone(dt_timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    if period == "week":
+        return start - timedelta(days=start.weekday())
+    if period == "month":
+        return start.replace(day=1)
+
+    return start
+
+
+def next_period_start(moment: datetime, period: str) -> datetime:
+    start = period_start(moment, period)
+    if period == "week":
+        return start + timedelta(weeks=1)
+    if period == "month":
+        return start.replace(
+            year=start.year + start.month // 12, month=start.month % 12 + 1
+        )
+
+    return start + timedelta(days=1)
+
+
+@dataclass
+class Partition:
+    name: str
+    starts_at: Optional[datetime]
+    ends_at: datetime
+
+    def __str__(self):
+        starts_at = self.starts_at.isoformat() if self.starts_at else "the beginning"
+        return f"{self.name} (from {starts_at} to {self.ends_at.isoformat()})"
+
+
+class JobPartitions:
+    """
+    Range partitions of the job table by `created_at`, on PostgreSQL.
+
+    `setup` turns the existing job table into the first partition of a new
+    partitioned table, without copying any rows, and `maintain` creates
+    partitions `ahead` periods in advance and drops (or detaches) those whose
+    jobs have all finished more than `steady_queue.clear_finished_jobs_after`
+    ago. Partitions holding jobs that haven't finished yet, such as failed
+    jobs, are kept until those jobs are retried, discarded or archived.
+    """
+
+    LEGACY_SUFFIX = "legacy"
+    # The first partition needs to cover rows created while the table is
+    # converted, so its upper bound is never closer than this.
+    MIN_LEAD_TIME = timedelta(hours=1)
+    BOUND = re.compile(r"FROM \((?:MINVALUE|'([^']+)')\) TO \('([^']+)'\)")
+
+    def __init__(
+        self,
+        period: Optional[str] = None,
+        ahead: Optional[int] = None,
+        using: Optional[str] = None,
+    ):
+        self.period = period or steady_queue.job_partition_period
+        if self.period not in PERIODS:
+            raise ValueError(
+                f'Invalid partition period "{self.period}". '
+                f"Expected one of: {', '.join(PERIODS)}"
+            )
+
+        self.ahead = steady_queue.job_partitions_ahead if ahead is None else ahead
+        self.using = using or steady_queue_database_alias()
+        self.table = Job._meta.db_table
+
+    @property
+    def connection(self):
+        return connections[self.using]
+
+    @property
+    def is_supported(self) -> bool:
+        return self.connection.vendor == "postgresql"
+
+    @property
+    def is_partitioned(self) -> bool:
+        if not self.is_supported:
+            return False
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+                [self.table],
+            )
+            return cursor.fetchone() is not None
+
+    def partitions(self) -> list[Partition]:
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+                "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = to_regclass(%s)",
+                [self.table],
+            )
+            rows = cursor.fetchall()
+
+        partitions = []
+        for name, bound in rows:
+            match = self.BOUND.search(bound)
+            if match is None:
+                logger.warning("ignoring job partition %s: %s", name, bound)
+                continue
+
+            starts_at, ends_at = match.groups()
+            partitions.append(
+                Partition(
+                    name=name,
+                    starts_at=parse_datetime(starts_at) if starts_at else None,
+                    ends_at=parse_datetime(ends_at),
+                )
+            )
+
+        return sorted(partitions, key=lambda partition: partition.ends_at)
+
+    def setup(self, concurrently: bool = True, now: Optional[datetime] = None) -> bool:
+        """
+        Partition the job table, keeping the existing table as a partition for
+        every job created until the end of the current period. Returns whether
+        the table was converted, i.e. ``False`` if it already was partitioned.
+
+        With ``concurrently``, the index and check constraint that let the
+        existing table be attached without scanning it are built first, without
+        blocking writes. The conversion itself holds an exclusive lock on the
+        job table, but only for as long as it takes to change the catalog.
+        """
+        if not self.is_supported:
+            raise NotImplementedError("Partitioning requires PostgreSQL")
+
+        if self.is_partitioned:
+            return False
+
+        now = now or timezone.now()
+        boundary = next_period_start(now, self.period)
+        if boundary - now < self.MIN_LEAD_TIME:
+            boundary = next_period_start(boundary, self.period)
+
+        if concurrently:
+            self.prepare(boundary, concurrently=True)
+
+        with transaction.atomic(using=self.using):
+            if not concurrently:
+                self.prepare(boundary, concurrently=False)
+            self.convert(boundary)
+            self.create_ahead(now)
+
+        return True
+
+    def prepare(self, boundary: datetime, concurrently: bool):
+        table = self.quote(self.table)
+        check = self.quote(f"{self.table}_legacy_bound")
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE UNIQUE INDEX {'CONCURRENTLY' if concurrently else ''} "
+                f"IF NOT EXISTS {self.quote(f'{self.table}_partition_key')} "
+                f"ON {table} (id, created_at)"
+            )
+            cursor.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {check}")
+            cursor.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {check} "
+                f"CHECK (created_at < {self.literal(boundary)}) NOT VALID"
+            )
+            cursor.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {check}")
+
+    def convert(self, boundary: datetime):
+        legacy_name = f"{self.table}_{self.LEGACY_SUFFIX}"
+        table, legacy = self.quote(self.table), self.quote(legacy_name)
+        sequence = f"{self.table}_id_seq"
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+
+            # Foreign keys can only reference a partitioned table through a
+            # unique constraint that includes created_at, so executions keep
+            # referencing jobs by id without a database constraint. Django
+            # cascades deletes itself either way.
+            cursor.execute(
+                "SELECT conrelid::regclass::text, conname FROM pg_constraint "
+                "WHERE confrelid = to_regclass(%s) AND contype = 'f'",
+                [self.table],
+            )
+            for referencing_table, constraint in cursor.fetchall():
+                cursor.execute(
+                    f"ALTER TABLE {referencing_table} "
+                    f"DROP CONSTRAINT {self.quote(constraint)}"
+                )
+
+            cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+            (last_id,) = cursor.fetchone()
+            cursor.execute(
+                f"ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY IF EXISTS"
+            )
+            cursor.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+            cursor.execute(f"DROP SEQUENCE IF EXISTS {self.quote(sequence)}")
+
+            cursor.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+            cursor.execute(
+                "SELECT conname FROM pg_constraint "
+                "WHERE conrelid = to_regclass(%s) AND contype = 'p'",
+                [legacy_name],
+            )
+            (primary_key,) = cursor.fetchone()
+            cursor.execute(
+                f"ALTER TABLE {legacy} RENAME CONSTRAINT {self.quote(primary_key)} "
+                f"TO {self.quote(f'{legacy_name}_pkey')}"
+            )
+            for index in Job._meta.indexes:
+                cursor.execute(
+                    f"ALTER INDEX IF EXISTS {self.quote(index.name)} "
+                    f"RENAME TO {self.quote(f'{index.name}_{self.LEGACY_SUFFIX}')}"
+                )
+            cursor.execute(
+                f"ALTER INDEX {self.quote(f'{self.table}_partition_key')} "
+                f"RENAME TO {self.quote(f'{legacy_name}_partition_key')}"
+            )
+
+            cursor.execute(
+                f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) "
+                "PARTITION BY RANGE (created_at)"
+            )
+            cursor.execute(
+                f"CREATE SEQUENCE {self.quote(sequence)} START WITH {last_id + 1} "
+                f"OWNED BY {table}.id"
+            )
+            cursor.execute(
+                f"ALTER TABLE {table} ALTER COLUMN id "
+                f"SET DEFAULT nextval('{self.quote(sequence)}')"
+            )
+            cursor.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, created_at)")
+
+        # Indexes created on the partitioned table take over the matching
+        # (renamed) indexes of the old table once it's attached.
+        with self.connection.schema_editor() as editor:
+            for index in Job._meta.indexes:
+                editor.add_index(Job, index)
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"ALTER TABLE {table} ATTACH PARTITION {legacy} "
+                f"FOR VALUES FROM (MINVALUE) TO ({self.literal(boundary)})"
+            )
+            cursor.execute(
+                f"ALTER TABLE {legacy} "
+                f"DROP CONSTRAINT {self.quote(f'{self.table}_legacy_bound')}"
+            )
+
+        logger.info("partitioned %s by created_at", self.table)
+
+    def create_ahead(self, now: Optional[datetime] = None) -> list[Partition]:
+        """
+        Create the partitions that are missing from the end of the last one
+        to the end of the period ``ahead`` periods from now.
+        """
+        now = now or timezone.now()
+        until = period_start(now, self.period)
+        for _ in range(self.ahead + 1):
+            until = next_period_start(until, self.period)
+
+        partitions = self.partitions()
+        start = partitions[-1].ends_at if partitions else period_start(now, self.period)
+
+        created = []
+        while start < until:
+            partition = Partition(
+                name=f"{self.table}_p{start:%Y%m%d}",
+                starts_at=start,
+                ends_at=next_period_start(start, self.period),
+            )
+            with self.connection.cursor() as cursor:
+                cursor.execute(
+                    f"CREATE TABLE {self.quote(partition.name)} "
+                    f"PARTITION OF {self.quote(self.table)} FOR VALUES "
+                    f"FROM ({self.literal(partition.starts_at)}) "
+                    f"TO ({self.literal(partition.ends_at)})"
+                )
+            logger.info("created job partition %s", partition)
+            created.append(partition)
+            start = partition.ends_at
+
+        return created
+
+    def expired(self, now: Optional[datetime] = None) -> list[Partition]:
+        """Partitions whose jobs have all finished before the retention period."""
+        cutoff = (now or timezone.now()) - steady_queue.clear_finished_jobs_after
+
+        expired = []
+        for partition in self.partitions():
+            if partition.ends_at > cutoff:
+                break
+
+            if self.is_clearable(partition, cutoff):
+                expired.append(partition)
+            else:
+                logger.info(
+                    "job partition %s can't be dropped yet: it has jobs that "
+                    "haven't finished or finished after %s",
+                    partition.name,
+                    cutoff.isoformat(),
+                )
+
+        return expired
+
+    def is_clearable(self, partition: Partition, cutoff: datetime) -> bool:
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT NOT EXISTS (SELECT 1 FROM {self.quote(partition.name)} "
+                "WHERE finished_at IS NULL OR finished_at >= %s)",
+                [cutoff],
+            )
+            return cursor.fetchone()[0]
+
+    def drop_expired(
+        self, now: Optional[datetime] = None, detach: Optional[bool] = None
+    ) -> list[Partition]:
+        """
+        Drop expired partitions or, with ``detach``, detach them from the job
+        table and keep them as standalone tables.
+        """
+        if detach is None:
+            detach = steady_queue.detach_expired_job_partitions
+
+        cutoff = (now or timezone.now()) - steady_queue.clear_finished_jobs_after
+        removed = []
+        for partition in self.expired(now):
+            with transaction.atomic(using=self.using):
+                # Check again in case jobs were added to the partition since.
+                if not self.is_clearable(partition, cutoff):
+                    continue
+
+                with self.connection.cursor() as cursor:
+                    if detach:
+                        cursor.execute(
+                            f"ALTER TABLE {self.quote(self.table)} "
+                            f"DETACH PARTITION {self.quote(partition.name)}"
+                        )
+                    else:
+                        offloaded = OffloadedArguments.objects.using(self.using)
+                        if offloaded.in_use():
+                            offloaded.release(self.offloaded_references(partition))
+                        cursor.execute(f"DROP TABLE {self.quote(partition.name)}")
+
+            logger.info(
+                "%s job partition %s", "detached" if detach else "dropped", partition
+            )
+            removed.append(partition)
+
+        return removed
+
+    def offloaded_references(self, partition: Partition) -> Counter:
+        """How many of a partition's jobs refer to each offloaded arguments."""
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT arguments #>> %s, COUNT(*) "
+                f"FROM {self.quote(partition.name)} "
+                "WHERE arguments #>> %s IS NOT NULL GROUP BY 1",
+                [f"{{arguments,{Arguments.OFFLOADED_KEY},sha256}}"] * 2,
+            )
+            return Counter(dict(cursor.fetchall()))
+
+    def maintain(
+        self, now: Optional[datetime] = None, detach: Optional[bool] = None
+    ) -> tuple[list[Partition], list[Partition]]:
+        return self.create_ahead(now), self.drop_expired(now, detach)
+
+    def quote(self, name: str) -> str:
+        return self.connection.ops.quote_name(name)
+
+    def literal(self, moment: datetime) -> str:
+        return f"'{moment.astimezone(dt_timezone.utc).isoformat()}'"
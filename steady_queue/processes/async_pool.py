@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from threading import Lock
+from typing import Callable, Optional
+
+from steady_queue.app_executor import AppExecutor
+from steady_queue.models.claimed_execution import ClaimedExecution
+from steady_queue.processes.concurrent import AtomicInteger
+from steady_queue.processes.errors import ExecutionTimeoutError
+from steady_queue.processes.pool import Pool, clear_interrupt, interrupt_thread
+
+logger = logging.getLogger("steady_queue")
+
+
+class AsyncPool:
+    """
+    A pool that runs claimed executions as coroutines on a single event loop.
+
+    Up to `size` executions can be in flight at the same time. Database
+    bookkeeping runs on a small thread pool of `threads` threads so it never
+    stalls the loop, and synchronous tasks on a separate one of `size`
+    threads, so that tasks that hang can't hold up the bookkeeping.
+
+    Synchronous tasks that time out are interrupted like in `Pool`, and their
+    threads abandoned if they're still running after the grace period.
+    """
+
+    size: int
+
+    def __init__(
+        self,
+        size: int,
+        on_idle: Callable,
+        worker_name: str = None,
+        threads: int = 3,
+    ):
+        self.size = size
+        self.threads = threads
+        self.on_idle = on_idle
+        self.worker_name = worker_name
+        self.available_threads = AtomicInteger(size)
+        self.mutex = Lock()
+        self.in_flight: set[int] = set()
+        # Threads running synchronous tasks, by call, and when those that were
+        # interrupted are to be abandoned.
+        self.task_threads: dict[object, int] = {}
+        self.interrupted: dict[object, float] = {}
+        self.abandoned_threads = 0
+        # The loop, its thread and the executors are created lazily so that
+        # they belong to the forked worker rather than to the supervisor.
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread: Optional[threading.Thread] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.task_executor: Optional[ThreadPoolExecutor] = None
+
+    def post(self, execution: ClaimedExecution, timeout: Optional[timedelta] = None):
+        self.available_threads.decrement()
+        self.start()
+
+        # Capture job metadata before handing the execution to the loop, since
+        # the execution record is deleted from the DB during aperform().
+        job_id = execution.job_id
+        class_name = execution.job.class_name
+        with self.mutex:
+            self.in_flight.add(job_id)
+
+        async def wrapped_execution():
+            try:
+                # Timed out coroutines are cancelled. Synchronous tasks keep
+                # running on their thread, but no longer hold a slot.
+                await execution.aperform(
+                    self.run_sync, timeout=timeout, run_task=self.run_task
+                )
+                logger.info(
+                    "%(worker)s completed job %(job_id)s %(class_name)s",
+                    {
+                        "worker": self.worker_name,
+                        "job_id": job_id,
+                        "class_name": class_name,
+                    },
+                )
+            finally:
+                self.available_threads.increment()
+                with self.mutex:
+                    self.in_flight.discard(job_id)
+                    if self.is_idle and self.on_idle:
+                        self.on_idle()
+
+        asyncio.run_coroutine_threadsafe(wrapped_execution(), self.loop)
+        logger.debug("posted execution %s", execution.pk)
+
+    async def run_sync(self, func: Callable, *args, **kwargs):
+        def wrapped():
+            with AppExecutor.wrap_in_app_executor():
+                return func(*args, **kwargs)
+
+        return await asyncio.get_running_loop().run_in_executor(self.executor, wrapped)
+
+    async def run_task(self, func: Callable, *args, **kwargs):
+        """
+        Run a synchronous task on the task executor. If the task is cancelled
+        after timing out, its thread is interrupted.
+        """
+        call = object()
+
+        def wrapped():
+            with AppExecutor.wrap_in_app_executor():
+                with self.mutex:
+                    self.task_threads[call] = threading.get_ident()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.stop_watching(call)
+
+        future = self.task_executor.submit(wrapped)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            with self.mutex:
+                if call in self.task_threads:
+                    interrupt_thread(self.task_threads[call])
+                    self.interrupted[call] = (
+                        time.monotonic() + Pool.INTERRUPT_GRACE_PERIOD.total_seconds()
+                    )
+            raise
+
+    def stop_watching(self, call: object):
+        while True:
+            try:
+                with self.mutex:
+                    self.task_threads.pop(call, None)
+                    if self.interrupted.pop(call, None) is not None:
+                        clear_interrupt(threading.get_ident())
+                return
+            except ExecutionTimeoutError:
+                continue
+
+    def enforce_timeouts(self, now: Optional[float] = None):
+        """
+        Abandon the threads of timed out synchronous tasks that haven't
+        stopped after being interrupted, so the worker can be recycled.
+        """
+        if now is None:
+            now = time.monotonic()
+
+        with self.mutex:
+            expired = [call for call, at in self.interrupted.items() if now >= at]
+            for call in expired:
+                del self.interrupted[call]
+            self.abandoned_threads += len(expired)
+
+        if expired:
+            logger.error(
+                "%(worker)s abandoning %(count)d threads of timed out tasks, "
+                "they could not be interrupted",
+                {"worker": self.worker_name, "count": len(expired)},
+            )
+
+    def start(self):
+        with self.mutex:
+            if self.loop is not None:
+                return
+
+            self.executor = ThreadPoolExecutor(max_workers=self.threads)
+            self.task_executor = ThreadPoolExecutor(max_workers=self.size)
+            self.loop = asyncio.new_event_loop()
+            self.loop_thread = threading.Thread(
+                target=self.loop.run_forever, daemon=True
+            )
+            self.loop_thread.start()
+
+    @property
+    def in_flight_job_ids(self) -> list[int]:
+        with self.mutex:
+            return list(self.in_flight)
+
+    @property
+    def idle_threads(self):
+        return self.available_threads.value
+
+    @property
+    def is_idle(self):
+        return self.available_threads.value > 0
+
+    def shutdown(self):
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+        if self.task_executor is not None:
+            self.task_executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,75 @@
+import logging
+import math
+import time
+from datetime import timedelta
+from typing import Optional
+
+from django.utils import timezone
+
+from steady_queue.configuration import Configuration
+from steady_queue.models.ready_execution import ReadyExecution
+
+logger = logging.getLogger("steady_queue")
+
+
+class Autoscaler:
+    """
+    Decides how many forks a worker configuration should have, between its
+    `min_processes` and `max_processes`, from the depth of its ready queues
+    and how long the oldest ready job has been waiting to be claimed.
+
+    Scaling up adds as many forks as needed to claim the whole backlog at
+    once; scaling down drains one fork at a time. Each direction has its own
+    cooldown, counted from the last change in either direction.
+    """
+
+    def __init__(self, options: Configuration.Worker):
+        self.options = options
+        self.min_processes = options.min_processes or 1
+        self.max_processes = options.max_processes
+        self.last_scaled_at = time.monotonic()
+
+    @property
+    def capacity(self) -> int:
+        """How many jobs a single fork can run at the same time."""
+        if self.options.pool == "asyncio":
+            return self.options.async_concurrency
+
+        return self.options.threads
+
+    def sample(self) -> tuple[int, timedelta]:
+        queues = self.options.queues
+        depth = ReadyExecution.objects.aggregated_count_across_queues(queues)
+        oldest = ReadyExecution.objects.oldest_created_at_across_queues(queues)
+        latency = timezone.now() - oldest if oldest is not None else timedelta(0)
+
+        return depth, latency
+
+    def desired_processes(
+        self, current: int, depth: int, latency: timedelta, now: Optional[float] = None
+    ) -> int:
+        if current < self.min_processes:
+            return self.min_processes
+
+        if current > self.max_processes:
+            return self.max_processes
+
+        if now is None:
+            now = time.monotonic()
+        elapsed = now - self.last_scaled_at
+
+        has_backlog = (
+            depth > current * self.capacity or latency >= self.options.target_latency
+        )
+        if has_backlog:
+            if elapsed >= self.options.scale_up_cooldown.total_seconds():
+                needed = current + math.ceil(depth / self.capacity)
+                return max(min(needed, self.max_processes), current)
+        elif depth == 0:
+            if elapsed >= self.options.scale_down_cooldown.total_seconds():
+                return max(current - 1, self.min_processes)
+
+        return current
+
+    def scaled(self, now: Optional[float] = None):
+        self.last_scaled_at = time.monotonic() if now is None else now
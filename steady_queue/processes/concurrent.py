@@ -21,6 +21,11 @@ class AtomicInteger:
             self._value -= 1
             return self._value
 
+    def add(self, delta: int) -> int:
+        with self._lock:
+            self._value += delta
+            return self._value
+
 
 class Dict:
     def __init__(self, *args, **kwargs):
@@ -7,6 +7,7 @@ from steady_queue.configuration import Configuration
 from steady_queue.models.blocked_execution import BlockedExecution
 from steady_queue.models.scheduled_execution import ScheduledExecution
 from steady_queue.models.semaphore import Semaphore
+from steady_queue.processes.job_cleaner import JobCleaner
 from steady_queue.processes.poller import Poller
 from steady_queue.processes.timer import TimerTask
 
@@ -16,6 +17,7 @@ logger = logging.getLogger("steady_queue")
 class Dispatcher(Poller):
     batch_size: int
     concurrency_maintenance: Optional["ConcurrencyMaintenance"] = None
+    job_cleaner: Optional[JobCleaner] = None
 
     def __init__(self, options: Configuration.Dispatcher):
         self.batch_size = options.batch_size
@@ -24,6 +26,12 @@ class Dispatcher(Poller):
                 interval=options.concurrency_maintenance_interval,
                 batch_size=options.batch_size,
             )
+        if options.clear_finished_jobs:
+            self.job_cleaner = JobCleaner(
+                interval=options.clear_finished_jobs_interval,
+                budget=options.clear_finished_jobs_budget,
+                batch_size=options.batch_size,
+            )
 
         super().__init__(polling_interval=options.polling_interval)
 
@@ -35,13 +43,18 @@ class Dispatcher(Poller):
             "concurrency_maintenance_interval": self.concurrency_maintenance.interval
             if self.concurrency_maintenance
             else None,
+            "clear_finished_jobs_interval": self.job_cleaner.interval
+            if self.job_cleaner
+            else None,
         }
 
     def boot(self):
         super().boot()
         self.start_concurrency_maintenance()
+        self.start_job_cleaner()
 
     def shutdown(self):
+        self.stop_job_cleaner()
         self.stop_concurrency_maintenance()
         super().shutdown()
 
@@ -62,6 +75,14 @@ class Dispatcher(Poller):
         if self.concurrency_maintenance:
             self.concurrency_maintenance.stop()
 
+    def start_job_cleaner(self):
+        if self.job_cleaner:
+            self.job_cleaner.start()
+
+    def stop_job_cleaner(self):
+        if self.job_cleaner:
+            self.job_cleaner.stop()
+
     @property
     def is_all_work_completed(self) -> bool:
         return ScheduledExecution.objects.count() == 0
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
 
@@ -9,3 +9,24 @@ class ProcessPrunedError(RuntimeError):
 
 class ProcessMissingError(RuntimeError):
     pass
+
+
+class ProcessExitError(RuntimeError):
+    def __init__(self, exitcode: Optional[int] = None):
+        self.exitcode = exitcode
+        super().__init__(f"process exited with code {exitcode}")
+
+
+class ClaimLeaseExpiredError(RuntimeError):
+    def __init__(self, lease_expires_at: Optional[datetime] = None):
+        self.lease_expires_at = lease_expires_at
+        super().__init__(f"claim lease expired at {lease_expires_at}")
+
+
+class ExecutionTimeoutError(RuntimeError):
+    def __init__(self, timeout: Optional[timedelta] = None):
+        self.timeout = timeout
+        if timeout is None:
+            super().__init__("execution timed out")
+        else:
+            super().__init__(f"execution timed out after {timeout}")
@@ -0,0 +1,92 @@
+import logging
+from typing import Any, Optional
+
+from steady_queue.processes.process_pool import run_task
+from steady_queue.task import SteadyQueueTask
+
+logger = logging.getLogger("steady_queue")
+
+try:
+    from concurrent.futures import InterpreterPoolExecutor
+except ImportError:  # Python < 3.14
+    InterpreterPoolExecutor = None
+
+
+def setup_interpreter():
+    import django
+
+    django.setup()
+
+
+def import_tasks(class_names: list[str]):
+    """Import tasks from their module paths, to check they load in here."""
+    from django.utils.module_loading import import_string
+
+    for class_name in class_names:
+        import_string(class_name)
+
+
+class InterpreterPool:
+    """
+    A pool of subinterpreters used to run pure-Python CPU-bound tasks in
+    parallel without starting extra processes. As with the ProcessPool, only
+    the task function runs in the subinterpreter, which receives the task's
+    serialized arguments.
+
+    On Python versions without InterpreterPoolExecutor, or if Django or the
+    tasks can't be loaded in a subinterpreter (extension modules such as
+    psycopg may not support them), tasks run on the worker's threads as if
+    the pool wasn't configured.
+    """
+
+    def __init__(self, tasks: list[str], size: int):
+        self.tasks = set(tasks)
+        self.size = size
+        self.executor = None
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        return InterpreterPoolExecutor is not None
+
+    def runs(self, class_name: str) -> bool:
+        return self.executor is not None and class_name in self.tasks
+
+    def start(self):
+        if not self.is_supported():
+            logger.warning(
+                "Subinterpreters are not available on this Python version, "
+                "running %s on threads instead",
+                ", ".join(sorted(self.tasks)),
+            )
+            return
+
+        executor = InterpreterPoolExecutor(
+            max_workers=self.size,
+            thread_name_prefix="steady_queue-interpreter",
+            initializer=setup_interpreter,
+        )
+        try:
+            executor.submit(import_tasks, sorted(self.tasks)).result()
+        except Exception as e:
+            logger.warning(
+                "Couldn't load %s in a subinterpreter, running them on threads "
+                "instead: %s",
+                ", ".join(sorted(self.tasks)),
+                e,
+            )
+            executor.shutdown(wait=False, cancel_futures=True)
+            return
+
+        self.executor = executor
+
+    def run(self, task: SteadyQueueTask, arguments: dict[str, Any]):
+        error: Optional[Exception] = self.executor.submit(
+            run_task, task.module_path, arguments
+        ).result()
+
+        if error is not None:
+            raise error
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
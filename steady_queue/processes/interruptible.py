@@ -40,7 +40,12 @@ class Interruptible:
 
     @cached_property
     def self_pipe(self) -> tuple[int, int]:
-        return os.pipe()
+        # Non-blocking, so that interrupting from a signal handler can never
+        # block on a full pipe.
+        read, write = os.pipe()
+        os.set_blocking(read, False)
+        os.set_blocking(write, False)
+        return read, write
 
     def shutdown(self):
         """Clean up pipe file descriptors."""
@@ -0,0 +1,135 @@
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from django.db import OperationalError
+from django.utils import timezone
+
+import steady_queue
+from steady_queue.app_executor import AppExecutor
+from steady_queue.exports import JobExporter
+from steady_queue.models.job import Job
+from steady_queue.models.recurring_execution import RecurringExecution
+from steady_queue.partitions import JobPartitions
+from steady_queue.processes.timer import TimerTask
+
+logger = logging.getLogger("steady_queue")
+
+
+class JobCleaner:
+    """
+    Clears finished jobs older than `steady_queue.clear_finished_jobs_after`,
+    and recurring executions whose job is gone, on behalf of a dispatcher.
+    When the job table is partitioned, it maintains its partitions instead of
+    deleting jobs one by one. When `steady_queue.export_finished_jobs_to` is
+    set, jobs are exported there before being deleted.
+
+    Each run deletes jobs in batches, walking the `finished_at` index, until
+    there are none left or the run has taken `budget`. The batch size doubles
+    while batches are fast and halves when they are slow, so that each delete
+    takes about `TARGET_BATCH_DURATION`. When a batch is much slower than that
+    or fails with a database error, the cleaner backs off exponentially before
+    the next one, giving up the rest of the run if it would exceed the budget.
+    """
+
+    MIN_BATCH_SIZE = 10
+    MAX_BATCH_SIZE = 10_000
+    TARGET_BATCH_DURATION = timedelta(seconds=0.5)
+    MIN_BACKOFF = timedelta(seconds=1)
+    MAX_BACKOFF = timedelta(seconds=30)
+
+    def __init__(self, interval: timedelta, budget: timedelta, batch_size: int):
+        self.interval = interval
+        self.budget = budget
+        self.batch_size = min(max(batch_size, self.MIN_BATCH_SIZE), self.MAX_BATCH_SIZE)
+        self.backoff = timedelta(0)
+        self.exporter = JobExporter.from_settings()
+
+    def start(self):
+        self.cleaner_task = TimerTask(
+            interval=self.interval, callable=self.run, jitter=0.1
+        )
+        self.cleaner_task.start()
+
+    def stop(self):
+        if hasattr(self, "cleaner_task"):
+            self.cleaner_task.stop()
+
+        if self.exporter is not None:
+            self.exporter.close()
+
+    def run(self):
+        with AppExecutor.wrap_in_app_executor():
+            partitions = JobPartitions()
+            if partitions.is_partitioned:
+                partitions.maintain()
+                cleared = 0
+            else:
+                cleared = self.clear_finished_jobs()
+            orphaned = RecurringExecution.objects.clear_in_batches(self.batch_size)
+
+        if cleared or orphaned:
+            logger.info(
+                "cleared %(jobs)d finished jobs and %(recurring)d orphaned "
+                "recurring executions",
+                {"jobs": cleared, "recurring": orphaned},
+            )
+
+    def clear_finished_jobs(self, deadline: Optional[float] = None) -> int:
+        if deadline is None:
+            deadline = time.monotonic() + self.budget.total_seconds()
+        # Fixed for the whole run, so that jobs finishing while it runs don't
+        # keep it going.
+        finished_before = timezone.now() - steady_queue.clear_finished_jobs_after
+
+        cleared = 0
+        after = None
+        while time.monotonic() < deadline:
+            started_at = time.monotonic()
+            try:
+                deleted, after = self.clear_batch(finished_before, after)
+            except OperationalError as e:
+                logger.warning("clearing finished jobs failed: %s", e)
+                self.back_off()
+            else:
+                cleared += deleted
+                self.adapt(timedelta(seconds=time.monotonic() - started_at))
+                if after is None:
+                    break
+
+            if self.backoff:
+                wait = self.backoff.total_seconds()
+                if time.monotonic() + wait >= deadline:
+                    break
+                logger.debug("database busy, backing off for %.1fs", wait)
+                time.sleep(wait)
+
+        return cleared
+
+    def clear_batch(
+        self, finished_before: datetime, after: Optional[tuple[datetime, int]]
+    ) -> tuple[int, Optional[tuple[datetime, int]]]:
+        if self.exporter is not None:
+            return self.exporter.export_batch(
+                self.batch_size, finished_before, after=after
+            )
+
+        return Job.objects.clear_finished_batch(
+            self.batch_size, finished_before, after=after
+        )
+
+    def adapt(self, duration: timedelta):
+        if duration > self.TARGET_BATCH_DURATION * 4:
+            self.back_off()
+            return
+
+        self.backoff = timedelta(0)
+        if duration > self.TARGET_BATCH_DURATION:
+            self.batch_size = max(self.batch_size // 2, self.MIN_BATCH_SIZE)
+        elif duration < self.TARGET_BATCH_DURATION / 2:
+            self.batch_size = min(self.batch_size * 2, self.MAX_BATCH_SIZE)
+
+    def back_off(self):
+        self.batch_size = max(self.batch_size // 2, self.MIN_BATCH_SIZE)
+        self.backoff = min(max(self.backoff * 2, self.MIN_BACKOFF), self.MAX_BACKOFF)
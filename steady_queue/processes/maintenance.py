@@ -1,10 +1,12 @@
 import logging
 
+from django.db import transaction
+
 import steady_queue
 from steady_queue.app_executor import AppExecutor
 from steady_queue.models.claimed_execution import ClaimedExecution
 from steady_queue.models.process import Process
-from steady_queue.processes.errors import ProcessMissingError
+from steady_queue.processes.errors import ClaimLeaseExpiredError, ProcessMissingError
 from steady_queue.processes.timer import TimerTask
 
 logger = logging.getLogger("steady_queue")
@@ -20,14 +22,52 @@ class Maintenance:
 
         self.maintenance_task.start()
 
+        if steady_queue.claim_lease_duration is not None:
+            self.lease_expiration_task = TimerTask(
+                interval=steady_queue.claim_lease_duration / 2,
+                callable=lambda: self.fail_executions_with_expired_lease(),
+            )
+            self.lease_expiration_task.start()
+
     def stop_maintenance_task(self):
         if hasattr(self, "maintenance_task"):
             self.maintenance_task.stop()
 
+        if hasattr(self, "lease_expiration_task"):
+            self.lease_expiration_task.stop()
+
     def fail_orphaned_executions(self):
         with AppExecutor.wrap_in_app_executor():
             ClaimedExecution.objects.orphaned().fail_all_with(ProcessMissingError())
 
+    def fail_executions_with_expired_lease(self):
+        with (
+            AppExecutor.wrap_in_app_executor(),
+            transaction.atomic(using=ClaimedExecution.objects.db),
+        ):
+            # Locking the executions rechecks their lease against the latest
+            # row, so a lease a worker has just renewed isn't failed, and
+            # renewals wait until those that did expire are failed.
+            expired = (
+                ClaimedExecution.objects.with_expired_lease()
+                .select_related("job")
+                .defer("job__arguments")
+                .select_for_update(skip_locked=True, of=("self",))
+                .iterator(chunk_size=50)
+            )
+            for execution in expired:
+                logger.warning(
+                    "claim lease of job %(job_id)s expired at %(expired_at)s",
+                    {
+                        "job_id": execution.job_id,
+                        "expired_at": execution.lease_expires_at,
+                    },
+                )
+                execution.failed_with(
+                    ClaimLeaseExpiredError(execution.lease_expires_at)
+                )
+                execution.unblock_next_job()
+
     def prune_dead_processes(self):
         logger.debug("pruning dead processes")
         with AppExecutor.wrap_in_app_executor():
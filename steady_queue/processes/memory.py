@@ -0,0 +1,39 @@
+import os
+import resource
+import sys
+from typing import Optional
+
+
+def rss_mb() -> float:
+    """Resident set size of the current process, in MiB."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError, IndexError):
+        # Without /proc we can only get the peak RSS, which is still a good
+        # enough upper bound for recycling decisions.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            return peak / 1024 / 1024
+
+        return peak / 1024
+
+
+def uss_mb() -> Optional[float]:
+    """
+    Unique set size of the current process, in MiB: the memory that would be
+    freed if the process exited, excluding pages shared with its parent.
+    Returns None where /proc/self/smaps_rollup isn't available.
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            private_kb = sum(
+                int(line.split()[1])
+                for line in f
+                if line.startswith(("Private_Clean:", "Private_Dirty:"))
+            )
+    except (OSError, ValueError, IndexError):
+        return None
+
+    return private_kb / 1024
@@ -1,38 +1,108 @@
+import ctypes
 import logging
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
 from threading import Lock
-from typing import Callable
+from typing import Callable, Optional
 
 from steady_queue.app_executor import AppExecutor
 from steady_queue.models.claimed_execution import ClaimedExecution
 from steady_queue.processes.concurrent import AtomicInteger
+from steady_queue.processes.errors import ExecutionTimeoutError
+from steady_queue.processes.interpreter_pool import InterpreterPool
+from steady_queue.processes.process_pool import ProcessPool
 
 logger = logging.getLogger("steady_queue")
 
 
+@dataclass
+class RunningExecution:
+    execution: ClaimedExecution
+    thread_id: int
+    timeout: timedelta
+    deadline: float
+    interrupted: bool = False
+
+
+def interrupt_thread(thread_id: int) -> bool:
+    """
+    Raise ExecutionTimeoutError in the thread with the given id the next time
+    it runs Python code. Threads blocked in C code (a socket read, a sleep in
+    an extension) won't notice until they return to the interpreter.
+    """
+    modified = ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(thread_id), ctypes.py_object(ExecutionTimeoutError)
+    )
+    return modified == 1
+
+
+def clear_interrupt(thread_id: int):
+    """Drop an ExecutionTimeoutError not yet raised in the given thread."""
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread_id), None)
+
+
 class Pool:
+    # How long a timed out execution is given to react to being interrupted
+    # before its thread is abandoned.
+    INTERRUPT_GRACE_PERIOD = timedelta(seconds=5)
+
     size: int
 
-    def __init__(self, size: int, on_idle: Callable, worker_name: str = None):
+    def __init__(
+        self,
+        size: int,
+        on_idle: Callable,
+        worker_name: str = None,
+        process_pool: Optional[ProcessPool] = None,
+        interpreter_pool: Optional[InterpreterPool] = None,
+        max_size: Optional[int] = None,
+    ):
         self.size = size
         self.on_idle = on_idle
         self.worker_name = worker_name
+        self.process_pool = process_pool
+        self.interpreter_pool = interpreter_pool
         self.available_threads = AtomicInteger(size)
         self.mutex = Lock()
-        self.executor = ThreadPoolExecutor(max_workers=size)
+        self.in_flight: set[int] = set()
+        self.running: dict[int, RunningExecution] = {}
+        self.abandoned: set[int] = set()
+        self.abandoned_threads = 0
+        # The executor only starts threads as they're needed, so it can be
+        # sized for the largest size the pool may be resized to.
+        self.executor = ThreadPoolExecutor(max_workers=max(size, max_size or 0))
+
+    def start(self):
+        if self.process_pool:
+            self.process_pool.start()
+
+        if self.interpreter_pool:
+            self.interpreter_pool.start()
 
-    def post(self, execution: ClaimedExecution):
+    def post(self, execution: ClaimedExecution, timeout: Optional[timedelta] = None):
         self.available_threads.decrement()
 
         # Capture job metadata before posting to the thread pool, since the
         # execution record is deleted from the DB during perform().
         job_id = execution.job_id
         class_name = execution.job.class_name
+        with self.mutex:
+            self.in_flight.add(job_id)
+        runner = self.runner_for(class_name)
+
+        def watch():
+            return self.watching(execution, timeout)
 
         def wrapped_execution():
             try:
                 with AppExecutor.wrap_in_app_executor():
-                    execution.perform()
+                    execution.perform(
+                        runner=runner, watch=watch if timeout is not None else None
+                    )
                     logger.info(
                         "%(worker)s completed job %(job_id)s %(class_name)s",
                         {
@@ -42,14 +112,136 @@ class Pool:
                         },
                     )
             finally:
-                self.available_threads.increment()
                 with self.mutex:
-                    if self.is_idle and self.on_idle:
-                        self.on_idle()
+                    abandoned = job_id in self.abandoned
+                    self.abandoned.discard(job_id)
+
+                # The watchdog already failed the execution and gave its slot
+                # back when it abandoned this thread.
+                if not abandoned:
+                    self.release(job_id)
 
         self.executor.submit(wrapped_execution)
         logger.debug("posted execution %s", execution.pk)
 
+    @contextmanager
+    def watching(self, execution: ClaimedExecution, timeout: timedelta):
+        """
+        Make the task call running in this thread interruptible by
+        `enforce_timeouts`, until it returns. Succeeding or failing the
+        execution afterwards can't be interrupted.
+        """
+        job_id = execution.job_id
+        with self.mutex:
+            self.running[job_id] = RunningExecution(
+                execution=execution,
+                thread_id=threading.get_ident(),
+                timeout=timeout,
+                deadline=time.monotonic() + timeout.total_seconds(),
+            )
+
+        try:
+            yield
+        finally:
+            self.stop_watching(job_id)
+
+    def stop_watching(self, job_id: int):
+        while True:
+            try:
+                with self.mutex:
+                    running = self.running.pop(job_id, None)
+                    if running is not None and running.interrupted:
+                        # The task returned before an interrupt sent right
+                        # before its deadline was raised.
+                        clear_interrupt(running.thread_id)
+                return
+            except ExecutionTimeoutError:
+                # Raised on the way out of the task call, which is done.
+                continue
+
+    def release(self, job_id: int):
+        self.available_threads.increment()
+        with self.mutex:
+            self.in_flight.discard(job_id)
+            if self.is_idle and self.on_idle:
+                self.on_idle()
+
+    def enforce_timeouts(self, now: Optional[float] = None):
+        """
+        Interrupt executions that have run past their timeout. Those that are
+        still running once the grace period is over are failed and their
+        threads abandoned, so the slot can be used again and the worker can be
+        recycled to get rid of them.
+        """
+        if now is None:
+            now = time.monotonic()
+        grace = self.INTERRUPT_GRACE_PERIOD.total_seconds()
+
+        with self.mutex:
+            expired = [
+                (job_id, running)
+                for job_id, running in self.running.items()
+                if now >= running.deadline
+            ]
+
+        for job_id, running in expired:
+            if not running.interrupted:
+                running.interrupted = True
+                logger.warning(
+                    "%(worker)s interrupting job %(job_id)s after %(timeout)s",
+                    {
+                        "worker": self.worker_name,
+                        "job_id": job_id,
+                        "timeout": running.timeout,
+                    },
+                )
+                with self.mutex:
+                    if job_id in self.running:
+                        interrupt_thread(running.thread_id)
+            elif now >= running.deadline + grace:
+                self.abandon(job_id, running)
+
+    def abandon(self, job_id: int, running: RunningExecution):
+        with self.mutex:
+            if self.running.pop(job_id, None) is None:
+                return
+            self.abandoned.add(job_id)
+            self.abandoned_threads += 1
+
+        logger.error(
+            "%(worker)s abandoning job %(job_id)s, its thread could not be interrupted",
+            {"worker": self.worker_name, "job_id": job_id},
+        )
+
+        with AppExecutor.wrap_in_app_executor():
+            running.execution.failed_with(ExecutionTimeoutError(running.timeout))
+            running.execution.unblock_next_job()
+
+        self.release(job_id)
+
+    def runner_for(self, class_name: str) -> Optional[Callable]:
+        if self.process_pool and self.process_pool.runs(class_name):
+            return self.process_pool.run
+
+        if self.interpreter_pool and self.interpreter_pool.runs(class_name):
+            return self.interpreter_pool.run
+
+        return None
+
+    def resize(self, size: int):
+        with self.mutex:
+            self.available_threads.add(size - self.size)
+            self.size = size
+
+    @property
+    def busy_threads(self):
+        return self.size - self.available_threads.value
+
+    @property
+    def in_flight_job_ids(self) -> list[int]:
+        with self.mutex:
+            return list(self.in_flight)
+
     @property
     def idle_threads(self):
         return self.available_threads.value
@@ -60,3 +252,8 @@ class Pool:
 
     def shutdown(self):
         self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.process_pool:
+            self.process_pool.shutdown()
+
+        if self.interpreter_pool:
+            self.interpreter_pool.shutdown()
@@ -0,0 +1,207 @@
+import logging
+import multiprocessing
+import pickle
+import queue
+from multiprocessing.connection import Connection
+from typing import Any, Optional
+
+from steady_queue.processes.errors import ProcessExitError
+from steady_queue.task import SteadyQueueTask
+
+logger = logging.getLogger("steady_queue")
+
+
+def run_child(conn: Connection):
+    """
+    Entry point of process pool children: run tasks sent over `conn` until the
+    parent asks us to stop or goes away.
+    """
+    import django
+
+    django.setup()
+
+    from django.db import connections
+
+    try:
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                break
+
+            if request is None:
+                break
+
+            conn.send(run_task(*request))
+    finally:
+        connections.close_all()
+
+
+def run_task(class_name: str, arguments: dict[str, Any]) -> Optional[Exception]:
+    """
+    Run a task from its module path and serialized arguments, returning the
+    error it raised, if any, in a form that can be sent back to the worker.
+    """
+    from django.utils.module_loading import import_string
+
+    from steady_queue.arguments import Arguments
+
+    try:
+        task = import_string(class_name)
+        args, kwargs = Arguments.deserialize_args_and_kwargs(arguments)
+        task.call(*args, **kwargs)
+    except Exception as e:
+        return picklable_error(e)
+
+    return None
+
+
+def picklable_error(error: Exception) -> Exception:
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(f"{error.__class__.__name__}: {error}")
+
+
+class ProcessSlot:
+    """
+    A single child process of a ProcessPool. Tasks sent to a slot run one at a
+    time, and the child is restarted after crashing or after running
+    `max_tasks_per_child` tasks.
+    """
+
+    def __init__(self, context, max_tasks_per_child: Optional[int] = None):
+        self.context = context
+        self.max_tasks_per_child = max_tasks_per_child
+        self.process = None
+        self.conn: Optional[Connection] = None
+        self.tasks_run = 0
+
+    @property
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def start(self):
+        parent_conn, child_conn = self.context.Pipe()
+        self.process = self.context.Process(
+            target=run_child, args=(child_conn,), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+        self.conn = parent_conn
+        self.tasks_run = 0
+
+    # How often to check for a reply from the child. Waiting in short polls
+    # rather than a blocking recv lets the timeout watchdog interrupt us.
+    POLL_INTERVAL = 0.1
+
+    def run(self, class_name: str, arguments: dict[str, Any]):
+        if not self.is_alive:
+            self.start()
+
+        try:
+            self.conn.send((class_name, arguments))
+            while not self.conn.poll(self.POLL_INTERVAL):
+                pass
+            error = self.conn.recv()
+        except (EOFError, OSError):
+            raise ProcessExitError(self.reap())
+        except BaseException:
+            # Interrupted, e.g. by a timeout, while the child may still be
+            # running the task. Its reply would be read by the next task sent
+            # to this slot, so replace the child.
+            self.restart()
+            raise
+
+        self.tasks_run += 1
+        if self.max_tasks_per_child and self.tasks_run >= self.max_tasks_per_child:
+            self.stop()
+
+        if error is not None:
+            raise error
+
+    def restart(self):
+        self.reap()
+        self.start()
+
+    def stop(self, timeout: float = 5):
+        if self.process is None:
+            return
+
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+
+        self.process.join(timeout)
+        self.reap()
+
+    def reap(self) -> Optional[int]:
+        if self.process is None:
+            return None
+
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        exitcode = self.process.exitcode
+
+        self.conn.close()
+        self.process = None
+        self.conn = None
+
+        return exitcode
+
+
+class ProcessPool:
+    """
+    A pool of pre-started child processes used to run CPU-bound tasks in
+    parallel. Claiming and completing executions stays in the worker: only the
+    task function runs in the child, which receives the task's serialized
+    arguments. A crashing child only fails the job it was running.
+    """
+
+    def __init__(
+        self,
+        tasks: list[str],
+        size: int,
+        max_tasks_per_child: Optional[int] = None,
+    ):
+        self.tasks = set(tasks)
+        self.size = size
+        # Children are spawned rather than forked because the worker is
+        # multi-threaded by the time they are (re)started.
+        context = multiprocessing.get_context("spawn")
+        self.slots = [ProcessSlot(context, max_tasks_per_child) for _ in range(size)]
+        self.idle_slots: queue.SimpleQueue[ProcessSlot] = queue.SimpleQueue()
+        for slot in self.slots:
+            self.idle_slots.put(slot)
+
+    def runs(self, class_name: str) -> bool:
+        return class_name in self.tasks
+
+    def start(self):
+        for slot in self.slots:
+            slot.start()
+
+    def run(self, task: SteadyQueueTask, arguments: dict[str, Any]):
+        slot = self.idle_slots.get()
+        try:
+            slot.run(task.module_path, arguments)
+        finally:
+            self.idle_slots.put(slot)
+
+    def shutdown(self):
+        # Only idle children are stopped here. Children still running a task
+        # are daemonic, so they are terminated when the worker exits.
+        while True:
+            try:
+                slot = self.idle_slots.get_nowait()
+            except queue.Empty:
+                break
+
+            try:
+                slot.stop(timeout=1)
+            except Exception as e:
+                logger.debug("error stopping process pool child: %s", e)
@@ -55,9 +55,13 @@ class Registrable(Base):
         return self.process is not None
 
     def launch_heartbeat(self):
+        if self.is_heartbeat_delegated:
+            return
+
         self.heartbeat_task = TimerTask(
             interval=steady_queue.process_heartbeat_interval,
             callable=lambda: self.heartbeat(),
+            jitter=0.1,
         )
 
         self.heartbeat_task.start()
@@ -81,6 +85,11 @@ class Registrable(Base):
                 self.process = None
                 self.wake_up()
 
+    @property
+    def is_heartbeat_delegated(self) -> bool:
+        # The supervisor heartbeats on behalf of its forks when configured to
+        return steady_queue.supervisor_heartbeats and self.supervisor is not None
+
     @property
     def process_id(self):
         if not self.is_registered:
@@ -1,5 +1,6 @@
 import logging
 
+from steady_queue.processes.memory import uss_mb
 from steady_queue.processes.supervised import Supervised
 
 logger = logging.getLogger("steady_queue")
@@ -26,6 +27,14 @@ class Runnable(Supervised):
         if self.is_running_as_fork:
             self.register_signal_handlers()
             self.set_procline()
+            self.log_unique_memory()
+
+    def log_unique_memory(self):
+        if (uss := uss_mb()) is not None:
+            logger.info(
+                "%(name)s booted using %(uss).1f MiB of unique memory",
+                {"name": self.name, "uss": uss},
+            )
 
     @property
     def is_shutting_down(self) -> bool:
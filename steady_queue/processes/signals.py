@@ -7,7 +7,7 @@ logger = logging.getLogger("steady_queue")
 
 
 class Signals:
-    SIGNALS = (signal.SIGQUIT, signal.SIGINT, signal.SIGTERM)
+    SIGNALS = (signal.SIGQUIT, signal.SIGINT, signal.SIGTERM, signal.SIGHUP)
     signal_queue: Optional[list] = None
     is_supervising: bool = False
 
@@ -48,6 +48,8 @@ class Signals:
         elif sig == signal.SIGQUIT:
             self.stop()
             self.terminate_immediately()
+        elif sig == signal.SIGHUP:
+            self.reload()
         else:
             logger.warning("Received unexpected signal %s", sig)
 
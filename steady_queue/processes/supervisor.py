@@ -1,25 +1,38 @@
+import gc
+import importlib
 import logging
 import os
 import signal
 import sys
+import time
 from datetime import timedelta
 from typing import Optional
 
+from django.conf import settings
+from django.tasks import task_backends
+from django.utils.module_loading import import_string
+
 import steady_queue
+from steady_queue.app_executor import AppExecutor
 from steady_queue.configuration import Configuration
 from steady_queue.models.process import Process
+from steady_queue.processes.autoscaler import Autoscaler
 from steady_queue.processes.base import Base
 from steady_queue.processes.interruptible import Interruptible
 from steady_queue.processes.maintenance import Maintenance
 from steady_queue.processes.pidfiled import Pidfiled
 from steady_queue.processes.registrable import Registrable
 from steady_queue.processes.signals import Signals
-from steady_queue.processes.timer import wait_until
 
 logger = logging.getLogger("steady_queue")
 
 
 class Supervisor(Maintenance, Signals, Pidfiled, Registrable, Interruptible, Base):
+    AUTOSCALE_INTERVAL = timedelta(seconds=5)
+    # Forks exiting and signals wake the supervisor up, so this is only an
+    # upper bound for how long it sleeps when there's nothing else to do.
+    IDLE_TIMEOUT = timedelta(minutes=1)
+
     @classmethod
     def launch(cls, options: Optional[Configuration.Options] = None) -> None:
         configuration = Configuration(options)
@@ -36,6 +49,12 @@ class Supervisor(Maintenance, Signals, Pidfiled, Registrable, Interruptible, Bas
         self.configuration = configuration
         self.forks: dict[int, Base] = {}
         self.configured_processes: dict[int, Configuration.Process] = {}
+        self.draining_forks: set[int] = set()
+        self.retiring_forks: list[int] = []
+        # Forks whose registration was found by the last delegated heartbeat.
+        self.registered_forks: set[int] = set()
+        self.autoscalers = self.build_autoscalers(configuration)
+        self.last_autoscaled_at = time.monotonic()
 
         super().__init__()
 
@@ -45,6 +64,7 @@ class Supervisor(Maintenance, Signals, Pidfiled, Registrable, Interruptible, Bas
             self.boot()
             # Fork only after resetting DB state (connections + psycopg pools).
             self.reset_database_connections()
+            self.preload()
             self.start_processes()
             self.launch_maintenance_task()
         except SystemExit:
@@ -58,6 +78,32 @@ class Supervisor(Maintenance, Signals, Pidfiled, Registrable, Interruptible, Bas
         super().boot()
         self.fail_orphaned_executions()
 
+    def preload(self) -> None:
+        """
+        Import everything forks will need before forking, so that they share
+        it with the supervisor instead of each importing it on first use, and
+        freeze the garbage collector so that collections in the forks don't
+        write to (and thus copy) the pages holding those objects.
+        """
+        if not steady_queue.preload_app:
+            return
+
+        for backend in task_backends.all():
+            logger.debug("preloaded task backend %s", backend.alias)
+
+        for path in self.configuration.task_paths:
+            try:
+                import_string(path)
+            except ImportError as e:
+                logger.warning("could not preload task %s: %s", path, e)
+
+        gc.collect()
+        gc.freeze()
+        logger.info(
+            "preloaded application, %(count)d objects frozen",
+            {"count": gc.get_freeze_count()},
+        )
+
     def start_processes(self) -> None:
         for process in self.configuration.configured_processes:
             self.start_process(process)
@@ -75,7 +121,9 @@ class Supervisor(Maintenance, Signals, Pidfiled, Registrable, Interruptible, Bas
 
                 if not self.is_stopped:
                     self.reap_and_replace_terminated_forks()
-                    self.interruptible_sleep(timedelta(seconds=1))
+                    self.retire_next_fork()
+                    self.autoscale()
+                    self.interruptible_sleep(self.next_wake_up)
         finally:
             logger.debug("supervisor finally block")
             self.shutdown()
@@ -86,8 +134,14 @@ class Supervisor(Maintenance, Signals, Pidfiled, Registrable, Interruptible, Bas
         instance.supervisor = self.process
         instance.mode = "fork"
 
+        if steady_queue.preload_app:
+            # Also freeze whatever was allocated since preloading, e.g. when
+            # replacing a fork, which includes the instance itself.
+            gc.freeze()
+
         if (pid := os.fork()) == 0:
             # child
+            self.restore_default_signal_handlers()
             instance.start()
             sys.exit(0)  # Ensure child process exits after instance.start()
 
@@ -96,6 +150,169 @@ class Supervisor(Maintenance, Signals, Pidfiled, Registrable, Interruptible, Bas
         self.configured_processes[pid] = process
         self.forks[pid] = instance
 
+    def reload(self) -> None:
+        """
+        Re-read STEADY_QUEUE from the settings module and roll forks over to
+        the new configuration: forks whose configuration didn't change are
+        kept, new ones are started right away and the rest are drained one at
+        a time afterwards, so capacity never drops.
+        """
+        logger.info("reloading configuration")
+        try:
+            configuration = Configuration(self.reload_options())
+        except Exception as e:
+            logger.error("could not reload configuration: %s", e)
+            return
+
+        if not configuration.is_valid:
+            logger.error(
+                "Invalid Steady Queue configuration, keeping the current one: "
+                "%(errors)s",
+                {"errors": "\n".join([e.message for e in configuration.errors])},
+            )
+            return
+
+        to_start = list(configuration.configured_processes)
+        for pid, process in list(self.configured_processes.items()):
+            if pid in self.draining_forks or pid in self.retiring_forks:
+                continue
+
+            if process in to_start:
+                new_process = to_start.pop(to_start.index(process))
+            else:
+                new_process = self.autoscaled_process_for(process, configuration)
+
+            if new_process is None:
+                self.retiring_forks.append(pid)
+            else:
+                # Point kept forks to the new configuration objects, which
+                # are what autoscalers use to find their forks.
+                self.configured_processes[pid] = new_process
+
+        self.configuration = configuration
+        self.autoscalers = self.build_autoscalers(configuration)
+
+        logger.info(
+            "starting %(started)d and retiring %(retired)d processes",
+            {"started": len(to_start), "retired": len(self.retiring_forks)},
+        )
+        for process in to_start:
+            self.start_process(process)
+
+    def reload_options(self) -> Optional[Configuration.Options]:
+        if not settings.SETTINGS_MODULE:
+            raise RuntimeError("settings weren't loaded from a module")
+
+        module = importlib.reload(importlib.import_module(settings.SETTINGS_MODULE))
+        return getattr(module, "STEADY_QUEUE", None)
+
+    def autoscaled_process_for(
+        self, process: Configuration.Process, configuration: Configuration
+    ) -> Optional[Configuration.Process]:
+        # Autoscaled workers can have more forks than they boot with, and all
+        # of them are kept as long as their configuration didn't change.
+        if process.kind != "worker":
+            return None
+
+        for worker in configuration.options.workers:
+            if worker.is_autoscaled and worker == process.attributes:
+                return Configuration.Process(kind="worker", attributes=worker)
+
+        return None
+
+    def retire_next_fork(self) -> None:
+        # Forks are retired one at a time: the next one only starts draining
+        # once the previous one is gone.
+        while self.retiring_forks and self.retiring_forks[0] not in self.forks:
+            self.retiring_forks.pop(0)
+
+        if self.retiring_forks and self.retiring_forks[0] not in self.draining_forks:
+            self.drain_fork(self.retiring_forks[0])
+
+    def build_autoscalers(self, configuration: Configuration) -> list[Autoscaler]:
+        return [
+            Autoscaler(worker)
+            for worker in configuration.options.workers
+            if worker.is_autoscaled
+        ]
+
+    def autoscale(self) -> None:
+        if not self.autoscalers:
+            return
+
+        now = time.monotonic()
+        if now - self.last_autoscaled_at < self.AUTOSCALE_INTERVAL.total_seconds():
+            return
+        self.last_autoscaled_at = now
+
+        for autoscaler in self.autoscalers:
+            try:
+                depth, latency = autoscaler.sample()
+            except Exception as e:
+                logger.warning("could not sample queues for autoscaling: %s", e)
+                continue
+
+            pids = self.autoscaled_forks(autoscaler)
+            desired = autoscaler.desired_processes(len(pids), depth, latency, now)
+            if desired == len(pids):
+                continue
+
+            logger.info(
+                "autoscaling workers for queues %(queues)s from %(current)d to "
+                "%(desired)d (%(depth)d ready, oldest waiting %(latency)s)",
+                {
+                    "queues": ",".join(autoscaler.options.queues),
+                    "current": len(pids),
+                    "desired": desired,
+                    "depth": depth,
+                    "latency": latency,
+                },
+            )
+            autoscaler.scaled(now)
+
+            for _ in range(desired - len(pids)):
+                self.start_process(
+                    Configuration.Process(kind="worker", attributes=autoscaler.options)
+                )
+
+            for pid in pids[desired:]:
+                self.drain_fork(pid)
+
+    def autoscaled_forks(self, autoscaler: Autoscaler) -> list[int]:
+        return [
+            pid
+            for pid, process in self.configured_processes.items()
+            if process.attributes is autoscaler.options
+            and pid not in self.draining_forks
+        ]
+
+    def drain_fork(self, pid: int) -> None:
+        from steady_queue.processes.worker import Worker
+
+        self.draining_forks.add(pid)
+        if self.configured_processes[pid].kind == "worker":
+            self.signal_process(pid, Worker.DRAIN_SIGNAL)
+        else:
+            # Other processes don't run jobs, so they can just stop.
+            self.signal_process(pid, signal.SIGTERM)
+
+    @property
+    def next_wake_up(self) -> timedelta:
+        if not self.autoscalers:
+            return self.IDLE_TIMEOUT
+
+        elapsed = timedelta(seconds=time.monotonic() - self.last_autoscaled_at)
+        return max(self.AUTOSCALE_INTERVAL - elapsed, timedelta(0))
+
+    def register_signal_handlers(self) -> None:
+        super().register_signal_handlers()
+        # Wake up as soon as a fork exits to reap it (and replace it) right away
+        signal.signal(signal.SIGCHLD, lambda *args: self.interrupt())
+
+    def restore_default_signal_handlers(self) -> None:
+        super().restore_default_signal_handlers()
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
     def set_procline(self) -> None:
         pass
 
@@ -103,9 +320,19 @@ class Supervisor(Maintenance, Signals, Pidfiled, Registrable, Interruptible, Bas
         logger.info("terminating gracefully")
         self.term_forks()
 
-        for _ in wait_until(
-            steady_queue.shutdown_timeout, lambda: self.are_all_forks_terminated
-        ):
+        timeout = steady_queue.shutdown_timeout.total_seconds()
+        deadline = time.monotonic() + timeout
+
+        self.reap_terminated_forks()
+        while not self.are_all_forks_terminated:
+            if timeout > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.interruptible_sleep(timedelta(seconds=remaining))
+            else:
+                self.interruptible_sleep(self.IDLE_TIMEOUT)
+
             self.reap_terminated_forks()
 
         if not self.are_all_forks_terminated:
@@ -116,6 +343,34 @@ class Supervisor(Maintenance, Signals, Pidfiled, Registrable, Interruptible, Bas
         logger.warning("terminating immediately")
         self.quit_forks()
 
+    def heartbeat(self) -> None:
+        if steady_queue.supervisor_heartbeats and self.process is not None:
+            # Forks don't heartbeat on their own in this mode: the supervisor
+            # vouches for all of its live forks in a single statement.
+            with AppExecutor.wrap_in_app_executor():
+                supervisees = self.process.supervisees.filter(pid__in=list(self.forks))
+                supervisees.heartbeat()
+                self.stop_pruned_forks(set(supervisees.values_list("pid", flat=True)))
+
+        super().heartbeat()
+
+    def stop_pruned_forks(self, registered: set[int]) -> None:
+        """
+        Forks that don't heartbeat on their own can't notice that their
+        registration was pruned, and their claimed executions released. Stop
+        those whose registration was there before and is now gone, to have
+        them replaced. Forks that haven't registered yet are left alone.
+        """
+        pruned = (self.registered_forks - registered) & self.forks.keys()
+        self.registered_forks = registered
+
+        if pruned:
+            logger.warning(
+                "stopping forks %s, whose registration was pruned",
+                ", ".join(map(str, sorted(pruned))),
+            )
+            self.signal_processes(pruned, signal.SIGTERM)
+
     def shutdown(self) -> None:
         self.stop_maintenance_task()
         super().shutdown()
@@ -157,12 +412,24 @@ class Supervisor(Maintenance, Signals, Pidfiled, Registrable, Interruptible, Bas
                 self.handle_claimed_jobs_by(terminated_fork, wait_status)
 
             self.configured_processes.pop(pid, None)
+            self.draining_forks.discard(pid)
 
     def replace_fork(self, pid: int, exitcode: int) -> None:
-        logger.info("replacing fork %s due to exit code %s", pid, exitcode)
         if terminated_fork := self.forks.pop(pid, None):
-            self.handle_claimed_jobs_by(terminated_fork, exitcode)
-            self.start_process(self.configured_processes.pop(pid))
+            configured_process = self.configured_processes.pop(pid)
+
+            # Forks exit cleanly when they're recycled or drained, after
+            # finishing their work, so there's nothing to fail then.
+            if not os.WIFEXITED(exitcode) or os.WEXITSTATUS(exitcode) != 0:
+                self.handle_claimed_jobs_by(terminated_fork, exitcode)
+
+            if pid in self.draining_forks or pid in self.retiring_forks:
+                logger.info("fork %s drained, not replacing it", pid)
+                self.draining_forks.discard(pid)
+                return
+
+            logger.info("replacing fork %s due to exit code %s", pid, exitcode)
+            self.start_process(configured_process)
 
     def handle_claimed_jobs_by(self, terminated_fork: Base, exitcode: int) -> None:
         if not self.process:
@@ -0,0 +1,90 @@
+import logging
+import os
+import time
+from datetime import timedelta
+
+from django.db import connections
+
+from steady_queue.db_router import steady_queue_database_alias
+from steady_queue.processes.pool import Pool
+
+logger = logging.getLogger("steady_queue")
+
+
+def process_cpu_time() -> float:
+    times = os.times()
+    return times.user + times.system
+
+
+def is_database_pool_saturated() -> bool:
+    # Only Django's PostgreSQL backend exposes a connection pool, and only
+    # when it's configured in the database OPTIONS.
+    pool = getattr(connections[steady_queue_database_alias()], "pool", None)
+    if pool is None:
+        return False
+
+    return pool.get_stats().get("requests_waiting", 0) > 0
+
+
+class ThreadTuner:
+    """
+    Periodically resizes a worker's thread pool between `min_threads` and
+    `max_threads`.
+
+    Threads are added while all of them are busy and the process is mostly
+    waiting on I/O, since more jobs can then run without competing for the
+    GIL. They are removed when the process is CPU-bound, where extra threads
+    only add contention, or when threads are waiting for a database
+    connection from the pool.
+    """
+
+    INTERVAL = timedelta(seconds=10)
+
+    # Fractions of a CPU core used by the process
+    CPU_BOUND = 0.85
+    IO_BOUND = 0.5
+
+    def __init__(self, pool: Pool, min_threads: int, max_threads: int):
+        self.pool = pool
+        self.min_threads = min_threads
+        self.max_threads = max_threads
+        self.last_sampled_at = time.monotonic()
+        self.last_cpu_time = process_cpu_time()
+
+    def tune(self):
+        now, cpu_time = time.monotonic(), process_cpu_time()
+        elapsed = now - self.last_sampled_at
+        cpu_usage = (cpu_time - self.last_cpu_time) / elapsed if elapsed > 0 else 0
+        self.last_sampled_at, self.last_cpu_time = now, cpu_time
+
+        current = self.pool.size
+        desired = self.desired_threads(
+            current,
+            is_saturated=self.pool.idle_threads <= 0,
+            cpu_usage=cpu_usage,
+            is_database_saturated=is_database_pool_saturated(),
+        )
+
+        if desired != current:
+            logger.info(
+                "resizing thread pool from %(current)d to %(desired)d threads "
+                "(%(cpu).0f%% CPU)",
+                {"current": current, "desired": desired, "cpu": cpu_usage * 100},
+            )
+            self.pool.resize(desired)
+
+    def desired_threads(
+        self,
+        current: int,
+        is_saturated: bool,
+        cpu_usage: float,
+        is_database_saturated: bool,
+    ) -> int:
+        if is_database_saturated or cpu_usage >= self.CPU_BOUND:
+            desired = current - 1
+        elif is_saturated and cpu_usage < self.IO_BOUND:
+            desired = current + max(1, current // 4)
+        else:
+            desired = current
+
+        return min(max(desired, self.min_threads), self.max_threads)
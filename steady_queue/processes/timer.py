@@ -1,30 +1,130 @@
+import heapq
+import itertools
 import logging
+import os
+import queue
+import random
 import threading
 import time
 from datetime import timedelta
-from typing import Callable
+from typing import Callable, Optional
 
 logger = logging.getLogger("steady_queue")
 
 
-def wait_until(timeout: timedelta, condition: Callable):
-    timeout_seconds: float = timeout.total_seconds()
-    if timeout_seconds > 0:
-        deadline = time.monotonic() + timeout_seconds
+class TimerWheel:
+    """
+    Runs every TimerTask of a process from a heap on a single scheduler
+    thread. Due callables are handed to reusable worker threads, one per
+    started task. Since a task never runs concurrently with itself, a
+    crashing or slow callable (such as the job cleaner) doesn't delay the
+    scheduler or the other tasks, like heartbeats.
+
+    There's one wheel per process: forks get a fresh one the first time they
+    start a timer task.
+    """
+
+    _instance: Optional["TimerWheel"] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "TimerWheel":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                cls._instance.start()
+
+            return cls._instance
+
+    @classmethod
+    def reset_after_fork(cls):
+        # Threads don't survive a fork, and the locks they held may be left
+        # acquired, so the child must not reuse its parent's wheel.
+        cls._instance = None
+        cls._instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.tasks: set["TimerTask"] = set()
+        self.workers = 0
+        self.heap: list[tuple[float, int, "TimerTask", int]] = []
+        self.counter = itertools.count()
+        self.condition = threading.Condition()
+        self.due: queue.SimpleQueue[tuple["TimerTask", int]] = queue.SimpleQueue()
+
+    def start(self):
+        threading.Thread(
+            target=self.run, name="steady_queue-timer", daemon=True
+        ).start()
+
+    def add(self, task: "TimerTask"):
+        """Keep a worker thread for each started task, starting one if needed."""
+        with self.condition:
+            self.tasks.add(task)
+            while self.workers < len(self.tasks):
+                threading.Thread(
+                    target=self.work,
+                    name=f"steady_queue-timer-{self.workers}",
+                    daemon=True,
+                ).start()
+                self.workers += 1
+
+    def remove(self, task: "TimerTask"):
+        # Idle worker threads are kept for the tasks started later.
+        with self.condition:
+            self.tasks.discard(task)
+
+    def schedule(self, task: "TimerTask", generation: int, delay: float):
+        with self.condition:
+            heapq.heappush(
+                self.heap,
+                (time.monotonic() + delay, next(self.counter), task, generation),
+            )
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.heap:
+                    self.condition.wait()
+
+                run_at, _, task, generation = self.heap[0]
+                if not task.is_current(generation):
+                    heapq.heappop(self.heap)
+                    continue
+
+                delay = run_at - time.monotonic()
+                if delay > 0:
+                    self.condition.wait(delay)
+                    continue
+
+                heapq.heappop(self.heap)
+
+            self.due.put((task, generation))
 
-        while time.monotonic() < deadline and not condition():
-            time.sleep(0.1)
-            yield
-    else:
-        while not condition():
-            time.sleep(0.5)
-            yield
+    def work(self):
+        while True:
+            task, generation = self.due.get()
+            if not task.is_current(generation):
+                continue
+
+            task.perform_task()
+
+            # Tasks are rescheduled only once they're done, so a task never
+            # runs concurrently with itself.
+            if task.is_current(generation):
+                self.schedule(task, generation, task.next_delay())
+
+
+os.register_at_fork(after_in_child=TimerWheel.reset_after_fork)
 
 
 class TimerTask:
     """
-    A task that runs periodically in a separate thread to provide as much
-    isolation as possible, inspired by Ruby's Concurrent::TimerTask.
+    A task that runs periodically, inspired by Ruby's Concurrent::TimerTask.
+
+    All timer tasks of a process share a TimerWheel. `jitter` randomly
+    spreads each run by up to that fraction of the interval, so that processes
+    started together don't all run their tasks at the same time.
     """
 
     def __init__(
@@ -32,48 +132,43 @@ class TimerTask:
         interval: timedelta,
         callable: Callable,
         run_now: bool = False,
+        jitter: float = 0,
     ):
         self.interval = interval
         self.callable = callable
         self.run_now = run_now
-        self._stop_event = threading.Event()
+        self.jitter = jitter
+        # Bumped on every start and stop, so that runs scheduled before the
+        # task was stopped (or restarted) are discarded.
+        self.generation = 0
+        self.is_running = False
+
+    def is_current(self, generation: int) -> bool:
+        return self.is_running and generation == self.generation
 
     def start(self):
-        self.thread = threading.Thread(target=self.run, daemon=True)
-        self.thread.start()
+        self.generation += 1
+        self.is_running = True
+        wheel = TimerWheel.instance()
+        wheel.add(self)
+        wheel.schedule(self, self.generation, 0 if self.run_now else self.next_delay())
 
     def stop(self):
-        self._stop_event.set()  # Signal the thread to wake up
-
-        time.sleep(0.1)
-        if self.thread.is_alive():
-            logger.warning(
-                "timer task did not stop within timeout, may still be running"
-            )
-
-        self.thread.join(timeout=0.1)
+        # Stopped tasks are dropped by the wheel the next time they're due. A
+        # run already in progress is left to finish on its own.
+        self.generation += 1
+        self.is_running = False
+        TimerWheel.instance().remove(self)
         logger.debug("timer task stopped")
 
-    def run(self):
-        if self.run_now:
-            self.perform_task()
-
-        while not self._stop_event.is_set():
-            # Use Event.wait() for efficient interruptible sleep
-            logger.debug("timer task waiting for %s", self.interval)
-            if self._stop_event.wait(timeout=self.interval.total_seconds()):
-                # Event was set (stop was called), break out of loop
-                break
+    def next_delay(self) -> float:
+        interval = self.interval.total_seconds()
+        if self.jitter:
+            interval *= 1 + random.uniform(-self.jitter, self.jitter)
 
-            self.perform_task()
+        return max(interval, 0)
 
     def perform_task(self):
-        # Run the callable in a separate thread to isolate crashes
-        work_thread = threading.Thread(target=self.wrapped_callable, daemon=True)
-        work_thread.start()
-        work_thread.join()
-
-    def wrapped_callable(self):
         try:
             self.callable()
         except Exception as e:
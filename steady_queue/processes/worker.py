@@ -1,38 +1,219 @@
 import logging
+import os
+import signal
+import time
 from datetime import timedelta
+from typing import Optional
 
 from django.db import models
+from django.utils.module_loading import import_string
 
+import steady_queue
+from steady_queue.app_executor import AppExecutor
+from steady_queue.cancellation import CancelledJobs
 from steady_queue.configuration import Configuration
+from steady_queue.models.claimed_execution import ClaimedExecution
+from steady_queue.models.job import Job
 from steady_queue.models.ready_execution import ReadyExecution
+from steady_queue.processes.async_pool import AsyncPool
+from steady_queue.processes.interpreter_pool import InterpreterPool
+from steady_queue.processes.memory import rss_mb
 from steady_queue.processes.poller import Poller
 from steady_queue.processes.pool import Pool
+from steady_queue.processes.process_pool import ProcessPool
+from steady_queue.processes.thread_tuner import ThreadTuner
+from steady_queue.processes.timer import TimerTask
 
 logger = logging.getLogger("steady_queue")
 
 
 class Worker(Poller):
-    pool: Pool
+    # Sent by the supervisor to drain a worker when scaling down
+    DRAIN_SIGNAL = signal.SIGUSR2
+    WATCHDOG_INTERVAL = timedelta(seconds=1)
+
+    pool: Pool | AsyncPool
 
     def __init__(self, options: Configuration.Worker):
         self.queues = options.queues
+        self.max_jobs = options.max_jobs
+        self.max_rss_mb = options.max_rss_mb
+        self.max_age = options.max_age
+        self.timeouts = options.timeouts
+        self.claimed_jobs_count = 0
+        self.started_at = time.monotonic()
+        self.recycle_reason: Optional[str] = None
 
         super().__init__(polling_interval=options.polling_interval)
 
-        self.pool = Pool(
-            options.threads, on_idle=lambda: self.wake_up(), worker_name=self.name
+        self.pool = self.build_pool(options)
+        self.thread_tuner = self.build_thread_tuner(options)
+
+    def build_pool(self, options: Configuration.Worker) -> Pool | AsyncPool:
+        if options.pool == "asyncio":
+            return AsyncPool(
+                options.async_concurrency,
+                on_idle=lambda: self.wake_up(),
+                worker_name=self.name,
+                threads=options.threads,
+            )
+
+        return Pool(
+            options.threads,
+            on_idle=lambda: self.wake_up(),
+            worker_name=self.name,
+            process_pool=self.build_process_pool(options),
+            interpreter_pool=self.build_interpreter_pool(options),
+            max_size=options.max_threads,
+        )
+
+    def build_process_pool(self, options: Configuration.Worker) -> ProcessPool | None:
+        if options.process_pool is None:
+            return None
+
+        return ProcessPool(
+            options.process_pool.tasks,
+            size=options.process_pool.processes,
+            max_tasks_per_child=options.process_pool.max_tasks_per_child,
+        )
+
+    def build_interpreter_pool(
+        self, options: Configuration.Worker
+    ) -> InterpreterPool | None:
+        if options.interpreter_pool is None:
+            return None
+
+        return InterpreterPool(
+            options.interpreter_pool.tasks,
+            size=options.interpreter_pool.interpreters,
+        )
+
+    def build_thread_tuner(self, options: Configuration.Worker) -> ThreadTuner | None:
+        if options.max_threads is None or options.pool != "threads":
+            return None
+
+        return ThreadTuner(
+            self.pool,
+            min_threads=options.min_threads or 1,
+            max_threads=options.max_threads,
+        )
+
+    def boot(self):
+        self.started_at = time.monotonic()
+        super().boot()
+        self.pool.start()
+        self.launch_thread_tuner()
+        self.launch_lease_renewal()
+        self.launch_watchdog()
+        self.launch_cancellation_check()
+
+    def launch_thread_tuner(self):
+        if self.thread_tuner is None:
+            return
+
+        self.thread_tuner_task = TimerTask(
+            interval=ThreadTuner.INTERVAL, callable=self.thread_tuner.tune
+        )
+        self.thread_tuner_task.start()
+
+    def stop_thread_tuner(self):
+        if hasattr(self, "thread_tuner_task"):
+            self.thread_tuner_task.stop()
+
+    def launch_lease_renewal(self):
+        if steady_queue.claim_lease_duration is None:
+            return
+
+        self.lease_renewal_task = TimerTask(
+            interval=steady_queue.claim_lease_duration / 3,
+            callable=self.renew_leases,
+        )
+        self.lease_renewal_task.start()
+
+    def stop_lease_renewal(self):
+        if hasattr(self, "lease_renewal_task"):
+            self.lease_renewal_task.stop()
+
+    def renew_leases(self):
+        # Only jobs the pool is actually running get their leases renewed, so
+        # claimed executions the worker lost track of expire.
+        job_ids = self.pool.in_flight_job_ids
+        if not job_ids or self.process_id is None:
+            return
+
+        with AppExecutor.wrap_in_app_executor():
+            ClaimedExecution.objects.filter(
+                process_id=self.process_id, job_id__in=job_ids
+            ).renew_leases()
+
+    def launch_cancellation_check(self):
+        self.cancellation_check_task = TimerTask(
+            interval=steady_queue.process_heartbeat_interval,
+            callable=self.check_cancellations,
         )
+        self.cancellation_check_task.start()
+
+    def stop_cancellation_check(self):
+        if hasattr(self, "cancellation_check_task"):
+            self.cancellation_check_task.stop()
+
+    def check_cancellations(self):
+        job_ids = self.pool.in_flight_job_ids
+        if not job_ids:
+            CancelledJobs.replace(())
+            return
+
+        with AppExecutor.wrap_in_app_executor():
+            cancelled = Job.objects.filter(id__in=job_ids).cancelled()
+            CancelledJobs.replace(cancelled.values_list("id", flat=True))
+
+    def launch_watchdog(self):
+        # Task timeouts can only be known once jobs are claimed, so the
+        # watchdog always runs.
+        self.watchdog_task = TimerTask(
+            interval=self.WATCHDOG_INTERVAL, callable=self.watchdog
+        )
+        self.watchdog_task.start()
+
+    def stop_watchdog(self):
+        if hasattr(self, "watchdog_task"):
+            self.watchdog_task.stop()
+
+    def watchdog(self):
+        self.pool.enforce_timeouts()
+
+        # Abandoned threads can't be stopped, so the only way to get rid of
+        # them is to replace this process.
+        if self.pool.abandoned_threads and self.recycle_reason is None:
+            self.recycle("hung job")
+
+    def timeout_for(self, execution: ClaimedExecution) -> Optional[timedelta]:
+        try:
+            task = import_string(execution.job.class_name)
+        except ImportError:
+            task = None
+
+        if getattr(task, "timeout", None) is not None:
+            return task.timeout
+
+        return self.timeouts.get(execution.job.queue_name, self.timeouts.get("*"))
 
     @property
     def metadata(self):
         return {
             **super().metadata,
             "queues": ",".join(self.queues),
+            "pool": type(self.pool).__name__,
             "thread_pool_size": self.pool.size,
         }
 
     def poll(self) -> timedelta:
+        if self.is_recycling:
+            self.drain()
+            return self.polling_interval
+
         claimed_executions = self.claim_executions()
+        self.claimed_jobs_count += len(claimed_executions)
         for execution in claimed_executions:
             logger.info(
                 "%(worker)s claimed job %(job_id)s %(class_name)s",
@@ -42,23 +223,80 @@ class Worker(Poller):
                     "class_name": execution.job.class_name,
                 },
             )
-            self.pool.post(execution)
+            self.pool.post(execution, timeout=self.timeout_for(execution))
 
         return self.polling_interval if self.pool.is_idle else timedelta(minutes=10)
 
     def claim_executions(self) -> models.QuerySet:
-        return ReadyExecution.objects.claim(
-            self.queues, self.pool.idle_threads, self.process_id
+        limit = self.pool.idle_threads
+        if self.max_jobs is not None:
+            limit = min(limit, self.max_jobs - self.claimed_jobs_count)
+
+        return ReadyExecution.objects.claim(self.queues, limit, self.process_id)
+
+    def register_signal_handlers(self):
+        super().register_signal_handlers()
+        signal.signal(self.DRAIN_SIGNAL, lambda *args: self.recycle("scale down"))
+
+    @property
+    def is_recycling(self) -> bool:
+        if self.recycle_reason is None and (reason := self.exceeded_limit()):
+            self.recycle(f"exceeded {reason}")
+
+        return self.recycle_reason is not None
+
+    def recycle(self, reason: str):
+        self.recycle_reason = reason
+        logger.info(
+            "%(worker)s draining in-flight jobs before exiting (%(reason)s)",
+            {"worker": self.name, "reason": reason},
         )
+        self.wake_up()
+
+    def exceeded_limit(self) -> Optional[str]:
+        if self.max_jobs is not None and self.claimed_jobs_count >= self.max_jobs:
+            return f"max_jobs ({self.max_jobs})"
+
+        if self.max_age is not None and (
+            time.monotonic() - self.started_at >= self.max_age.total_seconds()
+        ):
+            return f"max_age ({self.max_age})"
+
+        if self.max_rss_mb is not None and rss_mb() >= self.max_rss_mb:
+            return f"max_rss_mb ({self.max_rss_mb})"
+
+        return None
+
+    def drain(self):
+        # Stop once every in-flight job has finished. The pool wakes us up
+        # whenever a thread becomes idle, so we don't need to poll for this.
+        # Exiting cleanly lets the supervisor replace this worker without
+        # failing any claimed executions.
+        if self.pool.idle_threads == self.pool.size:
+            self.stop()
 
     def shutdown(self):
         # NOTE: waiting before threads currently running are done with a timeout
         # (the equivalent of `wait_for_termination` in Ruby) is not supported by
         # the executor in our thread pool, so here we're effectively terminating
         # them immediately.
+        self.stop_thread_tuner()
+        self.stop_lease_renewal()
+        self.stop_watchdog()
+        self.stop_cancellation_check()
         self.pool.shutdown()
         super().shutdown()
 
+        # The executor's threads aren't daemonic, so the interpreter would wait
+        # forever for a hung one at exit. Its execution has already failed.
+        if self.pool.abandoned_threads and self.is_running_as_fork:
+            logger.warning(
+                "%(worker)s exiting with %(count)d hung threads",
+                {"worker": self.name, "count": self.pool.abandoned_threads},
+            )
+            logging.shutdown()
+            os._exit(0)
+
     @property
     def is_all_work_completed(self) -> bool:
         return ReadyExecution.objects.aggregated_count_across_queues(self.queues) == 0
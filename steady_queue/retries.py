@@ -0,0 +1,60 @@
+import random
+from dataclasses import dataclass, replace
+from datetime import timedelta
+from typing import Optional
+
+from steady_queue.task import SteadyQueueTask
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How a task is retried when it fails. The wait before the n-th retry is
+    ``wait * backoff ** (n - 1)``, capped at ``max_wait`` and then extended by
+    a random fraction of up to ``jitter`` so that jobs that failed together
+    don't all retry together.
+    """
+
+    attempts: int = 5
+    wait: timedelta = timedelta(seconds=3)
+    backoff: float = 2
+    max_wait: Optional[timedelta] = None
+    jitter: float = 0.15
+    retry_on: tuple[type[Exception], ...] = (Exception,)
+
+    def retries(self, error: Exception, attempts: int) -> bool:
+        """Whether to retry after the given number of failed attempts."""
+        return attempts < self.attempts and isinstance(error, self.retry_on)
+
+    def wait_before(self, attempts: int) -> timedelta:
+        wait = self.wait * self.backoff ** (attempts - 1)
+        if self.max_wait is not None:
+            wait = min(wait, self.max_wait)
+
+        return wait * (1 + random.uniform(0, self.jitter))
+
+
+def retry_on(
+    *exceptions: type[Exception],
+    attempts: int = 5,
+    wait: timedelta = timedelta(seconds=3),
+    backoff: float = 2,
+    max_wait: Optional[timedelta] = None,
+    jitter: float = 0.15,
+):
+    if attempts < 1:
+        raise ValueError("attempts must be at least 1")
+
+    policy = RetryPolicy(
+        attempts=attempts,
+        wait=wait,
+        backoff=backoff,
+        max_wait=max_wait,
+        jitter=jitter,
+        retry_on=exceptions or (Exception,),
+    )
+
+    def wrapper(task: SteadyQueueTask):
+        return replace(task, retry_policy=policy)
+
+    return wrapper
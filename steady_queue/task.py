@@ -1,6 +1,6 @@
 import datetime
 from dataclasses import dataclass
-from typing import Any, Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 from django.tasks import Task, TaskResult
 from django.utils import timezone, translation
@@ -8,6 +8,9 @@ from django.utils.module_loading import import_string
 
 from steady_queue.arguments import Arguments
 
+if TYPE_CHECKING:
+    from steady_queue.retries import RetryPolicy
+
 
 class UnknownTaskClassError(Exception):
     pass
@@ -23,6 +26,10 @@ class SteadyQueueTask(Task):
     concurrency_duration: Optional[timezone.timedelta] = None
     concurrency_group: Optional[str] = None
 
+    timeout: Optional[timezone.timedelta] = None
+
+    retry_policy: Optional["RetryPolicy"] = None
+
     def __post_init__(self):
         self.get_backend().validate_task(self)
 
@@ -64,7 +71,7 @@ class SteadyQueueTask(Task):
     def execute(cls, job_data: dict[str, Any]):
         args, kwargs = Arguments.deserialize_args_and_kwargs(job_data["arguments"])
         task = cls.deserialize(job_data)
-        task.func(*args, **kwargs)
+        task.call(*args, **kwargs)
 
     @classmethod
     def deserialize(cls, job_data: dict[str, Any]):
@@ -0,0 +1,11 @@
+from dataclasses import replace
+from datetime import timedelta
+
+from steady_queue.task import SteadyQueueTask
+
+
+def times_out_after(duration: timedelta):
+    def wrapper(task: SteadyQueueTask):
+        return replace(task, timeout=duration)
+
+    return wrapper
@@ -1,9 +1,12 @@
 import time
+from datetime import timedelta
 
 from django.tasks import task
 
 from steady_queue.concurrency import limits_concurrency
 from steady_queue.recurring_task import recurring
+from steady_queue.retries import retry_on
+from steady_queue.timeouts import times_out_after
 
 
 @task()
@@ -32,6 +35,35 @@ def update_all_names(name):
         dummy.save()
 
 
+@task()
+async def async_dummy_task(name: str = "world"):
+    print(f"hello {name}, from async_dummy_task")
+
+
+@task()
+def cpu_bound_task(rounds: int = 1000):
+    import hashlib
+
+    data = b"cpu-bound-task"
+    for _ in range(rounds):
+        data = hashlib.sha256(data).digest()
+
+
+@task()
+def subinterpreter_task():
+    from concurrent import interpreters
+
+    if interpreters.get_current().id == interpreters.get_main().id:
+        raise RuntimeError("not running in a subinterpreter")
+
+
+@task()
+def crashing_task():
+    import os
+
+    os._exit(1)
+
+
 @task()
 def long_running_task():
     print("long running task")
@@ -39,6 +71,26 @@ def long_running_task():
     print("long running task finished")
 
 
+@times_out_after(timedelta(seconds=1))
+@task()
+def timing_out_task():
+    print("timing out task")
+    time.sleep(10)
+
+
+@retry_on(ValueError, attempts=2, wait=timedelta(minutes=1), jitter=0)
+@task()
+def flaky_task(error: str = "ValueError"):
+    raise {"ValueError": ValueError, "KeyError": KeyError}[error]("flaky")
+
+
+@task(takes_context=True)
+def cancellable_task(context, steps: int = 3):
+    for step in range(steps):
+        context.raise_if_cancelled()
+        print(f"cancellable task step {step}")
+
+
 @limits_concurrency(key="limited_task")
 @task()
 def limited_task(duration: int = 10):
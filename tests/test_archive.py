@@ -0,0 +1,83 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from steady_queue.bulk_operations import BulkOperation
+from steady_queue.fingerprints import fingerprint
+from steady_queue.models import ArchivedJob, FailedExecution, Job, ReadyExecution
+from tests.dummy.tasks import dummy_task, task_with_args
+
+
+class ArchiveTestCase(TestCase):
+    def failed_job(self, task=dummy_task, args=None, failed_ago=timedelta(days=30)):
+        job = Job.objects.enqueue(task, args or [], {})
+        job.ready_execution.delete()
+        job.failed_with("ValueError: order 1 not found")
+        FailedExecution.objects.filter(job=job).update(
+            created_at=timezone.now() - failed_ago
+        )
+        return job
+
+    def test_archive_moves_failed_jobs(self):
+        job = self.failed_job(task_with_args, ["Alice"])
+
+        count = BulkOperation.matching().archive()
+
+        self.assertEqual(count, 1)
+        self.assertFalse(Job.objects.filter(pk=job.pk).exists())
+        self.assertEqual(FailedExecution.objects.count(), 0)
+        archived = ArchivedJob.objects.get(job_id=job.pk)
+        self.assertEqual(archived.class_name, task_with_args.module_path)
+        self.assertEqual(archived.arguments, job.arguments)
+        self.assertEqual(archived.error, "ValueError: order 1 not found")
+        self.assertEqual(
+            archived.fingerprint, fingerprint("ValueError: order 1 not found")
+        )
+
+    def test_archive_only_old_failures(self):
+        self.failed_job()
+        recent = self.failed_job(failed_ago=timedelta(hours=1))
+
+        count = BulkOperation.matching(
+            until=timezone.now() - timedelta(days=7)
+        ).archive()
+
+        self.assertEqual(count, 1)
+        self.assertTrue(FailedExecution.objects.filter(job=recent).exists())
+
+    def test_restore_enqueues_archived_jobs_again(self):
+        job = self.failed_job(task_with_args, ["Alice"])
+        BulkOperation.matching().archive()
+
+        count = BulkOperation.matching(status="archived").restore()
+
+        self.assertEqual(count, 1)
+        self.assertEqual(ArchivedJob.objects.count(), 0)
+        restored = Job.objects.get()
+        self.assertEqual(restored.arguments, job.arguments)
+        self.assertTrue(ReadyExecution.objects.filter(job=restored).exists())
+
+    def test_restore_in_chunks(self):
+        for name in ("Alice", "Bob", "Carol"):
+            self.failed_job(task_with_args, [name])
+        BulkOperation.matching().archive()
+
+        count = BulkOperation.matching(status="archived", batch_size=2).restore()
+
+        self.assertEqual(count, 3)
+        self.assertEqual(ArchivedJob.objects.count(), 0)
+        self.assertEqual(ReadyExecution.objects.count(), 3)
+
+    def test_archive_and_restore_commands(self):
+        self.failed_job()
+        stdout = StringIO()
+
+        call_command("steady_queue_jobs", "archive", "--older-than", "7", stdout=stdout)
+        call_command("steady_queue_jobs", "restore", stdout=stdout)
+
+        self.assertIn("archive: 1 jobs", stdout.getvalue())
+        self.assertIn("restore: 1 jobs", stdout.getvalue())
+        self.assertEqual(ReadyExecution.objects.count(), 1)
@@ -1,9 +1,17 @@
 from datetime import date, datetime, time, timedelta, timezone
+from unittest import skipIf
+from unittest.mock import patch
 
 from django.test import SimpleTestCase, TestCase
 from django.utils import timezone as dj_tz
 
-from steady_queue.arguments import Arguments
+import steady_queue
+from steady_queue.arguments import (
+    Arguments,
+    DeserializationError,
+    SerializationError,
+    zstd,
+)
 from tests.dummy.models import Dummy
 
 
@@ -97,6 +105,52 @@ class TestArguments(SimpleTestCase):
         self.assertEqual(kwargs, deserialized_kwargs)
 
 
+@patch.object(steady_queue, "compress_arguments_over", 1024)
+class TestArgumentsCompression(SimpleTestCase):
+    payload = {"rows": [{"id": i, "name": "Alice"} for i in range(500)]}
+
+    def test_small_arguments_are_not_compressed(self):
+        serialized = Arguments.serialize_args_and_kwargs([1, "a"], {})
+
+        self.assertEqual(serialized, {"args": [1, "a"], "kwargs": {}})
+
+    def test_large_arguments_are_compressed(self):
+        serialized = Arguments.serialize_args_and_kwargs([], self.payload)
+
+        self.assertEqual(list(serialized), [Arguments.COMPRESSED_KEY])
+        self.assertEqual(serialized[Arguments.COMPRESSED_KEY]["codec"], "zlib")
+        self.assertEqual(
+            Arguments.deserialize_args_and_kwargs(serialized), ([], self.payload)
+        )
+
+    @skipIf(zstd is None, "requires Python 3.14")
+    def test_zstd(self):
+        with patch.object(steady_queue, "arguments_compression", "zstd"):
+            serialized = Arguments.serialize_args_and_kwargs([self.payload], {})
+
+        self.assertEqual(serialized[Arguments.COMPRESSED_KEY]["codec"], "zstd")
+        self.assertEqual(
+            Arguments.deserialize_args_and_kwargs(serialized), ([self.payload], {})
+        )
+
+    def test_compression_can_be_disabled(self):
+        with patch.object(steady_queue, "compress_arguments_over", None):
+            serialized = Arguments.serialize_args_and_kwargs([], self.payload)
+
+        self.assertNotIn(Arguments.COMPRESSED_KEY, serialized)
+
+    def test_invalid_codec(self):
+        with patch.object(steady_queue, "arguments_compression", "lz4"):
+            with self.assertRaises(SerializationError):
+                Arguments.serialize_args_and_kwargs([], self.payload)
+
+    def test_corrupt_payload(self):
+        with self.assertRaises(DeserializationError):
+            Arguments.deserialize_args_and_kwargs(
+                {Arguments.COMPRESSED_KEY: {"codec": "zlib", "data": "bm9wZQ=="}}
+            )
+
+
 class TestModelSerialization(TestCase):
     def test_model_serialization(self):
         saved_instance = Dummy.objects.create(name="test")
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+from contextlib import nullcontext
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from steady_queue.models import ClaimedExecution, Job, Process, ReadyExecution
+from steady_queue.processes.async_pool import AsyncPool
+from tests.dummy.tasks import async_dummy_task
+
+
+class AsyncPoolTestCase(SimpleTestCase):
+    def build_execution(self, job_id=1):
+        execution = MagicMock()
+        execution.job_id = job_id
+        execution.job.class_name = "tests.dummy.tasks.async_dummy_task"
+        execution.pk = job_id
+        execution.aperform = AsyncMock()
+        return execution
+
+    def test_post_awaits_execution_on_event_loop(self):
+        pool = AsyncPool(size=10, on_idle=lambda: None)
+        execution = self.build_execution()
+
+        pool.post(execution)
+        time.sleep(0.2)
+        pool.shutdown()
+
+        execution.aperform.assert_awaited_once_with(
+            pool.run_sync, timeout=None, run_task=pool.run_task
+        )
+
+    def test_available_slots_are_released_after_execution(self):
+        idle_calls = []
+        pool = AsyncPool(size=2, on_idle=lambda: idle_calls.append(True))
+
+        pool.post(self.build_execution(1))
+        pool.post(self.build_execution(2))
+        time.sleep(0.2)
+        pool.shutdown()
+
+        self.assertEqual(pool.idle_threads, 2)
+        self.assertTrue(pool.is_idle)
+        self.assertGreater(len(idle_calls), 0)
+
+    @patch(
+        "steady_queue.processes.async_pool.AppExecutor.wrap_in_app_executor",
+        nullcontext,
+    )
+    def test_hung_sync_tasks_dont_hold_up_bookkeeping(self):
+        pool = AsyncPool(size=2, on_idle=lambda: None, threads=1)
+        pool.start()
+        self.addCleanup(pool.shutdown)
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        async def time_out():
+            with self.assertRaises(TimeoutError):
+                await asyncio.wait_for(pool.run_task(release.wait), 0.05)
+            return await pool.run_sync(lambda: "done")
+
+        result = asyncio.run_coroutine_threadsafe(time_out(), pool.loop).result(2)
+
+        self.assertEqual(result, "done")
+        pool.enforce_timeouts(now=time.monotonic() + 60)
+        self.assertEqual(pool.abandoned_threads, 1)
+
+    def test_event_loop_is_started_lazily(self):
+        pool = AsyncPool(size=1, on_idle=lambda: None)
+
+        self.assertIsNone(pool.loop)
+
+
+class AsyncTaskPerformTestCase(TestCase):
+    def claim(self):
+        process = Process.objects.create(
+            name="async-worker",
+            kind="worker",
+            pid=12345,
+            hostname="test-host",
+            last_heartbeat_at=timezone.now(),
+        )
+        ReadyExecution.objects.claim(queue_list=["*"], limit=1, process_id=process.id)
+        return ClaimedExecution.objects.get()
+
+    def test_perform_runs_async_task_from_sync_worker(self):
+        job = Job.objects.enqueue(async_dummy_task, ["Alice"], {})
+
+        self.claim().perform()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, "finished")
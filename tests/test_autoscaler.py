@@ -0,0 +1,123 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, TestCase
+
+from steady_queue.configuration import Configuration
+from steady_queue.processes.autoscaler import Autoscaler
+from steady_queue.processes.supervisor import Supervisor
+from steady_queue.processes.worker import Worker
+from tests.dummy.tasks import dummy_task
+
+
+class AutoscalerTestCase(SimpleTestCase):
+    def build_autoscaler(self, **options) -> Autoscaler:
+        options = {
+            "threads": 5,
+            "min_processes": 1,
+            "max_processes": 4,
+            "scale_up_cooldown": timedelta(seconds=30),
+            "scale_down_cooldown": timedelta(minutes=5),
+            **options,
+        }
+        autoscaler = Autoscaler(Configuration.Worker(**options))
+        autoscaler.scaled(now=0)
+        return autoscaler
+
+    def test_scales_up_to_claim_the_backlog(self):
+        autoscaler = self.build_autoscaler()
+
+        self.assertEqual(autoscaler.desired_processes(1, 12, timedelta(0), now=60), 4)
+
+    def test_scales_up_when_jobs_wait_too_long(self):
+        autoscaler = self.build_autoscaler()
+
+        self.assertEqual(
+            autoscaler.desired_processes(1, 1, timedelta(seconds=10), now=60), 2
+        )
+
+    def test_never_exceeds_max_processes(self):
+        autoscaler = self.build_autoscaler()
+
+        self.assertEqual(autoscaler.desired_processes(4, 1000, timedelta(0), now=60), 4)
+
+    def test_waits_for_scale_up_cooldown(self):
+        autoscaler = self.build_autoscaler()
+
+        self.assertEqual(autoscaler.desired_processes(1, 12, timedelta(0), now=10), 1)
+
+    def test_scales_down_one_at_a_time_when_idle(self):
+        autoscaler = self.build_autoscaler()
+
+        self.assertEqual(autoscaler.desired_processes(3, 0, timedelta(0), now=60), 3)
+        self.assertEqual(autoscaler.desired_processes(3, 0, timedelta(0), now=301), 2)
+
+    def test_never_goes_below_min_processes(self):
+        autoscaler = self.build_autoscaler(min_processes=2)
+
+        self.assertEqual(autoscaler.desired_processes(2, 0, timedelta(0), now=301), 2)
+        self.assertEqual(autoscaler.desired_processes(1, 0, timedelta(0), now=0), 2)
+
+    def test_initial_processes_are_within_bounds(self):
+        options = Configuration.Worker(processes=1, min_processes=2, max_processes=4)
+
+        self.assertEqual(options.initial_processes, 2)
+
+
+class AutoscalerSampleTestCase(TestCase):
+    def test_sample_reports_depth_and_latency(self):
+        dummy_task.enqueue()
+        autoscaler = Autoscaler(Configuration.Worker(max_processes=2))
+
+        depth, latency = autoscaler.sample()
+
+        self.assertEqual(depth, 1)
+        self.assertGreaterEqual(latency, timedelta(0))
+
+
+class SupervisorAutoscaleTestCase(SimpleTestCase):
+    def setUp(self):
+        self.worker_options = Configuration.Worker(
+            threads=5, min_processes=1, max_processes=4
+        )
+        options = Configuration.Options(
+            workers=[self.worker_options],
+            dispatchers=[],
+            recurring_tasks=[],
+            skip_recurring=True,
+        )
+        self.supervisor = Supervisor(Configuration(options))
+        self.supervisor.last_autoscaled_at = 0
+        self.supervisor.start_process = MagicMock()
+        self.supervisor.signal_process = MagicMock()
+        self.autoscaler = self.supervisor.autoscalers[0]
+        self.autoscaler.last_scaled_at = 0
+
+        for pid in (101, 102):
+            self.supervisor.forks[pid] = MagicMock()
+            self.supervisor.configured_processes[pid] = Configuration.Process(
+                kind="worker", attributes=self.worker_options
+            )
+
+    def test_starts_forks_when_scaling_up(self):
+        with patch.object(self.autoscaler, "sample", return_value=(20, timedelta(0))):
+            self.supervisor.autoscale()
+
+        self.assertEqual(self.supervisor.start_process.call_count, 2)
+
+    def test_drains_forks_when_scaling_down(self):
+        with patch.object(self.autoscaler, "sample", return_value=(0, timedelta(0))):
+            self.supervisor.autoscale()
+
+        self.supervisor.signal_process.assert_called_once_with(102, Worker.DRAIN_SIGNAL)
+        self.assertEqual(self.supervisor.draining_forks, {102})
+
+    def test_drained_forks_are_not_replaced(self):
+        self.supervisor.draining_forks.add(102)
+        self.supervisor.handle_claimed_jobs_by = MagicMock()
+
+        self.supervisor.replace_fork(102, 0)
+
+        self.supervisor.start_process.assert_not_called()
+        self.supervisor.handle_claimed_jobs_by.assert_not_called()
+        self.assertNotIn(102, self.supervisor.configured_processes)
@@ -1,8 +1,12 @@
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
 from django.tasks import TaskResultStatus
 from django.test import TestCase
 from django.utils import timezone
 
-from steady_queue.models import Job, Process, ReadyExecution
+from steady_queue.models import Job, Process, ReadyExecution, ScheduledExecution
 from tests.dummy.tasks import dummy_task, task_with_args
 
 
@@ -52,6 +56,59 @@ class BackendEnqueueTestCase(TestCase):
         self.assertEqual(result.task.module_path, dummy_task.module_path)
 
 
+class BackendBulkEnqueueTestCase(TestCase):
+    """Tests for enqueue_all() and the async enqueue API."""
+
+    def test_enqueue_all_creates_ready_jobs(self):
+        """enqueue_all() should insert every job and make it ready."""
+        backend = dummy_task.get_backend()
+
+        results = backend.enqueue_all(
+            [(dummy_task, [], {}), (task_with_args, ["Alice"], {})]
+        )
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(Job.objects.count(), 2)
+        self.assertEqual(ReadyExecution.objects.count(), 2)
+        self.assertEqual(
+            {r.id for r in results},
+            {str(pk) for pk in Job.objects.values_list("id", flat=True)},
+        )
+
+    def test_enqueue_all_schedules_deferred_jobs(self):
+        """Jobs that aren't due yet should be scheduled instead of ready."""
+        backend = dummy_task.get_backend()
+        deferred = dummy_task.using(run_after=timedelta(hours=1))
+
+        backend.enqueue_all([(deferred, [], {}), (dummy_task, [], {})])
+
+        self.assertEqual(ScheduledExecution.objects.count(), 1)
+        self.assertEqual(ReadyExecution.objects.count(), 1)
+
+    async def test_aenqueue_creates_job(self):
+        """aenqueue() should create a ready job."""
+        result = await task_with_args.aenqueue("Alice")
+
+        job = await Job.objects.only("arguments").aget(id=result.id)
+        self.assertIn("Alice", str(job.arguments))
+        self.assertEqual(result.status, TaskResultStatus.READY)
+
+    async def test_concurrent_aenqueues_are_batched(self):
+        """Concurrent aenqueue() calls should be inserted together."""
+        backend = dummy_task.get_backend()
+
+        with patch.object(
+            backend, "enqueue_pending", wraps=backend.enqueue_pending
+        ) as enqueue_pending:
+            results = await asyncio.gather(
+                *(task_with_args.aenqueue(f"name-{i}") for i in range(5))
+            )
+
+        self.assertEqual(enqueue_pending.call_count, 1)
+        self.assertEqual(len({r.id for r in results}), 5)
+        self.assertEqual(await Job.objects.acount(), 5)
+
+
 class BackendTaskResultTestCase(TestCase):
     """Tests for to_task_result() mapping."""
 
@@ -117,10 +174,15 @@ class BackendCapabilitiesTestCase(TestCase):
         backend = dummy_task.get_backend()
         self.assertTrue(backend.supports_defer)
 
-    def test_does_not_support_async(self):
-        """Backend should not support async tasks."""
+    def test_supports_priority(self):
+        """Backend should support task priorities."""
+        backend = dummy_task.get_backend()
+        self.assertTrue(backend.supports_priority)
+
+    def test_supports_async(self):
+        """Backend should support async tasks."""
         backend = dummy_task.get_backend()
-        self.assertFalse(backend.supports_async_task)
+        self.assertTrue(backend.supports_async_task)
 
     def test_does_not_support_get_result(self):
         """Backend should not support result retrieval."""
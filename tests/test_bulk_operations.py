@@ -0,0 +1,104 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from steady_queue.bulk_operations import BulkOperation
+from steady_queue.models import FailedExecution, Job, ReadyExecution, ScheduledExecution
+from tests.dummy.tasks import dummy_task, failing_task
+
+
+class BulkOperationTestCase(TestCase):
+    def failed_job(self, task=dummy_task, error: str = "error") -> Job:
+        job = Job.objects.enqueue(task, [], {})
+        job.ready_execution.delete()
+        job.failed_with(error)
+        return job
+
+    def test_retry_in_chunks(self):
+        for _ in range(5):
+            self.failed_job()
+        reports = []
+
+        count = BulkOperation(
+            FailedExecution.objects.all(),
+            batch_size=2,
+            on_progress=lambda progress: reports.append(progress.chunks),
+        ).retry()
+
+        self.assertEqual(count, 5)
+        self.assertEqual(reports, [1, 2, 3])
+        self.assertEqual(FailedExecution.objects.count(), 0)
+        self.assertEqual(ReadyExecution.objects.count(), 5)
+
+    def test_retry_resets_attempts(self):
+        job = self.failed_job()
+
+        BulkOperation.matching().retry()
+
+        job.refresh_from_db()
+        self.assertEqual(job.attempts, 0)
+
+    def test_filters_by_class_name_and_error(self):
+        matching = self.failed_job(failing_task, error="TimeoutError: upstream")
+        self.failed_job(failing_task, error="KeyError: missing")
+        self.failed_job(dummy_task, error="TimeoutError: upstream")
+
+        count = BulkOperation.matching(
+            class_name=failing_task.module_path, error="^TimeoutError"
+        ).discard()
+
+        self.assertEqual(count, 1)
+        self.assertFalse(Job.objects.filter(pk=matching.pk).exists())
+        self.assertEqual(FailedExecution.objects.count(), 2)
+
+    def test_filters_by_time_range(self):
+        old = self.failed_job()
+        FailedExecution.objects.filter(job=old).update(
+            created_at=timezone.now() - timedelta(days=2)
+        )
+        self.failed_job()
+
+        count = BulkOperation.matching(
+            since=timezone.now() - timedelta(days=1)
+        ).discard()
+
+        self.assertEqual(count, 1)
+        self.assertTrue(Job.objects.filter(pk=old.pk).exists())
+
+    def test_reschedule_failed_jobs(self):
+        job = self.failed_job()
+        scheduled_at = timezone.now() + timedelta(hours=1)
+
+        BulkOperation.matching().reschedule(scheduled_at)
+
+        self.assertFalse(FailedExecution.objects.filter(job=job).exists())
+        self.assertEqual(
+            ScheduledExecution.objects.get(job=job).scheduled_at, scheduled_at
+        )
+
+    def test_move_ready_jobs(self):
+        job = Job.objects.enqueue(dummy_task, [], {})
+
+        BulkOperation.matching(status="ready").move("low")
+
+        job.refresh_from_db()
+        self.assertEqual(job.queue_name, "low")
+        self.assertEqual(ReadyExecution.objects.get(job=job).queue_name, "low")
+
+    def test_only_failed_executions_can_be_retried(self):
+        with self.assertRaises(ValueError):
+            BulkOperation.matching(status="ready").retry()
+
+    def test_command_reports_progress(self):
+        for _ in range(3):
+            self.failed_job()
+        stdout = StringIO()
+
+        call_command("steady_queue_jobs", "retry", "--batch-size", "2", stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertIn("processed 2 of 2 jobs in 1 chunks", output)
+        self.assertIn("retry: 3 jobs", output)
@@ -0,0 +1,162 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.tasks import TaskResultStatus
+from django.test import TestCase
+from django.utils import timezone
+
+import steady_queue
+from steady_queue.cancellation import CancelledJobs
+from steady_queue.configuration import Configuration
+from steady_queue.models import (
+    ClaimedExecution,
+    FailedExecution,
+    Job,
+    Process,
+    ReadyExecution,
+    ScheduledExecution,
+    Semaphore,
+)
+from steady_queue.processes.worker import Worker
+from tests.dummy.tasks import cancellable_task, dummy_task, limited_task
+
+
+class CancellationTestCase(TestCase):
+    def setUp(self):
+        self.addCleanup(CancelledJobs.replace, ())
+        self.backend = dummy_task.get_backend()
+
+    def claim(self, job: Job) -> ClaimedExecution:
+        process = Process.objects.create(
+            name="worker",
+            kind="worker",
+            pid=12345,
+            hostname="test-host",
+            last_heartbeat_at=timezone.now(),
+        )
+        ReadyExecution.objects.claim(queue_list=["*"], limit=1, process_id=process.id)
+        return ClaimedExecution.objects.get(job=job)
+
+    def test_cancel_ready_job(self):
+        job = Job.objects.enqueue(dummy_task, [], {})
+
+        self.assertTrue(job.cancel())
+
+        job.refresh_from_db()
+        self.assertFalse(ReadyExecution.objects.filter(job=job).exists())
+        self.assertIsNotNone(job.cancelled_at)
+        self.assertEqual(job.status, "cancelled")
+
+    def test_cancel_scheduled_job(self):
+        job = Job.objects.enqueue(
+            dummy_task.using(run_after=timedelta(hours=1)), [], {}
+        )
+
+        self.assertTrue(job.cancel())
+
+        self.assertFalse(ScheduledExecution.objects.filter(job=job).exists())
+
+    def test_cancel_deletes_jobs_when_not_preserving_finished_jobs(self):
+        job = Job.objects.enqueue(dummy_task, [], {})
+
+        with patch.object(steady_queue, "preserve_finished_jobs", False):
+            self.assertTrue(job.cancel())
+
+        self.assertFalse(Job.objects.filter(pk=job.pk).exists())
+
+    def test_finished_jobs_are_not_cancelled(self):
+        job = Job.objects.enqueue(dummy_task, [], {})
+        job.finished()
+
+        self.assertFalse(job.cancel())
+
+    def test_cancel_by_result_id(self):
+        result = dummy_task.enqueue()
+
+        self.assertTrue(self.backend.cancel(result.id))
+        self.assertIsNotNone(Job.objects.get(pk=result.id).cancelled_at)
+
+    def test_cancel_by_django_task_id(self):
+        job = Job.objects.enqueue(dummy_task, [], {})
+        Job.objects.filter(pk=job.pk).update(django_task_id="report-42")
+
+        self.assertTrue(self.backend.cancel("report-42"))
+
+    def test_cancel_all(self):
+        results = [dummy_task.enqueue() for _ in range(3)]
+
+        cancelled = self.backend.cancel_all([result.id for result in results])
+
+        self.assertEqual(cancelled, 3)
+        self.assertEqual(ReadyExecution.objects.count(), 0)
+
+    def test_cancelling_ready_jobs_releases_their_concurrency_lock(self):
+        ready = Job.objects.enqueue(limited_task, [], {})
+        blocked = Job.objects.enqueue(limited_task, [], {})
+        self.assertTrue(blocked.is_blocked)
+
+        self.assertTrue(ready.cancel())
+
+        self.assertTrue(ReadyExecution.objects.filter(job=blocked).exists())
+        self.assertEqual(Semaphore.objects.get(key="limited_task").value, 0)
+
+    def test_cancelling_ready_jobs_opens_their_semaphore(self):
+        job = Job.objects.enqueue(limited_task, [], {})
+
+        with patch.object(steady_queue, "preserve_finished_jobs", False):
+            self.assertTrue(job.cancel())
+
+        self.assertEqual(Semaphore.objects.get(key="limited_task").value, 1)
+
+    def test_cancelled_jobs_are_reported_as_failed(self):
+        result = dummy_task.enqueue()
+        self.backend.cancel(result.id)
+
+        job = Job.objects.get(pk=result.id)
+        self.assertEqual(self.backend.task_result_status(job), TaskResultStatus.FAILED)
+
+    def test_running_jobs_are_only_flagged(self):
+        job = Job.objects.enqueue(dummy_task, [], {})
+        self.claim(job)
+
+        self.assertTrue(job.cancel())
+
+        job.refresh_from_db()
+        self.assertIsNotNone(job.cancelled_at)
+        self.assertIsNone(job.finished_at)
+        self.assertTrue(ClaimedExecution.objects.filter(job=job).exists())
+
+    def test_worker_picks_up_cancellations_of_in_flight_jobs(self):
+        running = Job.objects.enqueue(dummy_task, [], {})
+        other = Job.objects.enqueue(dummy_task, [], {})
+        running.cancel()
+        other.cancel()
+
+        worker = Worker(Configuration.Worker())
+        self.addCleanup(worker.pool.shutdown)
+        worker.pool.in_flight.add(running.id)
+        worker.check_cancellations()
+
+        self.assertTrue(CancelledJobs.include(running.id))
+        self.assertFalse(CancelledJobs.include(other.id))
+
+    def test_task_stops_when_cancelled(self):
+        job = Job.objects.enqueue(cancellable_task, [], {})
+        execution = self.claim(job)
+        job.cancel()
+        CancelledJobs.replace([job.id])
+
+        execution.perform()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, "cancelled")
+        self.assertFalse(FailedExecution.objects.filter(job=job).exists())
+
+    def test_task_runs_with_context_when_not_cancelled(self):
+        job = Job.objects.enqueue(cancellable_task, [], {})
+        execution = self.claim(job)
+
+        execution.perform()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, "finished")
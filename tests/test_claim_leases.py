@@ -0,0 +1,99 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+import steady_queue
+from steady_queue.configuration import Configuration
+from steady_queue.models import (
+    ClaimedExecution,
+    FailedExecution,
+    Job,
+    Process,
+    ReadyExecution,
+)
+from steady_queue.processes.maintenance import Maintenance
+from steady_queue.processes.worker import Worker
+from tests.dummy.tasks import dummy_task
+
+
+@patch.object(steady_queue, "claim_lease_duration", timedelta(seconds=30))
+class ClaimLeaseTestCase(TestCase):
+    def setUp(self):
+        self.process = Process.objects.create(
+            name="worker",
+            kind="worker",
+            pid=12345,
+            hostname="test-host",
+            last_heartbeat_at=timezone.now(),
+        )
+        self.job = Job.objects.enqueue(dummy_task, [], {})
+
+    def claim(self) -> ClaimedExecution:
+        ReadyExecution.objects.claim(
+            queue_list=["*"], limit=1, process_id=self.process.id
+        )
+        return ClaimedExecution.objects.get(job=self.job)
+
+    def test_claiming_sets_lease(self):
+        execution = self.claim()
+
+        self.assertGreater(execution.lease_expires_at, timezone.now())
+
+    def test_no_lease_when_disabled(self):
+        with patch.object(steady_queue, "claim_lease_duration", None):
+            execution = self.claim()
+
+        self.assertIsNone(execution.lease_expires_at)
+
+    def test_worker_renews_leases_of_in_flight_jobs(self):
+        execution = self.claim()
+        ClaimedExecution.objects.update(lease_expires_at=timezone.now())
+
+        worker = Worker(Configuration.Worker())
+        self.addCleanup(worker.pool.shutdown)
+        worker.process = self.process
+        worker.pool.in_flight.add(self.job.id)
+        worker.renew_leases()
+
+        execution.refresh_from_db()
+        self.assertGreater(
+            execution.lease_expires_at, timezone.now() + timedelta(seconds=20)
+        )
+
+    def test_lost_jobs_are_not_renewed(self):
+        execution = self.claim()
+        expired_at = timezone.now() - timedelta(seconds=1)
+        ClaimedExecution.objects.update(lease_expires_at=expired_at)
+
+        worker = Worker(Configuration.Worker())
+        self.addCleanup(worker.pool.shutdown)
+        worker.process = self.process
+        worker.renew_leases()
+
+        execution.refresh_from_db()
+        self.assertEqual(execution.lease_expires_at, expired_at)
+
+    def test_expired_leases_fail_their_jobs(self):
+        self.claim()
+        ClaimedExecution.objects.update(
+            lease_expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        with self.assertLogs("steady_queue", level="WARNING"):
+            Maintenance().fail_executions_with_expired_lease()
+
+        self.assertFalse(ClaimedExecution.objects.exists())
+        self.assertTrue(FailedExecution.objects.filter(job=self.job).exists())
+        self.assertTrue(
+            FailedExecution.objects.get().error.startswith("ClaimLeaseExpiredError")
+        )
+
+    def test_renewed_leases_are_not_failed(self):
+        self.claim()
+
+        Maintenance().fail_executions_with_expired_lease()
+
+        self.assertTrue(ClaimedExecution.objects.filter(job=self.job).exists())
+        self.assertFalse(FailedExecution.objects.exists())
@@ -154,6 +154,49 @@ class ConfigurationValidationTestCase(SimpleTestCase):
         self.assertGreater(len(config.errors), 0)
         self.assertIn("No processes configured", str(config.errors[0]))
 
+    def test_unknown_worker_pool_fails_validation(self):
+        """Workers must use one of the supported pools."""
+        options = Configuration.Options(workers=[Configuration.Worker(pool="gevent")])
+        config = Configuration(options)
+
+        self.assertFalse(config.is_valid)
+        self.assertTrue(
+            any("Invalid worker pool" in error.message for error in config.errors)
+        )
+
+    def test_process_pool_requires_thread_pool(self):
+        """Process pools can't be combined with asyncio workers."""
+        options = Configuration.Options(
+            workers=[
+                Configuration.Worker(
+                    pool="asyncio",
+                    process_pool=Configuration.ProcessPool(tasks=["a.b"]),
+                )
+            ]
+        )
+        config = Configuration(options)
+
+        self.assertFalse(config.is_valid)
+
+    def test_threads_must_be_within_tuning_bounds(self):
+        options = Configuration.Options(
+            workers=[Configuration.Worker(threads=10, min_threads=2, max_threads=8)]
+        )
+        config = Configuration(options)
+
+        self.assertFalse(config.is_valid)
+
+    def test_queue_timeouts_must_be_positive(self):
+        options = Configuration.Options(
+            workers=[Configuration.Worker(timeouts={"default": timedelta(0)})]
+        )
+        config = Configuration(options)
+
+        self.assertFalse(config.is_valid)
+        self.assertTrue(
+            any("must be positive" in error.message for error in config.errors)
+        )
+
     def test_small_postgres_pool_fails_validation(self):
         """Configured worker threads must fit in postgres pool max_size."""
         options = Configuration.Options(workers=[Configuration.Worker(threads=3)])
@@ -410,6 +453,9 @@ class DispatcherConfigurationTestCase(SimpleTestCase):
         self.assertEqual(
             dispatcher.concurrency_maintenance_interval, timedelta(minutes=5)
         )
+        self.assertFalse(dispatcher.clear_finished_jobs)
+        self.assertEqual(dispatcher.clear_finished_jobs_interval, timedelta(minutes=1))
+        self.assertEqual(dispatcher.clear_finished_jobs_budget, timedelta(seconds=15))
 
     def test_dispatcher_configuration_custom_values(self):
         """Dispatcher configuration accepts custom values."""
@@ -426,3 +472,18 @@ class DispatcherConfigurationTestCase(SimpleTestCase):
         self.assertEqual(
             dispatcher.concurrency_maintenance_interval, timedelta(minutes=10)
         )
+
+    def test_clear_finished_jobs_budget_must_be_positive(self):
+        options = Configuration.Options(
+            dispatchers=[
+                Configuration.Dispatcher(
+                    clear_finished_jobs=True, clear_finished_jobs_budget=timedelta(0)
+                )
+            ]
+        )
+        config = Configuration(options)
+
+        self.assertFalse(config.is_valid)
+        self.assertTrue(
+            any("must be positive" in error.message for error in config.errors)
+        )
@@ -0,0 +1,107 @@
+from django.contrib import admin
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from steady_queue.admin import FailedExecutionGroupAdmin
+from steady_queue.fingerprints import fingerprint, normalize_message
+from steady_queue.models import FailedExecution, FailedExecutionGroup, Job
+from tests.dummy.tasks import dummy_task, failing_task
+
+
+def raise_error(message: str) -> ValueError:
+    try:
+        raise ValueError(message)
+    except ValueError as e:
+        return e
+
+
+class FingerprintTestCase(SimpleTestCase):
+    def test_normalizes_variable_parts(self):
+        self.assertEqual(
+            normalize_message(
+                "order 1234 for 'alice' at 0x7f3a "
+                "(550e8400-e29b-41d4-a716-446655440000)"
+            ),
+            "order <num> for <str> at <hex> (<uuid>)",
+        )
+
+    def test_same_error_with_different_values(self):
+        self.assertEqual(
+            fingerprint(raise_error("order 1 not found")),
+            fingerprint(raise_error("order 2 not found")),
+        )
+
+    def test_different_classes(self):
+        self.assertNotEqual(
+            fingerprint("ValueError: order not found"),
+            fingerprint("KeyError: order not found"),
+        )
+
+    def test_exceptions_match_their_stored_errors(self):
+        def raise_elsewhere():
+            return raise_error("order 1 not found")
+
+        self.assertEqual(
+            fingerprint(raise_elsewhere()),
+            fingerprint("ValueError: order 2 not found"),
+        )
+
+
+class FailedExecutionGroupTestCase(TestCase):
+    def fail(self, task, error: str) -> Job:
+        job = Job.objects.enqueue(task, [], {})
+        job.ready_execution.delete()
+        job.failed_with(error)
+        return job
+
+    def test_failed_executions_are_fingerprinted(self):
+        job = self.fail(dummy_task, "ValueError: order 1 not found")
+
+        self.assertEqual(
+            job.failed_execution.fingerprint,
+            fingerprint("ValueError: order 1 not found"),
+        )
+
+    def test_grouped_by_fingerprint_and_class(self):
+        for i in range(3):
+            self.fail(dummy_task, f"ValueError: order {i} not found")
+        self.fail(failing_task, "ValueError: order 9 not found")
+        self.fail(dummy_task, "KeyError: missing")
+
+        groups = {
+            (group.job.class_name, group.error.split(":")[0]): group.failure_count
+            for group in FailedExecutionGroup.objects.grouped()
+        }
+
+        self.assertEqual(
+            groups,
+            {
+                (dummy_task.module_path, "ValueError"): 3,
+                (failing_task.module_path, "ValueError"): 1,
+                (dummy_task.module_path, "KeyError"): 1,
+            },
+        )
+
+    def test_retry_group(self):
+        for i in range(3):
+            self.fail(dummy_task, f"ValueError: order {i} not found")
+        other = self.fail(dummy_task, "KeyError: missing")
+        selected = FailedExecution.objects.filter(error__startswith="ValueError")[:1]
+
+        count = FailedExecution.objects.in_groups_of(
+            FailedExecution.objects.filter(pk__in=[e.pk for e in selected])
+        ).retry()
+
+        self.assertEqual(count, 3)
+        self.assertEqual(
+            list(FailedExecution.objects.values_list("job", flat=True)), [other.pk]
+        )
+
+    def test_admin_lists_largest_groups_first(self):
+        self.fail(dummy_task, "KeyError: missing")
+        for i in range(2):
+            self.fail(dummy_task, f"ValueError: order {i} not found")
+        group_admin = FailedExecutionGroupAdmin(FailedExecutionGroup, admin.site)
+
+        self.assertEqual(group_admin.check(), [])
+        groups = group_admin.get_queryset(RequestFactory().get("/"))
+        self.assertEqual([group.failure_count for group in groups], [2, 1])
@@ -0,0 +1,164 @@
+import threading
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from django.test import SimpleTestCase, TestCase
+
+from steady_queue.configuration import Configuration
+from steady_queue.processes.errors import ExecutionTimeoutError
+from steady_queue.processes.pool import Pool
+from steady_queue.processes.worker import Worker
+
+
+def build_execution(job_id: int = 1, class_name: str = "tests.dummy.tasks.dummy_task"):
+    execution = MagicMock()
+    execution.job_id = job_id
+    execution.pk = job_id
+    execution.job.class_name = class_name
+    execution.job.queue_name = "default"
+    return execution
+
+
+def wait_for(condition, timeout: float = 2):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TimeoutResolutionTestCase(SimpleTestCase):
+    def build_worker(self, **options) -> Worker:
+        worker = Worker(Configuration.Worker(**options))
+        self.addCleanup(worker.pool.shutdown)
+        return worker
+
+    def test_task_timeout_wins_over_queue_timeouts(self):
+        worker = self.build_worker(timeouts={"default": timedelta(minutes=5)})
+        execution = build_execution(class_name="tests.dummy.tasks.timing_out_task")
+
+        self.assertEqual(worker.timeout_for(execution), timedelta(seconds=1))
+
+    def test_queue_timeout(self):
+        worker = self.build_worker(
+            timeouts={"default": timedelta(minutes=5), "*": timedelta(hours=1)}
+        )
+
+        self.assertEqual(worker.timeout_for(build_execution()), timedelta(minutes=5))
+
+    def test_wildcard_timeout(self):
+        worker = self.build_worker(timeouts={"*": timedelta(hours=1)})
+
+        self.assertEqual(worker.timeout_for(build_execution()), timedelta(hours=1))
+
+    def test_no_timeout_by_default(self):
+        worker = self.build_worker()
+
+        self.assertIsNone(worker.timeout_for(build_execution()))
+
+
+class WatchdogTestCase(TestCase):
+    def setUp(self):
+        self.pool = Pool(size=2, on_idle=lambda: None)
+        self.addCleanup(self.pool.shutdown)
+
+    def test_executions_without_timeout_are_not_watched(self):
+        self.pool.post(build_execution())
+
+        wait_for(lambda: self.pool.idle_threads == 2)
+        self.assertEqual(self.pool.running, {})
+
+    def test_interrupts_timed_out_execution(self):
+        interrupted = threading.Event()
+
+        def spin(runner=None, watch=None):
+            spins = 0
+            try:
+                with watch():
+                    while True:
+                        spins += 1
+            except ExecutionTimeoutError:
+                interrupted.set()
+
+        execution = build_execution()
+        execution.perform.side_effect = spin
+        self.pool.post(execution, timeout=timedelta(seconds=0.05))
+        wait_for(lambda: 1 in self.pool.running)
+
+        time.sleep(0.1)
+        self.pool.enforce_timeouts()
+
+        self.assertTrue(interrupted.wait(2))
+        wait_for(lambda: self.pool.idle_threads == 2)
+        self.assertEqual(self.pool.idle_threads, 2)
+        self.assertEqual(self.pool.abandoned_threads, 0)
+
+    def test_abandons_thread_that_cannot_be_interrupted(self):
+        release = threading.Event()
+        execution = build_execution()
+
+        def hang(runner=None, watch=None):
+            with watch():
+                release.wait()
+
+        execution.perform.side_effect = hang
+        self.addCleanup(release.set)
+
+        self.pool.post(execution, timeout=timedelta(seconds=1))
+        wait_for(lambda: 1 in self.pool.running)
+        deadline = self.pool.running[1].deadline
+
+        self.pool.enforce_timeouts(now=deadline)
+        self.assertEqual(self.pool.abandoned_threads, 0)
+        self.assertEqual(self.pool.idle_threads, 1)
+
+        grace = Pool.INTERRUPT_GRACE_PERIOD.total_seconds()
+        self.pool.enforce_timeouts(now=deadline + grace)
+
+        self.assertEqual(self.pool.abandoned_threads, 1)
+        self.assertEqual(self.pool.idle_threads, 2)
+        self.assertEqual(self.pool.in_flight_job_ids, [])
+        error = execution.failed_with.call_args.args[0]
+        self.assertIsInstance(error, ExecutionTimeoutError)
+        execution.unblock_next_job.assert_called_once()
+
+        # The slot isn't given back twice when the thread eventually finishes
+        release.set()
+        time.sleep(0.1)
+        self.assertEqual(self.pool.idle_threads, 2)
+
+    def test_bookkeeping_after_the_task_call_is_not_interrupted(self):
+        returned = threading.Event()
+        proceed = threading.Event()
+        finished = threading.Event()
+
+        def perform(runner=None, watch=None):
+            with watch():
+                pass
+            returned.set()
+            proceed.wait(2)
+            # Stands in for succeeding the execution in the database.
+            for _ in range(100_000):
+                pass
+            finished.set()
+
+        execution = build_execution()
+        execution.perform.side_effect = perform
+        self.pool.post(execution, timeout=timedelta(seconds=0.01))
+        self.assertTrue(returned.wait(2))
+
+        self.pool.enforce_timeouts(now=time.monotonic() + 60)
+        proceed.set()
+
+        self.assertTrue(finished.wait(2))
+        wait_for(lambda: self.pool.idle_threads == 2)
+        self.assertEqual(self.pool.running, {})
+        self.assertEqual(self.pool.abandoned_threads, 0)
+
+    def test_worker_recycles_after_abandoning_a_thread(self):
+        worker = Worker(Configuration.Worker())
+        self.addCleanup(worker.pool.shutdown)
+        worker.pool.abandoned_threads = 1
+
+        worker.watchdog()
+
+        self.assertEqual(worker.recycle_reason, "hung job")
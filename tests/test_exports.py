@@ -0,0 +1,97 @@
+import csv
+import gzip
+import io
+import json
+import shutil
+import tempfile
+import zlib
+from datetime import timedelta
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from steady_queue.exports import JobExporter
+from steady_queue.models import Job
+from tests.dummy.tasks import dummy_task, task_with_args
+
+
+class JobExporterTestCase(TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def finished_jobs(self, count, task=dummy_task, args=None):
+        jobs = [Job.objects.enqueue(task, args or [], {}) for _ in range(count)]
+        Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+            finished_at=timezone.now() - timedelta(days=2)
+        )
+        return jobs
+
+    def exported_files(self):
+        return sorted(self.directory.iterdir())
+
+    def test_exports_and_deletes_finished_jobs(self):
+        jobs = self.finished_jobs(5, task_with_args, ["Alice"])
+        pending = Job.objects.enqueue(dummy_task, [], {})
+
+        count = JobExporter(self.directory).run(batch_size=2)
+
+        self.assertEqual(count, 5)
+        self.assertEqual(list(Job.objects.values_list("pk", flat=True)), [pending.pk])
+        [path] = self.exported_files()
+        self.assertTrue(path.name.endswith(".jsonl.gz"))
+        with gzip.open(path, "rt") as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual([row["id"] for row in rows], [job.pk for job in jobs])
+        self.assertEqual(rows[0]["arguments"], jobs[0].arguments)
+        self.assertEqual(rows[0]["class_name"], task_with_args.module_path)
+
+    def test_exports_csv(self):
+        self.finished_jobs(2)
+
+        JobExporter(self.directory, format="csv", compression="none").run()
+
+        [path] = self.exported_files()
+        self.assertTrue(path.name.endswith(".csv"))
+        rows = list(csv.DictReader(io.StringIO(path.read_text())))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]["class_name"], dummy_task.module_path)
+        self.assertIsInstance(json.loads(rows[0]["arguments"]), dict)
+
+    def test_rotates_files(self):
+        self.finished_jobs(5)
+
+        exporter = JobExporter(self.directory, max_rows_per_file=2)
+        exporter.run(batch_size=2)
+
+        self.assertEqual(exporter.files, 3)
+        self.assertEqual(len(self.exported_files()), 3)
+
+    def test_batches_are_readable_before_the_file_is_closed(self):
+        self.finished_jobs(3)
+        exporter = JobExporter(self.directory)
+
+        exporter.export_batch(batch_size=2)
+
+        [path] = self.exported_files()
+        data = zlib.decompressobj(wbits=31).decompress(path.read_bytes())
+        self.assertEqual(len(data.splitlines()), 2)
+        self.assertEqual(Job.objects.count(), 1)
+        exporter.close()
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            JobExporter(self.directory, format="xml")
+
+    def test_command_keeps_jobs(self):
+        self.finished_jobs(2)
+        stdout = io.StringIO()
+
+        call_command(
+            "steady_queue_export", str(self.directory), "--keep", stdout=stdout
+        )
+
+        self.assertIn("2 jobs in 1 files", stdout.getvalue())
+        self.assertEqual(Job.objects.count(), 2)
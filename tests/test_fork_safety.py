@@ -23,6 +23,7 @@ class SupervisorForkSafetyTest(SimpleTestCase):
 
         supervisor.boot = lambda: calls.append("boot")
         supervisor.reset_database_connections = lambda: calls.append("reset")
+        supervisor.preload = lambda: calls.append("preload")
         supervisor.start_processes = lambda: calls.append("start_processes")
         supervisor.launch_maintenance_task = lambda: calls.append("launch_maintenance")
         supervisor.supervise = lambda: calls.append("supervise")
@@ -34,6 +35,7 @@ class SupervisorForkSafetyTest(SimpleTestCase):
             [
                 "boot",
                 "reset",
+                "preload",
                 "start_processes",
                 "launch_maintenance",
                 "supervise",
@@ -96,3 +98,41 @@ class ResetDatabaseConnectionsTest(SimpleTestCase):
         self.assertTrue(pool_default.closed)
         self.assertTrue(pool_queue.closed)
         self.assertEqual(FakeConnection._connection_pools, {})
+
+
+class SupervisorPreloadTest(SimpleTestCase):
+    def build_supervisor(self, **worker_options) -> Supervisor:
+        options = Configuration.Options(
+            workers=[Configuration.Worker(**worker_options)],
+            dispatchers=[],
+            recurring_tasks=[],
+            skip_recurring=True,
+        )
+        return Supervisor(Configuration(options))
+
+    def test_preload_imports_tasks_and_freezes_gc(self):
+        supervisor = self.build_supervisor(
+            process_pool=Configuration.ProcessPool(
+                tasks=["tests.dummy.tasks.cpu_bound_task"]
+            )
+        )
+
+        with (
+            patch("steady_queue.processes.supervisor.import_string") as import_string,
+            patch("steady_queue.processes.supervisor.gc") as gc,
+        ):
+            supervisor.preload()
+
+        import_string.assert_called_once_with("tests.dummy.tasks.cpu_bound_task")
+        gc.freeze.assert_called_once()
+
+    def test_preload_can_be_disabled(self):
+        supervisor = self.build_supervisor()
+
+        with (
+            patch("steady_queue.preload_app", False),
+            patch("steady_queue.processes.supervisor.gc") as gc,
+        ):
+            supervisor.preload()
+
+        gc.freeze.assert_not_called()
@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from steady_queue.processes import interpreter_pool
+from steady_queue.processes.interpreter_pool import InterpreterPool
+from steady_queue.processes.pool import Pool
+from tests.dummy.tasks import cpu_bound_task, failing_task, subinterpreter_task
+
+
+class InterpreterPoolTestCase(SimpleTestCase):
+    def arguments(self, task, args=None, kwargs=None):
+        return task.serialize(args or [], kwargs or {})["arguments"]
+
+    def test_falls_back_to_threads_when_unsupported(self):
+        with patch.object(interpreter_pool, "InterpreterPoolExecutor", None):
+            pool = Pool(
+                1,
+                on_idle=None,
+                interpreter_pool=InterpreterPool([cpu_bound_task.module_path], 1),
+            )
+            with self.assertLogs("steady_queue", level="WARNING"):
+                pool.start()
+
+            self.assertIsNone(pool.runner_for(cpu_bound_task.module_path))
+            pool.shutdown()
+
+    @skipUnless(InterpreterPool.is_supported(), "requires subinterpreters")
+    def test_runs_selected_tasks_in_subinterpreters(self):
+        pool = InterpreterPool(
+            [cpu_bound_task.module_path, failing_task.module_path], 1
+        )
+        pool.start()
+        try:
+            pool.run(cpu_bound_task, self.arguments(cpu_bound_task, [10]))
+
+            with self.assertRaisesMessage(
+                Exception, "this is a task that always fails"
+            ):
+                pool.run(failing_task, self.arguments(failing_task))
+        finally:
+            pool.shutdown()
+
+    def test_falls_back_to_threads_when_setup_fails(self):
+        def setup_interpreter():
+            raise ImportError("module does not support loading in subinterpreters")
+
+        with (
+            patch.object(
+                interpreter_pool, "InterpreterPoolExecutor", ThreadPoolExecutor
+            ),
+            patch.object(interpreter_pool, "setup_interpreter", setup_interpreter),
+        ):
+            pool = InterpreterPool([cpu_bound_task.module_path], 1)
+            with self.assertLogs("steady_queue", level="WARNING"):
+                pool.start()
+
+        self.assertFalse(pool.runs(cpu_bound_task.module_path))
+        pool.shutdown()
+
+    @skipUnless(InterpreterPool.is_supported(), "requires subinterpreters")
+    def test_falls_back_to_threads_when_tasks_dont_load(self):
+        pool = InterpreterPool(["tests.dummy.missing.task"], 1)
+        with self.assertLogs("steady_queue", level="WARNING"):
+            pool.start()
+
+        self.assertFalse(pool.runs("tests.dummy.missing.task"))
+        pool.shutdown()
+
+    @skipUnless(InterpreterPool.is_supported(), "requires subinterpreters")
+    def test_worker_runs_tasks_in_subinterpreters(self):
+        pool = Pool(
+            1,
+            on_idle=None,
+            interpreter_pool=InterpreterPool([subinterpreter_task.module_path], 1),
+        )
+        pool.start()
+        try:
+            runner = pool.runner_for(subinterpreter_task.module_path)
+            self.assertEqual(runner, pool.interpreter_pool.run)
+
+            runner(subinterpreter_task, self.arguments(subinterpreter_task))
+        finally:
+            pool.shutdown()
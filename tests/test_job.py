@@ -1,8 +1,11 @@
 from datetime import timedelta
+from unittest.mock import patch
 
 from django.test import TestCase
 from django.utils import timezone
 
+import steady_queue
+from steady_queue.arguments import Arguments
 from steady_queue.models import (
     BlockedExecution,
     Job,
@@ -10,7 +13,7 @@ from steady_queue.models import (
     ScheduledExecution,
     Semaphore,
 )
-from tests.dummy.tasks import dummy_task, limited_task
+from tests.dummy.tasks import dummy_task, limited_task, task_with_args
 
 
 class JobCreationTestCase(TestCase):
@@ -114,6 +117,50 @@ class JobAttributesTestCase(TestCase):
         attrs = Job.attributes_from_django_task(dummy_task, [], {})
         self.assertEqual(attrs["priority"], 0)
 
+    def test_arguments_leave_out_fields_stored_in_columns(self):
+        """The serialized task doesn't duplicate class name, queue and priority."""
+        job = Job.objects.enqueue(dummy_task.using(priority=5), [], {})
+
+        for column in Job.TASK_DATA_COLUMNS:
+            self.assertNotIn(column, job.arguments)
+        self.assertEqual(job.task_data["class_name"], "tests.dummy.tasks.dummy_task")
+        self.assertEqual(job.task_data["priority"], 5)
+        self.assertEqual(job.task_data["arguments"], job.arguments["arguments"])
+
+    def test_task_data_prefers_columns_over_old_payloads(self):
+        """Jobs enqueued with full payloads read their columns."""
+        job = Job(
+            queue_name="other",
+            priority=1,
+            class_name="tests.dummy.tasks.dummy_task",
+            arguments={**dummy_task.serialize([], {}), "queue_name": "default"},
+        )
+
+        self.assertEqual(job.task_data["queue_name"], "other")
+
+    def test_arguments_are_deferred_by_default(self):
+        """Loading jobs doesn't load their arguments until they're accessed."""
+        job = Job.objects.enqueue(dummy_task, [], {})
+
+        loaded = Job.objects.get(pk=job.pk)
+
+        self.assertEqual(loaded.get_deferred_fields(), {"arguments"})
+        self.assertEqual(loaded.arguments, job.arguments)
+
+    @patch.object(steady_queue, "compress_arguments_over", 1024)
+    def test_large_arguments_are_stored_compressed(self):
+        """Large payloads are compressed and read back when the job runs."""
+        name = "Alice" * 1000
+        job = Job.objects.enqueue(task_with_args, [name], {})
+
+        loaded = Job.objects.get(pk=job.pk)
+
+        self.assertIn(Arguments.COMPRESSED_KEY, loaded.arguments["arguments"])
+        self.assertEqual(
+            Arguments.deserialize_args_and_kwargs(loaded.task_data["arguments"]),
+            ([name], {}),
+        )
+
 
 class JobStateTransitionsTestCase(TestCase):
     """Tests for job state transitions (finished, failed)."""
@@ -0,0 +1,102 @@
+import itertools
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.db import OperationalError
+from django.test import TestCase
+from django.utils import timezone
+
+from steady_queue.models import Job
+from steady_queue.processes.job_cleaner import JobCleaner
+from tests.dummy.tasks import dummy_task
+
+
+class JobCleanerTestCase(TestCase):
+    def setUp(self):
+        self.cleaner = JobCleaner(
+            interval=timedelta(minutes=1), budget=timedelta(seconds=5), batch_size=10
+        )
+
+    def finished_jobs(self, count, finished_ago=timedelta(days=2)):
+        jobs = [Job.objects.enqueue(dummy_task, [], {}) for _ in range(count)]
+        Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+            finished_at=timezone.now() - finished_ago
+        )
+        return jobs
+
+    def test_clears_finished_jobs_older_than_retention_period(self):
+        self.finished_jobs(25)
+        recent = self.finished_jobs(3, finished_ago=timedelta(hours=1))
+        pending = Job.objects.enqueue(dummy_task, [], {})
+
+        cleared = self.cleaner.clear_finished_jobs()
+
+        self.assertEqual(cleared, 25)
+        self.assertEqual(
+            set(Job.objects.values_list("pk", flat=True)),
+            {job.pk for job in recent} | {pending.pk},
+        )
+
+    def test_stops_when_budget_is_spent(self):
+        self.finished_jobs(25)
+
+        with patch("steady_queue.processes.job_cleaner.time.monotonic") as monotonic:
+            # The deadline passes after the first batch.
+            monotonic.side_effect = itertools.chain([0, 0, 0], itertools.repeat(10))
+            cleared = self.cleaner.clear_finished_jobs(deadline=5)
+
+        self.assertEqual(cleared, 10)
+        self.assertEqual(Job.objects.count(), 15)
+
+    def test_batch_size_adapts_to_batch_duration(self):
+        self.cleaner.adapt(timedelta(seconds=0.1))
+        self.assertEqual(self.cleaner.batch_size, 20)
+
+        self.cleaner.adapt(timedelta(seconds=1))
+        self.assertEqual(self.cleaner.batch_size, 10)
+        self.assertEqual(self.cleaner.backoff, timedelta(0))
+
+        self.cleaner.batch_size = 15
+        self.cleaner.adapt(timedelta(seconds=1))
+        self.assertEqual(self.cleaner.batch_size, JobCleaner.MIN_BATCH_SIZE)
+
+    def test_backs_off_when_batches_are_very_slow(self):
+        self.cleaner.adapt(timedelta(seconds=5))
+        self.assertEqual(self.cleaner.backoff, JobCleaner.MIN_BACKOFF)
+
+        self.cleaner.adapt(timedelta(seconds=5))
+        self.assertEqual(self.cleaner.backoff, JobCleaner.MIN_BACKOFF * 2)
+
+        self.cleaner.adapt(timedelta(seconds=0.3))
+        self.assertEqual(self.cleaner.backoff, timedelta(0))
+
+    def test_backs_off_on_database_errors(self):
+        self.finished_jobs(5)
+
+        with (
+            patch.object(
+                Job.objects.__class__,
+                "clear_finished_batch",
+                side_effect=[OperationalError("lock timeout"), (5, None)],
+            ),
+            patch("steady_queue.processes.job_cleaner.time.sleep") as sleep,
+        ):
+            cleared = self.cleaner.clear_finished_jobs()
+
+        self.assertEqual(cleared, 5)
+        sleep.assert_called_once_with(JobCleaner.MIN_BACKOFF.total_seconds())
+
+
+class ClearFinishedInBatchesTestCase(TestCase):
+    def test_clears_with_keyset_pagination(self):
+        finished_at = timezone.now() - timedelta(days=2)
+        jobs = [Job.objects.enqueue(dummy_task, [], {}) for _ in range(7)]
+        # Jobs finishing at the same time are told apart by their id.
+        Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+            finished_at=finished_at
+        )
+
+        cleared = Job.objects.clear_finished_in_batches(batch_size=3)
+
+        self.assertEqual(cleared, 7)
+        self.assertEqual(Job.objects.count(), 0)
@@ -0,0 +1,164 @@
+import shutil
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+import steady_queue
+from steady_queue.arguments import Arguments, DeserializationError
+from steady_queue.bulk_operations import BulkOperation
+from steady_queue.models import ArchivedJob, Job, OffloadedArguments
+from steady_queue.models.offloaded_arguments import leftover_offloaded_arguments
+from tests.dummy.tasks import task_with_args
+
+storage_dir = Path(tempfile.mkdtemp())
+
+
+@override_settings(
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "steady_queue": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": str(storage_dir)},
+        },
+    }
+)
+@patch.object(steady_queue, "offloaded_arguments_storage", "steady_queue")
+@patch.object(steady_queue, "offload_arguments_over", 1024)
+@patch.object(steady_queue, "compress_arguments_over", None)
+class OffloadedArgumentsTestCase(TestCase):
+    name = "Alice" * 1000
+
+    def setUp(self):
+        self.addCleanup(shutil.rmtree, storage_dir, ignore_errors=True)
+
+    def stored_files(self):
+        return [path for path in storage_dir.rglob("*") if path.is_file()]
+
+    def offloaded_name(self, job):
+        return Arguments.offloaded_name(job.arguments["arguments"])
+
+    def clear(self, *jobs):
+        Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+            finished_at=timezone.now() - timedelta(days=2)
+        )
+        with self.captureOnCommitCallbacks(using="queue", execute=True):
+            Job.objects.clear_finished_in_batches()
+
+    def test_small_arguments_are_kept_in_the_job(self):
+        job = Job.objects.enqueue(task_with_args, ["Alice"], {})
+
+        self.assertIsNone(self.offloaded_name(job))
+        self.assertEqual(self.stored_files(), [])
+
+    def test_large_arguments_are_offloaded(self):
+        job = Job.objects.enqueue(task_with_args, [self.name], {})
+
+        [path] = self.stored_files()
+        self.assertEqual(
+            path.relative_to(storage_dir).as_posix(), self.offloaded_name(job)
+        )
+        self.assertEqual(
+            Arguments.deserialize_args_and_kwargs(job.arguments["arguments"]),
+            ([self.name], {}),
+        )
+
+    def test_identical_arguments_share_a_file(self):
+        first = Job.objects.enqueue(task_with_args, [self.name], {})
+        second = Job.objects.enqueue(task_with_args, [self.name], {})
+
+        self.assertEqual(self.offloaded_name(first), self.offloaded_name(second))
+        self.assertEqual(len(self.stored_files()), 1)
+
+    def test_clearing_jobs_deletes_unreferenced_files(self):
+        first = Job.objects.enqueue(task_with_args, [self.name], {})
+        second = Job.objects.enqueue(task_with_args, [self.name], {})
+
+        self.clear(first)
+        self.assertEqual(len(self.stored_files()), 1)
+
+        self.clear(second)
+        self.assertEqual(self.stored_files(), [])
+
+    def test_references_are_counted(self):
+        first = Job.objects.enqueue(task_with_args, [self.name], {})
+        Job.objects.enqueue(task_with_args, [self.name], {})
+
+        offloaded = OffloadedArguments.objects.get()
+        self.assertEqual(offloaded.name, self.offloaded_name(first))
+        self.assertEqual(offloaded.references, 2)
+
+        self.clear(first)
+        offloaded.refresh_from_db()
+        self.assertEqual(offloaded.references, 1)
+
+    def test_deleting_a_job_deletes_its_file(self):
+        job = Job.objects.enqueue(task_with_args, [self.name], {})
+
+        with self.captureOnCommitCallbacks(using="queue", execute=True):
+            Job.objects.get(pk=job.pk).delete()
+
+        self.assertEqual(self.stored_files(), [])
+        self.assertFalse(OffloadedArguments.objects.exists())
+
+    def test_files_are_deleted_after_disabling_offloading(self):
+        job = Job.objects.enqueue(task_with_args, [self.name], {})
+
+        with (
+            patch.object(steady_queue, "offload_arguments_over", None),
+            patch.dict(leftover_offloaded_arguments, clear=True),
+        ):
+            self.clear(job)
+
+        self.assertEqual(self.stored_files(), [])
+
+    def test_enqueue_writes_missing_files_again(self):
+        first = Job.objects.enqueue(task_with_args, [self.name], {})
+        [path] = self.stored_files()
+        path.unlink()
+
+        Job.objects.enqueue(task_with_args, [self.name], {})
+
+        self.assertEqual(
+            Arguments.deserialize_args_and_kwargs(first.arguments["arguments"]),
+            ([self.name], {}),
+        )
+
+    def test_enqueue_replaces_corrupted_files(self):
+        first = Job.objects.enqueue(task_with_args, [self.name], {})
+        [path] = self.stored_files()
+        path.write_text("{}")
+
+        Job.objects.enqueue(task_with_args, [self.name], {})
+
+        self.assertEqual(
+            Arguments.deserialize_args_and_kwargs(first.arguments["arguments"]),
+            ([self.name], {}),
+        )
+
+    def test_archived_jobs_keep_their_files(self):
+        job = Job.objects.enqueue(task_with_args, [self.name], {})
+        job.ready_execution.delete()
+        job.failed_with("ValueError: order 1 not found")
+
+        with self.captureOnCommitCallbacks(using="queue", execute=True):
+            BulkOperation.matching().archive()
+
+        self.assertEqual(len(self.stored_files()), 1)
+        self.assertEqual(OffloadedArguments.objects.get().references, 1)
+
+        with self.captureOnCommitCallbacks(using="queue", execute=True):
+            ArchivedJob.objects.all().delete()
+
+        self.assertEqual(self.stored_files(), [])
+
+    def test_corrupted_file(self):
+        job = Job.objects.enqueue(task_with_args, [self.name], {})
+        [path] = self.stored_files()
+        path.write_text("{}")
+
+        with self.assertRaises(DeserializationError):
+            Arguments.deserialize_args_and_kwargs(job.arguments["arguments"])
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from unittest import skipUnless
+
+from django.db import connections
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from steady_queue.db_router import steady_queue_database_alias
+from steady_queue.models import Job, ReadyExecution
+from steady_queue.partitions import JobPartitions, next_period_start, period_start
+from tests.dummy.tasks import dummy_task
+
+
+class PeriodTestCase(SimpleTestCase):
+    moment = datetime(2026, 12, 17, 15, 30, tzinfo=dt_timezone.utc)
+
+    def test_period_start(self):
+        self.assertEqual(
+            period_start(self.moment, "day"),
+            datetime(2026, 12, 17, tzinfo=dt_timezone.utc),
+        )
+        self.assertEqual(
+            period_start(self.moment, "week"),
+            datetime(2026, 12, 14, tzinfo=dt_timezone.utc),
+        )
+        self.assertEqual(
+            period_start(self.moment, "month"),
+            datetime(2026, 12, 1, tzinfo=dt_timezone.utc),
+        )
+
+    def test_next_period_start(self):
+        self.assertEqual(
+            next_period_start(self.moment, "day"),
+            datetime(2026, 12, 18, tzinfo=dt_timezone.utc),
+        )
+        self.assertEqual(
+            next_period_start(self.moment, "week"),
+            datetime(2026, 12, 21, tzinfo=dt_timezone.utc),
+        )
+        self.assertEqual(
+            next_period_start(self.moment, "month"),
+            datetime(2027, 1, 1, tzinfo=dt_timezone.utc),
+        )
+
+    def test_invalid_period(self):
+        with self.assertRaises(ValueError):
+            JobPartitions(period="year")
+
+
+@skipUnless(
+    connections[steady_queue_database_alias()].vendor == "postgresql",
+    "requires PostgreSQL",
+)
+class JobPartitionsTestCase(TestCase):
+    def setUp(self):
+        self.partitions = JobPartitions(period="day", ahead=2)
+
+    def test_setup_keeps_existing_jobs_in_legacy_partition(self):
+        job = Job.objects.enqueue(dummy_task, [], {})
+
+        self.assertTrue(self.partitions.setup(concurrently=False))
+
+        self.assertTrue(self.partitions.is_partitioned)
+        self.assertFalse(self.partitions.setup(concurrently=False))
+        partitions = self.partitions.partitions()
+        self.assertEqual(partitions[0].name, "steady_queue_job_legacy")
+        self.assertIsNone(partitions[0].starts_at)
+        self.assertEqual(len(partitions), 3)
+        self.assertEqual(Job.objects.get().pk, job.pk)
+
+        new_job = Job.objects.enqueue(dummy_task, [], {})
+        self.assertGreater(new_job.pk, job.pk)
+        self.assertEqual(ReadyExecution.objects.count(), 2)
+
+    def test_maintain_creates_future_partitions(self):
+        self.partitions.setup(concurrently=False)
+        later = timezone.now() + timedelta(days=5)
+
+        created, _ = self.partitions.maintain(now=later)
+
+        self.assertTrue(created)
+        self.assertGreater(
+            self.partitions.partitions()[-1].ends_at, later + timedelta(days=2)
+        )
+
+    def test_maintain_drops_only_partitions_with_old_finished_jobs(self):
+        job = Job.objects.enqueue(dummy_task, [], {})
+        self.partitions.setup(concurrently=False)
+        later = timezone.now() + timedelta(days=10)
+
+        _, removed = self.partitions.maintain(now=later)
+        self.assertNotIn(
+            "steady_queue_job_legacy", [partition.name for partition in removed]
+        )
+
+        job.ready_execution.delete()
+        Job.objects.filter(pk=job.pk).update(finished_at=timezone.now())
+        _, removed = self.partitions.maintain(now=later)
+
+        self.assertIn(
+            "steady_queue_job_legacy", [partition.name for partition in removed]
+        )
+        self.assertFalse(Job.objects.exists())
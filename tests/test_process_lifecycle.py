@@ -1,5 +1,6 @@
+import signal
 from datetime import timedelta
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from django.test import TestCase
 from django.utils import timezone
@@ -203,6 +204,119 @@ class HeartbeatNilGuardTest(TestHelperMixin, TestCase):
         obj.heartbeat()
 
 
+class HeartbeatTest(TestHelperMixin, TestCase):
+    def test_heartbeat_is_a_single_update(self):
+        process = self.create_process(
+            last_heartbeat_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        with self.assertNumQueries(1, using=steady_queue.database):
+            process.heartbeat()
+
+        process.refresh_from_db()
+        self.assertGreater(
+            process.last_heartbeat_at, timezone.now() - timedelta(seconds=10)
+        )
+
+    def test_heartbeat_of_pruned_process_raises(self):
+        process = self.create_process()
+        Process.objects.filter(id=process.id).delete()
+
+        with self.assertRaises(Process.DoesNotExist):
+            process.heartbeat()
+
+    def test_supervisor_heartbeats_for_live_forks(self):
+        from steady_queue.configuration import Configuration
+        from steady_queue.processes.supervisor import Supervisor
+
+        long_ago = timezone.now() - timedelta(minutes=10)
+        supervisor_process = self.create_process(
+            name="supervisor", kind="supervisor", last_heartbeat_at=long_ago
+        )
+        live = self.create_process(
+            name="live",
+            supervisor=supervisor_process,
+            pid=1001,
+            last_heartbeat_at=long_ago,
+        )
+        gone = self.create_process(
+            name="gone",
+            supervisor=supervisor_process,
+            pid=1002,
+            last_heartbeat_at=long_ago,
+        )
+
+        supervisor = Supervisor(
+            Configuration(
+                Configuration.Options(
+                    workers=[Configuration.Worker()],
+                    dispatchers=[],
+                    recurring_tasks=[],
+                    skip_recurring=True,
+                )
+            )
+        )
+        supervisor.process = supervisor_process
+        supervisor.forks = {1001: MagicMock()}
+
+        with patch.object(steady_queue, "supervisor_heartbeats", True):
+            supervisor.heartbeat()
+
+        for process in (supervisor_process, live, gone):
+            process.refresh_from_db()
+
+        self.assertGreater(supervisor_process.last_heartbeat_at, long_ago)
+        self.assertGreater(live.last_heartbeat_at, long_ago)
+        self.assertEqual(gone.last_heartbeat_at, long_ago)
+
+    def test_supervisor_stops_forks_whose_registration_was_pruned(self):
+        from steady_queue.configuration import Configuration
+        from steady_queue.processes.supervisor import Supervisor
+
+        supervisor_process = self.create_process(name="supervisor", kind="supervisor")
+        pruned = self.create_process(
+            name="pruned", supervisor=supervisor_process, pid=1001
+        )
+
+        supervisor = Supervisor(
+            Configuration(
+                Configuration.Options(
+                    workers=[Configuration.Worker()],
+                    dispatchers=[],
+                    recurring_tasks=[],
+                    skip_recurring=True,
+                )
+            )
+        )
+        supervisor.process = supervisor_process
+        # 1002 was just forked and hasn't registered yet
+        supervisor.forks = {1001: MagicMock(), 1002: MagicMock()}
+
+        with (
+            patch.object(steady_queue, "supervisor_heartbeats", True),
+            patch.object(supervisor, "signal_processes") as signal_processes,
+        ):
+            supervisor.heartbeat()
+            signal_processes.assert_not_called()
+
+            Process.objects.filter(pk=pruned.pk).delete()
+            supervisor.heartbeat()
+
+        signal_processes.assert_called_once_with({1001}, signal.SIGTERM)
+
+    def test_supervised_processes_delegate_heartbeats(self):
+        from steady_queue.configuration import Configuration
+        from steady_queue.processes.dispatcher import Dispatcher
+
+        dispatcher = Dispatcher(Configuration.Dispatcher())
+        dispatcher.supervisor = self.create_process(kind="supervisor")
+
+        with patch.object(steady_queue, "supervisor_heartbeats", True):
+            dispatcher.launch_heartbeat()
+
+        self.assertFalse(hasattr(dispatcher, "heartbeat_task"))
+
+
 class ClaimExecutionsNilProcessGuardTest(TestHelperMixin, TestCase):
     """
     Regression: when self.process was None, claim_executions passed
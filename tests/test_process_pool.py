@@ -0,0 +1,84 @@
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from steady_queue.processes.errors import ExecutionTimeoutError, ProcessExitError
+from steady_queue.processes.pool import interrupt_thread
+from steady_queue.processes.process_pool import ProcessPool
+from tests.dummy.tasks import (
+    cpu_bound_task,
+    crashing_task,
+    failing_task,
+    timing_out_task,
+)
+
+
+class ProcessPoolTestCase(SimpleTestCase):
+    def setUp(self):
+        self.pool = ProcessPool(
+            [cpu_bound_task.module_path, crashing_task.module_path], size=1
+        )
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def arguments(self, task, args=None, kwargs=None):
+        return task.serialize(args or [], kwargs or {})["arguments"]
+
+    def test_runs_only_selected_tasks(self):
+        self.assertTrue(self.pool.runs(cpu_bound_task.module_path))
+        self.assertFalse(self.pool.runs(failing_task.module_path))
+
+    def test_runs_task_in_child_process(self):
+        self.pool.run(cpu_bound_task, self.arguments(cpu_bound_task, [10]))
+
+        self.assertTrue(self.pool.slots[0].is_alive)
+
+    def test_task_errors_are_raised_in_parent(self):
+        with self.assertRaisesMessage(Exception, "this is a task that always fails"):
+            self.pool.run(failing_task, self.arguments(failing_task))
+
+    def test_crashing_child_only_fails_its_task(self):
+        with self.assertRaises(ProcessExitError) as context:
+            self.pool.run(crashing_task, self.arguments(crashing_task))
+
+        self.assertEqual(context.exception.exitcode, 1)
+
+        # The slot is restarted for the next task
+        self.pool.run(cpu_bound_task, self.arguments(cpu_bound_task, [10]))
+
+    def test_children_are_recycled_after_max_tasks(self):
+        pool = ProcessPool([cpu_bound_task.module_path], size=1, max_tasks_per_child=1)
+        try:
+            pool.run(cpu_bound_task, self.arguments(cpu_bound_task, [10]))
+            self.assertFalse(pool.slots[0].is_alive)
+
+            pool.run(cpu_bound_task, self.arguments(cpu_bound_task, [10]))
+        finally:
+            pool.shutdown()
+
+    def test_timed_out_slots_are_not_reused(self):
+        errors = []
+
+        def run():
+            try:
+                self.pool.run(timing_out_task, self.arguments(timing_out_task))
+            except ExecutionTimeoutError as e:
+                errors.append(e)
+
+        self.pool.start()
+        timed_out = self.pool.slots[0].process
+        thread = threading.Thread(target=run)
+        thread.start()
+        time.sleep(0.5)
+        interrupt_thread(thread.ident)
+        thread.join(timeout=5)
+
+        self.assertEqual(len(errors), 1)
+        self.assertFalse(timed_out.is_alive())
+        self.assertIsNot(self.pool.slots[0].process, timed_out)
+
+        # The next task gets its own reply, not the timed out task's.
+        with self.assertRaisesMessage(Exception, "this is a task that always fails"):
+            self.pool.run(failing_task, self.arguments(failing_task))
@@ -0,0 +1,120 @@
+from datetime import timedelta
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from steady_queue.models import (
+    ClaimedExecution,
+    FailedExecution,
+    Job,
+    Process,
+    ReadyExecution,
+    ScheduledExecution,
+)
+from steady_queue.retries import RetryPolicy, retry_on
+from tests.dummy.tasks import dummy_task, flaky_task
+
+
+class RetryPolicyTestCase(SimpleTestCase):
+    def test_retries_until_attempts_are_exhausted(self):
+        policy = RetryPolicy(attempts=3)
+
+        self.assertTrue(policy.retries(ValueError(), attempts=1))
+        self.assertTrue(policy.retries(ValueError(), attempts=2))
+        self.assertFalse(policy.retries(ValueError(), attempts=3))
+
+    def test_only_retries_matching_errors(self):
+        policy = RetryPolicy(retry_on=(ValueError,))
+
+        self.assertTrue(policy.retries(ValueError(), attempts=1))
+        self.assertFalse(policy.retries(KeyError(), attempts=1))
+
+    def test_exponential_backoff(self):
+        policy = RetryPolicy(wait=timedelta(seconds=2), backoff=3, jitter=0)
+
+        self.assertEqual(policy.wait_before(1), timedelta(seconds=2))
+        self.assertEqual(policy.wait_before(2), timedelta(seconds=6))
+        self.assertEqual(policy.wait_before(3), timedelta(seconds=18))
+
+    def test_wait_is_capped(self):
+        policy = RetryPolicy(
+            wait=timedelta(seconds=10), max_wait=timedelta(seconds=15), jitter=0
+        )
+
+        self.assertEqual(policy.wait_before(4), timedelta(seconds=15))
+
+    def test_jitter_extends_wait(self):
+        policy = RetryPolicy(wait=timedelta(seconds=10), jitter=0.5)
+
+        for _ in range(20):
+            wait = policy.wait_before(1)
+            self.assertGreaterEqual(wait, timedelta(seconds=10))
+            self.assertLessEqual(wait, timedelta(seconds=15))
+
+    def test_decorator_sets_policy(self):
+        task = retry_on(attempts=3)(dummy_task)
+
+        self.assertEqual(task.retry_policy.attempts, 3)
+        self.assertEqual(task.retry_policy.retry_on, (Exception,))
+
+
+class AutomaticRetryTestCase(TestCase):
+    def setUp(self):
+        self.process = Process.objects.create(
+            name="worker",
+            kind="worker",
+            pid=12345,
+            hostname="test-host",
+            last_heartbeat_at=timezone.now(),
+        )
+
+    def perform(self, job: Job):
+        ReadyExecution.objects.claim(
+            queue_list=["*"], limit=1, process_id=self.process.id
+        )
+        ClaimedExecution.objects.get(job=job).perform()
+        job.refresh_from_db()
+
+    def test_failed_attempt_is_rescheduled(self):
+        job = Job.objects.enqueue(flaky_task, [], {})
+
+        self.perform(job)
+
+        self.assertEqual(job.attempts, 1)
+        self.assertFalse(ClaimedExecution.objects.filter(job=job).exists())
+        self.assertFalse(FailedExecution.objects.filter(job=job).exists())
+        scheduled = ScheduledExecution.objects.get(job=job)
+        self.assertAlmostEqual(
+            scheduled.scheduled_at,
+            timezone.now() + timedelta(minutes=1),
+            delta=timedelta(seconds=5),
+        )
+
+    def test_job_fails_once_attempts_are_exhausted(self):
+        job = Job.objects.enqueue(flaky_task, [], {})
+        self.perform(job)
+
+        ScheduledExecution.objects.filter(job=job).delete()
+        job.dispatch()
+        self.perform(job)
+
+        self.assertEqual(job.attempts, 2)
+        self.assertTrue(FailedExecution.objects.filter(job=job).exists())
+
+    def test_other_errors_fail_right_away(self):
+        job = Job.objects.enqueue(flaky_task, ["KeyError"], {})
+
+        self.perform(job)
+
+        self.assertEqual(job.attempts, 1)
+        self.assertTrue(FailedExecution.objects.filter(job=job).exists())
+        self.assertFalse(ScheduledExecution.objects.filter(job=job).exists())
+
+    def test_manual_retry_resets_attempts(self):
+        job = Job.objects.enqueue(flaky_task, ["KeyError"], {})
+        self.perform(job)
+
+        FailedExecution.objects.get(job=job).retry()
+
+        job.refresh_from_db()
+        self.assertEqual(job.attempts, 0)
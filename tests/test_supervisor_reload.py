@@ -0,0 +1,108 @@
+import signal
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from steady_queue.configuration import Configuration
+from steady_queue.processes.supervisor import Supervisor
+from steady_queue.processes.worker import Worker
+
+
+def build_options(*workers, dispatchers=None) -> Configuration.Options:
+    return Configuration.Options(
+        workers=list(workers),
+        dispatchers=dispatchers or [],
+        recurring_tasks=[],
+        skip_recurring=True,
+    )
+
+
+class SupervisorReloadTestCase(SimpleTestCase):
+    def setUp(self):
+        self.supervisor = Supervisor(
+            Configuration(
+                build_options(
+                    Configuration.Worker(queues=["default"]),
+                    Configuration.Worker(queues=["mailers"]),
+                    dispatchers=[Configuration.Dispatcher()],
+                )
+            )
+        )
+        self.supervisor.start_process = MagicMock()
+        self.supervisor.signal_process = MagicMock()
+
+        for pid, process in enumerate(
+            self.supervisor.configuration.configured_processes, start=101
+        ):
+            self.supervisor.forks[pid] = MagicMock()
+            self.supervisor.configured_processes[pid] = process
+
+    def reload(self, options: Configuration.Options):
+        with patch.object(self.supervisor, "reload_options", return_value=options):
+            self.supervisor.reload()
+
+    def test_unchanged_processes_are_kept(self):
+        self.reload(
+            build_options(
+                Configuration.Worker(queues=["default"]),
+                Configuration.Worker(queues=["mailers", "reports"]),
+                dispatchers=[Configuration.Dispatcher()],
+            )
+        )
+
+        self.supervisor.start_process.assert_called_once_with(
+            Configuration.Process(
+                kind="worker",
+                attributes=Configuration.Worker(queues=["mailers", "reports"]),
+            )
+        )
+        self.assertEqual(self.supervisor.retiring_forks, [102])
+
+    def test_changed_processes_are_retired_one_at_a_time(self):
+        self.reload(
+            build_options(
+                Configuration.Worker(queues=["default"], threads=5),
+                Configuration.Worker(queues=["mailers"], threads=5),
+                dispatchers=[Configuration.Dispatcher()],
+            )
+        )
+        self.assertEqual(self.supervisor.start_process.call_count, 2)
+        self.assertEqual(self.supervisor.retiring_forks, [101, 102])
+
+        self.supervisor.retire_next_fork()
+        self.supervisor.retire_next_fork()
+        self.supervisor.signal_process.assert_called_once_with(101, Worker.DRAIN_SIGNAL)
+
+        # Once drained, the fork isn't replaced and the next one is retired
+        self.supervisor.replace_fork(101, 0)
+        self.supervisor.retire_next_fork()
+
+        self.assertEqual(self.supervisor.start_process.call_count, 2)
+        self.supervisor.signal_process.assert_called_with(102, Worker.DRAIN_SIGNAL)
+
+    def test_non_workers_are_stopped_when_retired(self):
+        self.reload(
+            build_options(
+                Configuration.Worker(queues=["default"]),
+                Configuration.Worker(queues=["mailers"]),
+                dispatchers=[Configuration.Dispatcher(batch_size=100)],
+            )
+        )
+
+        self.supervisor.retire_next_fork()
+
+        self.supervisor.signal_process.assert_called_once_with(103, signal.SIGTERM)
+
+    def test_invalid_configuration_is_ignored(self):
+        with self.assertLogs("steady_queue", level="ERROR"):
+            self.reload(build_options())
+
+        self.supervisor.start_process.assert_not_called()
+        self.assertEqual(self.supervisor.retiring_forks, [])
+
+    def test_sighup_reloads_configuration(self):
+        self.supervisor.reload = MagicMock()
+
+        self.supervisor.handle_signal(signal.SIGHUP)
+
+        self.supervisor.reload.assert_called_once()
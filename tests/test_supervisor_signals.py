@@ -0,0 +1,72 @@
+import os
+import select
+import signal
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from steady_queue.configuration import Configuration
+from steady_queue.processes.supervisor import Supervisor
+
+
+class SupervisorChildReapingTestCase(SimpleTestCase):
+    def setUp(self):
+        options = Configuration.Options(
+            workers=[Configuration.Worker()],
+            dispatchers=[],
+            recurring_tasks=[],
+            skip_recurring=True,
+        )
+        self.supervisor = Supervisor(Configuration(options))
+
+        for sig in (*Supervisor.SIGNALS, signal.SIGCHLD):
+            self.addCleanup(signal.signal, sig, signal.getsignal(sig))
+        self.supervisor.register_signal_handlers()
+
+    def fork(self, sleep: float = 0) -> int:
+        if (pid := os.fork()) == 0:
+            # The child inherits the supervisor's handlers, which would raise
+            # out of the sleep and on into the rest of the test run.
+            try:
+                for sig in (*Supervisor.SIGNALS, signal.SIGCHLD):
+                    signal.signal(sig, signal.SIG_DFL)
+                time.sleep(sleep)
+            finally:
+                os._exit(0)
+
+        self.supervisor.forks[pid] = MagicMock()
+        return pid
+
+    def test_child_exit_wakes_up_supervisor(self):
+        self.fork()
+
+        ready, _, _ = select.select([self.supervisor.self_pipe[0]], [], [], 5)
+
+        self.assertEqual(ready, [self.supervisor.self_pipe[0]])
+        self.supervisor.reap_terminated_forks()
+        self.assertTrue(self.supervisor.are_all_forks_terminated)
+
+    def test_graceful_termination_ends_when_last_fork_exits(self):
+        self.fork(sleep=10)
+        self.fork(sleep=10)
+        self.supervisor.terminate_immediately = MagicMock()
+
+        started_at = time.monotonic()
+        with patch("steady_queue.shutdown_timeout", timedelta(seconds=30)):
+            self.supervisor.terminate_gracefully()
+
+        self.assertLess(time.monotonic() - started_at, 5)
+        self.assertTrue(self.supervisor.are_all_forks_terminated)
+        self.supervisor.terminate_immediately.assert_not_called()
+
+    def test_sleeps_until_next_autoscale(self):
+        self.assertEqual(self.supervisor.next_wake_up, Supervisor.IDLE_TIMEOUT)
+
+        self.supervisor.autoscalers = [MagicMock()]
+        self.supervisor.last_autoscaled_at = time.monotonic()
+
+        self.assertLessEqual(
+            self.supervisor.next_wake_up, Supervisor.AUTOSCALE_INTERVAL
+        )
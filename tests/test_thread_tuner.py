@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from steady_queue.processes.pool import Pool
+from steady_queue.processes.thread_tuner import ThreadTuner
+
+
+class ThreadTunerTestCase(SimpleTestCase):
+    def setUp(self):
+        self.pool = Pool(4, on_idle=None, max_size=8)
+        self.addCleanup(self.pool.shutdown)
+        self.tuner = ThreadTuner(self.pool, min_threads=2, max_threads=8)
+
+    def desired(self, current, **kwargs):
+        return self.tuner.desired_threads(
+            current,
+            **{
+                "is_saturated": False,
+                "cpu_usage": 0.1,
+                "is_database_saturated": False,
+                **kwargs,
+            },
+        )
+
+    def test_grows_when_saturated_and_waiting_on_io(self):
+        self.assertEqual(self.desired(4, is_saturated=True), 5)
+        self.assertEqual(self.desired(8, is_saturated=True), 8)
+
+    def test_keeps_size_when_not_saturated(self):
+        self.assertEqual(self.desired(4), 4)
+
+    def test_shrinks_when_cpu_bound(self):
+        self.assertEqual(self.desired(4, is_saturated=True, cpu_usage=0.95), 3)
+        self.assertEqual(self.desired(2, cpu_usage=0.95), 2)
+
+    def test_shrinks_when_database_pool_is_saturated(self):
+        self.assertEqual(
+            self.desired(4, is_saturated=True, is_database_saturated=True), 3
+        )
+
+    def test_tune_resizes_pool(self):
+        for _ in range(4):
+            self.pool.available_threads.decrement()
+
+        with (
+            patch(
+                "steady_queue.processes.thread_tuner.is_database_pool_saturated",
+                return_value=False,
+            ),
+            patch(
+                "steady_queue.processes.thread_tuner.process_cpu_time",
+                return_value=self.tuner.last_cpu_time,
+            ),
+        ):
+            self.tuner.tune()
+
+        self.assertEqual(self.pool.size, 5)
+        self.assertEqual(self.pool.idle_threads, 1)
+
+
+class PoolResizeTestCase(SimpleTestCase):
+    def test_resize_adjusts_idle_threads(self):
+        pool = Pool(3, on_idle=None, max_size=6)
+        self.addCleanup(pool.shutdown)
+        pool.available_threads.decrement()
+
+        pool.resize(5)
+        self.assertEqual(pool.idle_threads, 4)
+        self.assertEqual(pool.busy_threads, 1)
+
+        pool.resize(1)
+        self.assertEqual(pool.idle_threads, 0)
+        self.assertFalse(pool.is_idle)
@@ -0,0 +1,105 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.test import SimpleTestCase
+
+from steady_queue.processes.timer import TimerTask, TimerWheel
+
+
+class TimerTaskTestCase(SimpleTestCase):
+    def wait_for(self, event: threading.Event):
+        self.assertTrue(event.wait(timeout=5))
+
+    def test_runs_periodically_until_stopped(self):
+        runs = []
+        done = threading.Event()
+
+        def record():
+            runs.append(time.monotonic())
+            if len(runs) == 3:
+                done.set()
+
+        task = TimerTask(interval=timedelta(seconds=0.05), callable=record)
+        task.start()
+        self.wait_for(done)
+        task.stop()
+
+        runs_when_stopped = len(runs)
+        time.sleep(0.2)
+        self.assertLessEqual(len(runs), runs_when_stopped + 1)
+
+    def test_run_now(self):
+        ran = threading.Event()
+        task = TimerTask(interval=timedelta(hours=1), callable=ran.set, run_now=True)
+
+        task.start()
+        self.wait_for(ran)
+        task.stop()
+
+    def test_crashing_callable_keeps_running(self):
+        runs = []
+        done = threading.Event()
+
+        def crash():
+            runs.append(True)
+            if len(runs) == 2:
+                done.set()
+            raise RuntimeError("boom")
+
+        task = TimerTask(interval=timedelta(seconds=0.05), callable=crash)
+        with self.assertLogs("steady_queue", level="ERROR"):
+            task.start()
+            self.wait_for(done)
+        task.stop()
+
+    def test_tasks_share_the_process_wheel(self):
+        done = threading.Event()
+        tasks = [
+            TimerTask(interval=timedelta(seconds=0.01), callable=lambda: None)
+            for _ in range(5)
+        ]
+        tasks.append(TimerTask(interval=timedelta(seconds=0.1), callable=done.set))
+        threads_before = threading.active_count()
+
+        for task in tasks:
+            task.start()
+        self.wait_for(done)
+        for task in tasks:
+            task.stop()
+
+        # At most a worker per task and the scheduler, not a thread per run
+        self.assertLessEqual(threading.active_count() - threads_before, len(tasks) + 1)
+        self.assertGreaterEqual(TimerWheel.instance().workers, len(tasks))
+
+    def test_slow_tasks_dont_delay_the_others(self):
+        release = threading.Event()
+        ran = threading.Event()
+        slow = [
+            TimerTask(
+                interval=timedelta(seconds=0.01),
+                callable=lambda: release.wait(5),
+                run_now=True,
+            )
+            for _ in range(5)
+        ]
+        fast = TimerTask(interval=timedelta(seconds=0.05), callable=ran.set)
+
+        try:
+            for task in slow:
+                task.start()
+            fast.start()
+
+            self.assertTrue(ran.wait(timeout=1))
+        finally:
+            for task in [*slow, fast]:
+                task.stop()
+            release.set()
+
+    def test_jitter_spreads_delay(self):
+        task = TimerTask(interval=timedelta(seconds=10), callable=None, jitter=0.1)
+
+        delays = [task.next_delay() for _ in range(100)]
+
+        self.assertTrue(all(9 <= delay <= 11 for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
@@ -0,0 +1,93 @@
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from steady_queue.configuration import Configuration
+from steady_queue.processes.supervisor import Supervisor
+from steady_queue.processes.worker import Worker
+
+
+class WorkerRecyclingTestCase(SimpleTestCase):
+    def build_worker(self, **options) -> Worker:
+        worker = Worker(Configuration.Worker(**options))
+        self.addCleanup(worker.pool.shutdown)
+        return worker
+
+    def test_worker_stops_after_max_jobs(self):
+        worker = self.build_worker(max_jobs=2)
+        worker.claimed_jobs_count = 2
+
+        worker.poll()
+
+        self.assertTrue(worker.is_stopped)
+        self.assertEqual(worker.recycle_reason, "exceeded max_jobs (2)")
+
+    def test_worker_drains_in_flight_jobs_before_stopping(self):
+        worker = self.build_worker(max_jobs=1)
+        worker.claimed_jobs_count = 1
+        worker.pool.available_threads.decrement()
+
+        worker.poll()
+        self.assertFalse(worker.is_stopped)
+
+        worker.pool.available_threads.increment()
+        worker.poll()
+        self.assertTrue(worker.is_stopped)
+
+    def test_worker_stops_after_max_age(self):
+        worker = self.build_worker(max_age=timedelta(hours=1))
+        worker.started_at = time.monotonic() - 3601
+
+        worker.poll()
+
+        self.assertTrue(worker.is_stopped)
+
+    def test_worker_stops_after_max_rss(self):
+        worker = self.build_worker(max_rss_mb=512)
+
+        with patch("steady_queue.processes.worker.rss_mb", return_value=600):
+            worker.poll()
+
+        self.assertTrue(worker.is_stopped)
+
+    def test_claims_are_limited_by_remaining_jobs(self):
+        worker = self.build_worker(threads=3, max_jobs=5)
+        worker.claimed_jobs_count = 4
+
+        with patch(
+            "steady_queue.processes.worker.ReadyExecution.objects.claim",
+            return_value=[],
+        ) as claim:
+            worker.claim_executions()
+
+        claim.assert_called_once_with(worker.queues, 1, worker.process_id)
+
+
+class SupervisorReplaceRecycledForkTestCase(SimpleTestCase):
+    def setUp(self):
+        options = Configuration.Options(
+            workers=[Configuration.Worker()],
+            dispatchers=[],
+            recurring_tasks=[],
+            skip_recurring=True,
+        )
+        self.supervisor = Supervisor(Configuration(options))
+        self.supervisor.forks[123] = MagicMock()
+        self.supervisor.configured_processes[123] = MagicMock()
+        self.supervisor.handle_claimed_jobs_by = MagicMock()
+        self.supervisor.start_process = MagicMock()
+
+    def test_clean_exit_does_not_fail_claimed_executions(self):
+        self.supervisor.replace_fork(123, 0)
+
+        self.supervisor.handle_claimed_jobs_by.assert_not_called()
+        self.supervisor.start_process.assert_called_once()
+
+    def test_crash_fails_claimed_executions(self):
+        # Wait status for a process that exited with code 1
+        self.supervisor.replace_fork(123, 1 << 8)
+
+        self.supervisor.handle_claimed_jobs_by.assert_called_once()
+        self.supervisor.start_process.assert_called_once()